@@ -20,8 +20,12 @@ The BaseApiClient is intended to be a private module and is subject to change.
 """
 
 import asyncio
+from collections.abc import AsyncGenerator
 from collections.abc import Generator
+import concurrent.futures
+import contextlib
 import copy
+import dataclasses
 from dataclasses import dataclass
 import inspect
 import io
@@ -34,7 +38,8 @@ import ssl
 import sys
 import threading
 import time
-from typing import Any, AsyncIterator, Iterator, Optional, Tuple, TYPE_CHECKING, Union
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Tuple, TYPE_CHECKING, Union
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
 
@@ -50,8 +55,11 @@ from pydantic import ValidationError
 import tenacity
 
 from . import _common
+from . import _rate_limit
+from . import _response_cache
 from . import errors
 from . import version
+from .types import HttpConnectionOptions
 from .types import HttpOptions
 from .types import HttpOptionsOrDict
 from .types import HttpResponse as SdkHttpResponse
@@ -72,6 +80,14 @@ try:
 except ImportError:
   pass
 
+has_orjson = False
+try:
+  import orjson
+
+  has_orjson = True
+except ImportError:
+  pass
+
 
 if TYPE_CHECKING:
   from multidict import CIMultiDictProxy
@@ -159,6 +175,43 @@ def patch_http_options(
   return copy_option
 
 
+# Maximum number of patched per-request options memoized per client.
+_MAX_PATCHED_HTTP_OPTIONS = 64
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _options_key(value: Any) -> Any:
+  """Returns a hashable key for an options value, compared by value.
+
+  Raises:
+    TypeError: The value contains an object that cannot be hashed.
+  """
+  # The types are part of the key, so that for example `True` and `1`, which
+  # are equal, do not share a key.
+  value_type = type(value)
+  if value_type in _SCALAR_TYPES:
+    return (value_type, value)
+  if isinstance(value, dict):
+    return (
+        value_type,
+        tuple((key, _options_key(item)) for key, item in value.items()),
+    )
+  if isinstance(value, (list, tuple)):
+    return (value_type, tuple(_options_key(item) for item in value))
+  if isinstance(value, BaseModel):
+    # Most fields are unset.
+    return (
+        value_type,
+        tuple(
+            (key, _options_key(item))
+            for key, item in value.__dict__.items()
+            if item is not None
+        ),
+    )
+  hash(value)
+  return (value_type, value)
+
+
 def populate_server_timeout_header(
     headers: dict[str, str], timeout_in_seconds: Optional[Union[float, int]]
 ) -> None:
@@ -213,6 +266,17 @@ def get_timeout_in_seconds(
   return timeout_in_seconds
 
 
+def _serialize_request_data(data: Any) -> Union[str, bytes]:
+  """Serializes the request body to JSON, with orjson if it is installed."""
+  if has_orjson:
+    try:
+      return orjson.dumps(data)
+    except TypeError:
+      # For example integers that do not fit in 64 bits.
+      pass
+  return json.dumps(data)
+
+
 @dataclass
 class HttpRequest:
   headers: dict[str, str]
@@ -222,6 +286,95 @@ class HttpRequest:
   timeout: Optional[float] = None
 
 
+class _ResponseStreamFramer:
+  """Incrementally splits a streamed response body into JSON payloads.
+
+  The API streams server-sent events, one JSON object per `data:` record.
+  Consecutive `data:` lines belong to the same record and are joined with a
+  newline; the record is complete at the next blank line. Other SSE fields
+  (`event:`, `id:`, `retry:`) and comments are ignored.
+
+  When the API returns an error message, it is not framed as an event and
+  comes as plain JSON spread over several lines. Those lines are buffered
+  until the curly braces are balanced.
+
+  The framer works on raw bytes so that the HTTP transport chunks can be fed
+  as they arrive, regardless of where the chunk boundaries fall.
+  """
+
+  _IGNORED_FIELDS = (b'event:', b'id:', b'retry:', b':')
+
+  def __init__(self) -> None:
+    self._buffer = bytearray()
+    # Position in the buffer from which to search for the next line break.
+    self._scan_from = 0
+    self._data_lines: list[bytes] = []
+    self._json_chunk = bytearray()
+    self._balance = 0
+
+  def feed(self, data: bytes) -> list[str]:
+    """Adds bytes to the buffer and returns the completed payloads."""
+    frames: list[str] = []
+    buffer = self._buffer
+    buffer += data
+    start = 0
+    end = buffer.find(b'\n', self._scan_from)
+    while end >= 0:
+      self._process_line(bytes(buffer[start:end]), frames)
+      start = end + 1
+      end = buffer.find(b'\n', start)
+    if start:
+      del buffer[:start]
+    self._scan_from = len(buffer)
+    return frames
+
+  def flush(self) -> list[str]:
+    """Returns the payloads left over once the stream is exhausted."""
+    frames: list[str] = []
+    if self._buffer:
+      self._process_line(bytes(self._buffer), frames)
+      self._buffer.clear()
+      self._scan_from = 0
+    self._dispatch_event(frames)
+    if self._json_chunk:
+      frames.append(self._json_chunk.decode('utf-8'))
+      self._json_chunk.clear()
+      self._balance = 0
+    return frames
+
+  def _process_line(self, line: bytes, frames: list[str]) -> None:
+    if line.endswith(b'\r'):
+      line = line[:-1]
+    if not self._json_chunk:
+      if not line:
+        # A blank line terminates the current event.
+        self._dispatch_event(frames)
+        return
+      if line.startswith(b'data:'):
+        value = line[5:]
+        if value.startswith(b' '):
+          value = value[1:]
+        self._data_lines.append(value)
+        return
+      if line.startswith(self._IGNORED_FIELDS):
+        return
+      self._dispatch_event(frames)
+      if not line.strip():
+        return
+
+    self._json_chunk += line
+    self._balance += line.count(b'{') - line.count(b'}')
+    if self._balance <= 0:
+      frames.append(self._json_chunk.decode('utf-8'))
+      self._json_chunk.clear()
+      self._balance = 0
+
+  def _dispatch_event(self, frames: list[str]) -> None:
+    if self._data_lines:
+      frames.append(b'\n'.join(self._data_lines).decode('utf-8'))
+      self._data_lines.clear()
+
+
 class HttpResponse:
 
   def __init__(
@@ -314,35 +467,11 @@ class HttpResponse:
           f'but got {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    for line in self.response_stream.iter_lines():
-      if not line:
-        continue
-
-      # In streaming mode, the response of JSON is prefixed with "data: " which
-      # we must strip before parsing.
-      if line.startswith('data: '):
-        yield line[len('data: '):]
-        continue
-
-      # When API returns an error message, it comes line by line. So we buffer
-      # the lines until a complete JSON string is read. A complete JSON string
-      # is found when the balance is 0.
-      for c in line:
-        if c == '{':
-          balance += 1
-        elif c == '}':
-          balance -= 1
-
-      chunk += line
-      if balance == 0:
-        yield chunk
-        chunk = ''
-
+    framer = _ResponseStreamFramer()
+    for data in self.response_stream.iter_bytes():
+      yield from framer.feed(data)
     # If there is any remaining chunk, yield it.
-    if chunk:
-      yield chunk
+    yield from framer.flush()
     # Ensure the underlying httpx stream is closed to return the connection to the pool
     if isinstance(self.response_stream, httpx.Response):
       try:
@@ -362,69 +491,23 @@ class HttpResponse:
           f' {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    # httpx.Response has a dedicated async line iterator.
+    framer = _ResponseStreamFramer()
+    # httpx.Response has a dedicated async byte iterator.
     if isinstance(self.response_stream, httpx.Response):
-      async for line in self.response_stream.aiter_lines():
-        if not line:
-          continue
-        # In streaming mode, the response of JSON is prefixed with "data: "
-        # which we must strip before parsing.
-        if line.startswith('data: '):
-          yield line[len('data: '):]
-          continue
-
-        # When API returns an error message, it comes line by line. So we buffer
-        # the lines until a complete JSON string is read. A complete JSON string
-        # is found when the balance is 0.
-        for c in line:
-          if c == '{':
-            balance += 1
-          elif c == '}':
-            balance -= 1
-
-        chunk += line
-        if balance == 0:
+      async for data in self.response_stream.aiter_bytes():
+        for chunk in framer.feed(data):
           yield chunk
-          chunk = ''
 
-    # aiohttp.ClientResponse uses a content stream that we read line by line.
+    # aiohttp.ClientResponse exposes the body through its content stream.
     elif has_aiohttp and isinstance(
         self.response_stream, aiohttp.ClientResponse
     ):
-      while True:
-        # Read a line from the stream. This returns bytes.
-        line_bytes = await self.response_stream.content.readline()
-        if not line_bytes:
-          break
-        # Decode the bytes and remove trailing whitespace and newlines.
-        line = line_bytes.decode('utf-8').rstrip()
-        if not line:
-          continue
-
-        # In streaming mode, the response of JSON is prefixed with "data: "
-        # which we must strip before parsing.
-        if line.startswith('data: '):
-          yield line[len('data: '):]
-          continue
-
-        # When API returns an error message, it comes line by line. So we buffer
-        # the lines until a complete JSON string is read. A complete JSON string
-        # is found when the balance is 0.
-        for c in line:
-          if c == '{':
-            balance += 1
-          elif c == '}':
-            balance -= 1
-
-        chunk += line
-        if balance == 0:
+      async for data in self.response_stream.content.iter_any():
+        for chunk in framer.feed(data):
           yield chunk
-          chunk = ''
 
     # If there is any remaining chunk, yield it.
-    if chunk:
+    for chunk in framer.flush():
       yield chunk
 
     # Ensure the underlying HTTP response is properly released/closed.
@@ -469,6 +552,85 @@ _RETRY_HTTP_STATUS_CODES = (
 )
 
 
+def _server_retry_delay(
+    retry_state: tenacity.RetryCallState,
+) -> Optional[float]:
+  """Returns the delay the server asked for before retrying, if any."""
+  outcome = retry_state.outcome
+  if outcome is None or not outcome.failed:
+    return None
+  error = outcome.exception()
+  if isinstance(error, errors.APIError):
+    return _rate_limit.retry_delay(error)
+  return None
+
+
+class _WaitForServerDelay(tenacity.wait_exponential_jitter):
+  """Waits for the delay the server asked for, or backs off exponentially.
+
+  The server delay comes from the `Retry-After` header or the `RetryInfo`
+  error detail. The wait never goes beyond the maximum delay or the total
+  timeout.
+  """
+
+  def __init__(self, total_timeout: Optional[float], **kwargs: Any) -> None:
+    super().__init__(**kwargs)
+    self.total_timeout = total_timeout
+
+  def __call__(self, retry_state: tenacity.RetryCallState) -> float:
+    delay = _server_retry_delay(retry_state)
+    if delay is None:
+      delay = super().__call__(retry_state)
+    delay = min(delay, self.max)
+    if self.total_timeout is not None:
+      remaining = self.total_timeout - (retry_state.seconds_since_start or 0)
+      delay = min(delay, max(0.0, remaining))
+    return delay
+
+
+class _StopAfterAttemptOrTimeout(tenacity.stop_after_attempt):
+  """Stops after the given attempts, or when the total timeout is exhausted.
+
+  Also stops early when the server asks to wait beyond the total timeout.
+  """
+
+  def __init__(
+      self, max_attempt_number: int, total_timeout: Optional[float]
+  ) -> None:
+    super().__init__(max_attempt_number)
+    self.total_timeout = total_timeout
+
+  def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
+    if super().__call__(retry_state):
+      return True
+    if self.total_timeout is None:
+      return False
+    remaining = self.total_timeout - (retry_state.seconds_since_start or 0)
+    if remaining <= 0:
+      return True
+    delay = _server_retry_delay(retry_state)
+    return delay is not None and delay > remaining
+
+
+def _retry_deadline(options: Optional[HttpRetryOptions]) -> Optional[float]:
+  """Returns the monotonic time by which all the attempts must end, if any."""
+  if options is None or options.total_timeout is None:
+    return None
+  return time.monotonic() + options.total_timeout
+
+
+def _clamp_timeout(
+    http_request: HttpRequest, deadline: Optional[float]
+) -> HttpRequest:
+  """Returns the request with its timeout cut to the time left."""
+  if deadline is None:
+    return http_request
+  remaining = max(0.0, deadline - time.monotonic())
+  if http_request.timeout is not None and http_request.timeout <= remaining:
+    return http_request
+  return dataclasses.replace(http_request, timeout=remaining)
+
+
 def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
   """Returns the retry args for the given http retry options.
 
@@ -482,12 +644,15 @@ def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
   if options is None:
     return {'stop': tenacity.stop_after_attempt(1), 'reraise': True}
 
-  stop = tenacity.stop_after_attempt(options.attempts or _RETRY_ATTEMPTS)
+  stop = _StopAfterAttemptOrTimeout(
+      options.attempts or _RETRY_ATTEMPTS, options.total_timeout
+  )
   retriable_codes = options.http_status_codes or _RETRY_HTTP_STATUS_CODES
   retry = tenacity.retry_if_exception(
       lambda e: isinstance(e, errors.APIError) and e.code in retriable_codes,
   )
-  wait = tenacity.wait_exponential_jitter(
+  wait = _WaitForServerDelay(
+      total_timeout=options.total_timeout,
       initial=options.initial_delay or _RETRY_INITIAL_DELAY,
       max=options.max_delay or _RETRY_MAX_DELAY,
       exp_base=options.exp_base or _RETRY_EXP_BASE,
@@ -501,6 +666,317 @@ def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
   }
 
 
+# The httpx defaults, used for the limits that are not set in the connection
+# options.
+_HTTPX_MAX_CONNECTIONS = 100
+_HTTPX_MAX_KEEPALIVE_CONNECTIONS = 20
+_HTTPX_KEEPALIVE_EXPIRY = 5.0  # seconds
+# The aiohttp connector defaults.
+_AIOHTTP_MAX_CONNECTIONS = 100
+_AIOHTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+
+def connection_args(
+    options: Optional[HttpConnectionOptions],
+) -> _common.StringDict:
+  """Returns the httpx client args for the given connection options.
+
+  Args:
+    options: The connection options. Options that are not set keep the httpx
+      defaults.
+
+  Returns:
+    The arguments passed to the httpx.(Async)Client constructor.
+  """
+  if options is None:
+    return {}
+  args: _common.StringDict = {}
+  if (
+      options.max_connections is not None
+      or options.max_keepalive_connections is not None
+      or options.keepalive_expiry is not None
+  ):
+    args['limits'] = httpx.Limits(
+        max_connections=(
+            options.max_connections
+            if options.max_connections is not None
+            else _HTTPX_MAX_CONNECTIONS
+        ),
+        max_keepalive_connections=(
+            options.max_keepalive_connections
+            if options.max_keepalive_connections is not None
+            else _HTTPX_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry=(
+            options.keepalive_expiry
+            if options.keepalive_expiry is not None
+            else _HTTPX_KEEPALIVE_EXPIRY
+        ),
+    )
+  if options.http2:
+    args['http2'] = True
+  return args
+
+
+class _SharedTransport(httpx.BaseTransport):
+  """Transport shared by several clients, left open when a client closes."""
+
+  def __init__(self, transport: httpx.BaseTransport) -> None:
+    self._transport = transport
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    return self._transport.handle_request(request)
+
+  def close(self) -> None:
+    pass
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+  """Async transport shared by several clients, left open when a client closes.
+
+  Connections belong to the event loop that opened them, so each running loop
+  gets its own transport, created on its first request.
+  """
+
+  def __init__(self, transport_args: _common.StringDict) -> None:
+    self._transport_args = transport_args
+    self._transports: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+    ] = weakref.WeakKeyDictionary()
+    self._lock = threading.Lock()
+
+  def _loop_transport(self) -> httpx.AsyncHTTPTransport:
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      transport = self._transports.get(loop)
+      if transport is None:
+        transport = httpx.AsyncHTTPTransport(**self._transport_args)
+        self._transports[loop] = transport
+      return transport
+
+  async def handle_async_request(
+      self, request: httpx.Request
+  ) -> httpx.Response:
+    return await self._loop_transport().handle_async_request(request)
+
+  async def aclose(self) -> None:
+    pass
+
+
+# Transports shared across the clients in the process, keyed on the
+# connection settings.
+_shared_transports: dict[
+    tuple[Any, ...], Union[_SharedTransport, _AsyncSharedTransport]
+] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def _get_shared_transport(
+    user_args: Optional[_common.StringDict],
+    client_args: _common.StringDict,
+    is_async: bool,
+) -> Union[_SharedTransport, _AsyncSharedTransport]:
+  """Returns the process-wide transport for the given client args.
+
+  Args:
+    user_args: The client args set in the http options, used to tell apart
+      clients that configure SSL differently.
+    client_args: The args the httpx client is built with.
+    is_async: Whether the transport is for the async client.
+
+  Returns:
+    A transport that is shared with the other clients using the same settings.
+  """
+  user_args = user_args or {}
+  limits = client_args.get('limits')
+  key = (
+      is_async,
+      # SSL contexts compare by identity. The key keeps them alive, so that
+      # another context cannot take the place of a collected one.
+      user_args.get('verify'),
+      user_args.get('cert'),
+      client_args.get('trust_env', True),
+      client_args.get('http2', False),
+      None
+      if limits is None
+      else (
+          limits.max_connections,
+          limits.max_keepalive_connections,
+          limits.keepalive_expiry,
+      ),
+  )
+  with _shared_transports_lock:
+    transport = _shared_transports.get(key)
+    if transport is None:
+      transport_args = {
+          'verify': client_args.get('verify', True),
+          'cert': client_args.get('cert'),
+          'trust_env': client_args.get('trust_env', True),
+          'http2': client_args.get('http2', False),
+          'limits': limits or httpx.Limits(
+              max_connections=_HTTPX_MAX_CONNECTIONS,
+              max_keepalive_connections=_HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+          ),
+      }
+      if is_async:
+        transport = _AsyncSharedTransport(transport_args)
+      else:
+        transport = _SharedTransport(httpx.HTTPTransport(**transport_args))
+      _shared_transports[key] = transport
+    return transport
+
+
+# The resumable upload protocol requires all chunks but the last one to be a
+# multiple of this size.
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+
+
+class UploadSessionExpiredError(ValueError):
+  """The resumable upload session was rejected or can no longer be resumed."""
+
+
+def _raise_for_rejected_upload(response: HttpResponse) -> None:
+  """Raises if the server rejected the upload session for good."""
+  if 400 <= response.status_code < 500 and response.status_code not in (
+      408,
+      429,
+  ):
+    raise UploadSessionExpiredError(
+        f'The upload session was rejected with status {response.status_code}.'
+    )
+
+
+def _check_resumed_upload_status(upload_status: Optional[str]) -> None:
+  """Raises if a persisted upload session cannot be resumed."""
+  if upload_status != 'active':
+    raise UploadSessionExpiredError(
+        f'The upload session cannot be resumed, its status is {upload_status}.'
+    )
+
+
+def _get_upload_header(headers: dict[str, str], name: str) -> Optional[str]:
+  """Returns the value of a resumable upload response header, if present."""
+  name = name.lower()
+  for key, value in headers.items():
+    if key.lower() == name:
+      return value
+  return None
+
+
+def _validate_upload_chunk_size(chunk_size: Optional[int]) -> int:
+  """Returns the chunk size to use for a resumable upload."""
+  if chunk_size is None:
+    return CHUNK_SIZE
+  if chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_GRANULARITY:
+    raise ValueError(
+        'The upload chunk size must be a positive multiple of'
+        f' {UPLOAD_CHUNK_GRANULARITY} bytes, but got {chunk_size}.'
+    )
+  return chunk_size
+
+
+def _iter_file_chunks(
+    file: io.IOBase, chunk_size: int, read_ahead: bool
+) -> Generator[bytes, None, None]:
+  """Yields consecutive chunks of the file, forever.
+
+  With `read_ahead`, the next chunk is read in a background thread while the
+  caller sends the current one. Closing the generator waits for the pending
+  read, so the caller may seek the file afterwards.
+  """
+  if not read_ahead:
+    while True:
+      yield file.read(chunk_size)
+
+  with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+    pending = executor.submit(file.read, chunk_size)
+    while True:
+      file_chunk = pending.result()
+      pending = executor.submit(file.read, chunk_size)
+      yield file_chunk
+
+
+async def _aiter_file_chunks(
+    file: Union[io.IOBase, anyio.AsyncFile[Any]],
+    chunk_size: int,
+    read_ahead: bool,
+) -> AsyncGenerator[bytes, None]:
+  """Asynchronously yields consecutive chunks of the file, forever.
+
+  With `read_ahead`, the next chunk is read while the caller sends the current
+  one. Closing the generator waits for the pending read, so the caller may seek
+  the file afterwards.
+  """
+
+  async def read() -> bytes:
+    if isinstance(file, io.IOBase):
+      if read_ahead:
+        return await asyncio.to_thread(file.read, chunk_size)  # type: ignore[no-any-return]
+      return file.read(chunk_size)  # type: ignore[no-any-return]
+    return await file.read(chunk_size)  # type: ignore[no-any-return]
+
+  if not read_ahead:
+    while True:
+      yield await read()
+
+  pending = asyncio.ensure_future(read())
+  try:
+    while True:
+      file_chunk = await pending
+      pending = asyncio.ensure_future(read())
+      yield file_chunk
+  finally:
+    try:
+      await pending
+    except Exception:
+      pass
+
+
+# A file path, or a writable binary file object.
+DownloadDestination = Union[str, 'os.PathLike[str]', io.IOBase]
+
+
+def _download_offset(destination: DownloadDestination, resume: bool) -> int:
+  """Returns the number of bytes already downloaded to the destination."""
+  if (
+      resume
+      and isinstance(destination, (str, os.PathLike))
+      and os.path.isfile(destination)
+  ):
+    return os.path.getsize(destination)
+  return 0
+
+
+@contextlib.contextmanager
+def _open_download_sink(
+    destination: DownloadDestination, append: bool
+) -> Iterator[Callable[[bytes], Any]]:
+  """Yields a function writing the downloaded data to the destination."""
+  if isinstance(destination, (str, os.PathLike)):
+    with open(destination, 'ab' if append else 'wb') as f:
+      yield f.write
+  else:
+    yield destination.write
+
+
+@contextlib.asynccontextmanager
+async def _async_open_download_sink(
+    destination: DownloadDestination, append: bool
+) -> AsyncIterator[Callable[[bytes], Awaitable[Any]]]:
+  """Yields a function asynchronously writing the data to the destination."""
+  if isinstance(destination, (str, os.PathLike)):
+    async with await anyio.open_file(
+        destination, 'ab' if append else 'wb'
+    ) as f:
+      yield f.write
+  else:
+
+    async def write(data: bytes) -> Any:
+      return destination.write(data)  # type: ignore[union-attr]
+
+    yield write
+
+
 class SyncHttpxClient(httpx.Client):
   """Sync httpx client."""
 
@@ -695,6 +1171,29 @@ class BaseApiClient:
     client_args, async_client_args = self._ensure_httpx_ssl_ctx(
         self._http_options
     )
+    connection_options = self._http_options.connection_options
+    if connection_options is not None:
+      # Limits and HTTP/2 set in the client args take precedence.
+      client_args = {**connection_args(connection_options), **client_args}
+      async_client_args = {
+          **connection_args(connection_options),
+          **async_client_args,
+      }
+      if connection_options.share_transport:
+        client_args.setdefault(
+            'transport',
+            _get_shared_transport(
+                self._http_options.client_args, client_args, is_async=False
+            ),
+        )
+        async_client_args.setdefault(
+            'transport',
+            _get_shared_transport(
+                self._http_options.async_client_args,
+                async_client_args,
+                is_async=True,
+            ),
+        )
     self._httpx_client = SyncHttpxClient(**client_args)
     self._async_httpx_client = AsyncHttpxClient(**async_client_args)
     if self._use_aiohttp() and has_aiohttp:
@@ -703,13 +1202,20 @@ class BaseApiClient:
           self._http_options
       )
       # Configure connection pooling and keepalive more defensively.
+      max_connections = _AIOHTTP_MAX_CONNECTIONS
+      keepalive_expiry = _AIOHTTP_KEEPALIVE_EXPIRY
+      if connection_options is not None:
+        if connection_options.max_connections is not None:
+          max_connections = connection_options.max_connections
+        if connection_options.keepalive_expiry is not None:
+          keepalive_expiry = connection_options.keepalive_expiry
       connector = aiohttp.TCPConnector(
           use_dns_cache=True,
           ttl_dns_cache=60,
           enable_cleanup_closed=True,
-          limit=100,
-          limit_per_host=100,
-          keepalive_timeout=30,
+          limit=max_connections,
+          limit_per_host=max_connections,
+          keepalive_timeout=keepalive_expiry,
       )
       # Session-level default timeout (per-request can override below).
       session_timeout = None
@@ -728,6 +1234,20 @@ class BaseApiClient:
     retry_kwargs = retry_args(self._http_options.retry_options)
     self._retry = tenacity.Retrying(**retry_kwargs)
     self._async_retry = tenacity.AsyncRetrying(**retry_kwargs)
+    self._rate_limiter: Optional[_rate_limit.RateLimiter] = None
+    if self._http_options.rate_limit_options is not None:
+      self._rate_limiter = _rate_limit.RateLimiter(
+          self._http_options.rate_limit_options
+      )
+    self._response_cache: Optional[_response_cache.ResponseCache] = None
+    if self._http_options.cache_options is not None:
+      self._response_cache = _response_cache.create_response_cache(
+          self._http_options.cache_options
+      )
+    self._cache_identity = _response_cache.client_identity(
+        self.api_key, self.project, self.location
+    )
+    self._patched_http_options: dict[Any, HttpOptions] = {}
 
   @staticmethod
   def _ensure_httpx_ssl_ctx(
@@ -910,11 +1430,16 @@ class BaseApiClient:
 
   def _use_aiohttp(self) -> bool:
     # If the instantiator has passed a custom transport, they want httpx not
-    # aiohttp.
+    # aiohttp. HTTP/2 and shared transports are only supported by httpx.
+    connection_options = self._http_options.connection_options
     return (
         has_aiohttp
         and (self._http_options.async_client_args or {}).get('transport')
         is None
+        and not (
+            connection_options is not None
+            and (connection_options.http2 or connection_options.share_transport)
+        )
     )
 
   def _websocket_base_url(self) -> str:
@@ -981,15 +1506,7 @@ class BaseApiClient:
       del request_dict[key]
     # patch the http options with the user provided settings.
     if http_options:
-      if isinstance(http_options, HttpOptions):
-        patched_http_options = patch_http_options(
-            self._http_options,
-            http_options,
-        )
-      else:
-        patched_http_options = patch_http_options(
-            self._http_options, HttpOptions.model_validate(http_options)
-        )
+      patched_http_options = self._get_patched_http_options(http_options)
     else:
       patched_http_options = self._http_options
     # Skip adding project and locations when getting Vertex AI base models.
@@ -1043,17 +1560,49 @@ class BaseApiClient:
 
     if patched_http_options.headers is None:
       raise ValueError('Request headers must be set.')
-    populate_server_timeout_header(
-        patched_http_options.headers, timeout_in_seconds
-    )
+    headers = patched_http_options.headers
+    if http_options:
+      # The patched options are shared by the requests with the same options.
+      headers = dict(headers)
+    populate_server_timeout_header(headers, timeout_in_seconds)
     return HttpRequest(
         method=http_method,
         url=url,
-        headers=patched_http_options.headers,
+        headers=headers,
         data=request_dict,
         timeout=timeout_in_seconds,
     )
 
+  def _get_patched_http_options(
+      self, http_options: HttpOptionsOrDict
+  ) -> HttpOptions:
+    """Returns the client options patched with the per-request options.
+
+    The patched options are memoized, so that requests that carry the same
+    options, such as the same timeout, do not validate and patch them again.
+    Options that cannot be hashed are patched on every request.
+    """
+    try:
+      key = (
+          _options_key(self._http_options.headers),
+          _options_key(http_options),
+      )
+    except TypeError:
+      key = None
+    if key is not None:
+      patched_http_options = self._patched_http_options.get(key)
+      if patched_http_options is not None:
+        return patched_http_options
+
+    if not isinstance(http_options, HttpOptions):
+      http_options = HttpOptions.model_validate(http_options)
+    patched_http_options = patch_http_options(self._http_options, http_options)
+    if key is not None:
+      if len(self._patched_http_options) >= _MAX_PATCHED_HTTP_OPTIONS:
+        self._patched_http_options.clear()
+      self._patched_http_options[key] = patched_http_options
+    return patched_http_options
+
   def _request_once(
       self,
       http_request: HttpRequest,
@@ -1067,11 +1616,15 @@ class BaseApiClient:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
-      data = json.dumps(http_request.data) if http_request.data else None
+      data = (
+          _serialize_request_data(http_request.data)
+          if http_request.data
+          else None
+      )
     else:
       if http_request.data:
         if not isinstance(http_request.data, bytes):
-          data = json.dumps(http_request.data) if http_request.data else None
+          data = _serialize_request_data(http_request.data)
         else:
           data = http_request.data
 
@@ -1101,6 +1654,19 @@ class BaseApiClient:
           response.headers, response if stream else [response.text]
       )
 
+  def _rate_limited_request_once(
+      self,
+      http_request: HttpRequest,
+      stream: bool = False,
+      deadline: Optional[float] = None,
+  ) -> HttpResponse:
+    if self._rate_limiter is None:
+      return self._request_once(_clamp_timeout(http_request, deadline), stream)
+    # For streams, the request counts as in flight until the response headers
+    # are received.
+    with self._rate_limiter.limit(http_request.url):
+      return self._request_once(_clamp_timeout(http_request, deadline), stream)
+
   def _request(
       self,
       http_request: HttpRequest,
@@ -1117,9 +1683,19 @@ class BaseApiClient:
       if parameter_model.retry_options:
         retry_kwargs = retry_args(parameter_model.retry_options)
         retry = tenacity.Retrying(**retry_kwargs)
-        return retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+        return retry(  # type: ignore[no-any-return]
+            self._rate_limited_request_once,
+            http_request,
+            stream,
+            _retry_deadline(parameter_model.retry_options),
+        )
 
-    return self._retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+    return self._retry(  # type: ignore[no-any-return]
+        self._rate_limited_request_once,
+        http_request,
+        stream,
+        _retry_deadline(self._http_options.retry_options),
+    )
 
   async def _async_request_once(
       self, http_request: HttpRequest, stream: bool = False
@@ -1135,11 +1711,15 @@ class BaseApiClient:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
-      data = json.dumps(http_request.data) if http_request.data else None
+      data = (
+          _serialize_request_data(http_request.data)
+          if http_request.data
+          else None
+      )
     else:
       if http_request.data:
         if not isinstance(http_request.data, bytes):
-          data = json.dumps(http_request.data) if http_request.data else None
+          data = _serialize_request_data(http_request.data)
         else:
           data = http_request.data
 
@@ -1244,6 +1824,23 @@ class BaseApiClient:
         await errors.APIError.raise_for_async_response(client_response)
         return HttpResponse(client_response.headers, [client_response.text])
 
+  async def _async_rate_limited_request_once(
+      self,
+      http_request: HttpRequest,
+      stream: bool = False,
+      deadline: Optional[float] = None,
+  ) -> HttpResponse:
+    if self._rate_limiter is None:
+      return await self._async_request_once(
+          _clamp_timeout(http_request, deadline), stream
+      )
+    # For streams, the request counts as in flight until the response headers
+    # are received.
+    async with self._rate_limiter.async_limit(http_request.url):
+      return await self._async_request_once(
+          _clamp_timeout(http_request, deadline), stream
+      )
+
   async def _async_request(
       self,
       http_request: HttpRequest,
@@ -1260,9 +1857,17 @@ class BaseApiClient:
       if parameter_model.retry_options:
         retry_kwargs = retry_args(parameter_model.retry_options)
         retry = tenacity.AsyncRetrying(**retry_kwargs)
-        return await retry(self._async_request_once, http_request, stream)  # type: ignore[no-any-return]
+        return await retry(  # type: ignore[no-any-return]
+            self._async_rate_limited_request_once,
+            http_request,
+            stream,
+            _retry_deadline(parameter_model.retry_options),
+        )
     return await self._async_retry(  # type: ignore[no-any-return]
-        self._async_request_once, http_request, stream
+        self._async_rate_limited_request_once,
+        http_request,
+        stream,
+        _retry_deadline(self._http_options.retry_options),
     )
 
   def get_read_only_http_options(self) -> _common.StringDict:
@@ -1272,6 +1877,60 @@ class BaseApiClient:
       copied = self._http_options
     return copied
 
+  def _get_cache_key(self, http_request: HttpRequest) -> Optional[str]:
+    """Returns the response cache key of the request, if it is cacheable."""
+    if self._response_cache is None:
+      return None
+    return self._response_cache.get_key(
+        http_request.method,
+        http_request.url,
+        http_request.data,
+        http_request.headers,
+        self._cache_identity,
+    )
+
+  def _get_cached_response(self, cache_key: str) -> Optional[SdkHttpResponse]:
+    """Returns the cached response, or None if the cache fails."""
+    if self._response_cache is None:
+      return None
+    try:
+      return self._response_cache.get(cache_key)
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to read the response cache: %s', e)
+      return None
+
+  def _cache_response(self, cache_key: str, response: SdkHttpResponse) -> None:
+    """Caches the response, logging rather than raising if the cache fails."""
+    if self._response_cache is None:
+      return
+    try:
+      self._response_cache.set(cache_key, response)
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to write the response cache: %s', e)
+
+  async def _async_get_cached_response(
+      self, cache_key: str
+  ) -> Optional[SdkHttpResponse]:
+    """Returns the cached response, or None if the cache fails."""
+    if self._response_cache is None:
+      return None
+    try:
+      return await self._response_cache.async_get(cache_key)
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to read the response cache: %s', e)
+      return None
+
+  async def _async_cache_response(
+      self, cache_key: str, response: SdkHttpResponse
+  ) -> None:
+    """Caches the response, logging rather than raising if the cache fails."""
+    if self._response_cache is None:
+      return
+    try:
+      await self._response_cache.async_set(cache_key, response)
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to write the response cache: %s', e)
+
   def request(
       self,
       http_method: str,
@@ -1282,11 +1941,19 @@ class BaseApiClient:
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
+    cache_key = self._get_cache_key(http_request)
+    if cache_key is not None:
+      cached_response = self._get_cached_response(cache_key)
+      if cached_response is not None:
+        return cached_response
     response = self._request(http_request, http_options, stream=False)
     response_body = (
         response.response_stream[0] if response.response_stream else ''
     )
-    return SdkHttpResponse(headers=response.headers, body=response_body)
+    sdk_response = SdkHttpResponse(headers=response.headers, body=response_body)
+    if cache_key is not None:
+      self._cache_response(cache_key, sdk_response)
+    return sdk_response
 
   def request_streamed(
       self,
@@ -1295,15 +1962,29 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Generator[SdkHttpResponse, None, None]:
+    for headers, chunk in self.request_streamed_json(
+        http_method, path, request_dict, http_options
+    ):
+      yield SdkHttpResponse(headers=headers, body=json.dumps(chunk))
+
+  def request_streamed_json(
+      self,
+      http_method: str,
+      path: str,
+      request_dict: dict[str, object],
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> Generator[tuple[dict[str, str], Any], None, None]:
+    """Streams the response, yielding the headers and each decoded chunk.
+
+    Unlike `request_streamed`, the chunks are not serialized back to JSON.
+    """
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
 
     session_response = self._request(http_request, http_options, stream=True)
     for chunk in session_response.segments():
-      yield SdkHttpResponse(
-          headers=session_response.headers, body=json.dumps(chunk)
-      )
+      yield session_response.headers, chunk
 
   async def async_request(
       self,
@@ -1315,12 +1996,20 @@ class BaseApiClient:
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
+    cache_key = self._get_cache_key(http_request)
+    if cache_key is not None:
+      cached_response = await self._async_get_cached_response(cache_key)
+      if cached_response is not None:
+        return cached_response
 
     result = await self._async_request(
         http_request=http_request, http_options=http_options, stream=False
     )
     response_body = result.response_stream[0] if result.response_stream else ''
-    return SdkHttpResponse(headers=result.headers, body=response_body)
+    sdk_response = SdkHttpResponse(headers=result.headers, body=response_body)
+    if cache_key is not None:
+      await self._async_cache_response(cache_key, sdk_response)
+    return sdk_response
 
   async def async_request_streamed(
       self,
@@ -1329,17 +2018,39 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Any:
+    chunks = await self.async_request_streamed_json(
+        http_method, path, request_dict, http_options
+    )
+
+    async def async_generator():  # type: ignore[no-untyped-def]
+      async for headers, chunk in chunks:
+        yield SdkHttpResponse(headers=headers, body=json.dumps(chunk))
+
+    return async_generator()  # type: ignore[no-untyped-call]
+
+  async def async_request_streamed_json(
+      self,
+      http_method: str,
+      path: str,
+      request_dict: dict[str, object],
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> AsyncIterator[tuple[dict[str, str], Any]]:
+    """Streams the response, yielding the headers and each decoded chunk.
+
+    Unlike `async_request_streamed`, the chunks are not serialized back to
+    JSON.
+    """
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
 
     response = await self._async_request(http_request=http_request, stream=True)
 
-    async def async_generator():  # type: ignore[no-untyped-def]
+    async def async_generator() -> AsyncIterator[tuple[dict[str, str], Any]]:
       async for chunk in response:
-        yield SdkHttpResponse(headers=response.headers, body=json.dumps(chunk))
+        yield response.headers, chunk
 
-    return async_generator()  # type: ignore[no-untyped-call]
+    return async_generator()
 
   def upload_file(
       self,
@@ -1348,6 +2059,9 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     """Transfers a file to the given URL.
 
@@ -1359,20 +2073,80 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent per request. Must be a multiple of
+        256 KiB. Defaults to 8 MiB.
+      resume: Whether the upload was started before. If set, the upload
+        continues from the offset the server has received.
+      read_ahead: Whether to read the next chunk while the current one is sent.
 
     returns:
           The HttpResponse object from the finalize request.
     """
     if isinstance(file_path, io.IOBase):
       return self._upload_fd(
-          file_path, upload_url, upload_size, http_options=http_options
+          file_path,
+          upload_url,
+          upload_size,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          resume=resume,
+          read_ahead=read_ahead,
       )
     else:
       with open(file_path, 'rb') as file:
         return self._upload_fd(
-            file, upload_url, upload_size, http_options=http_options
+            file,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            resume=resume,
+            read_ahead=read_ahead,
         )
 
+  def _upload_timeout_in_seconds(
+      self, http_options: Optional[HttpOptionsOrDict]
+  ) -> Optional[float]:
+    """Returns the timeout of the upload requests."""
+    http_options = http_options if http_options else self._http_options
+    timeout = (
+        http_options.get('timeout')
+        if isinstance(http_options, dict)
+        else http_options.timeout
+    )
+    if timeout is None:
+      # Per request timeout is not configured. Check the global timeout.
+      timeout = self._http_options.timeout
+    return get_timeout_in_seconds(timeout)
+
+  def _send_upload_request(
+      self,
+      upload_url: str,
+      upload_command: str,
+      offset: int,
+      file_chunk: bytes,
+      timeout_in_seconds: Optional[float],
+  ) -> HttpResponse:
+    """Sends one request of the resumable upload protocol."""
+    upload_headers = {'X-Goog-Upload-Command': upload_command}
+    if upload_command != 'query':
+      upload_headers['X-Goog-Upload-Offset'] = str(offset)
+    upload_headers['Content-Length'] = str(len(file_chunk))
+    populate_server_timeout_header(upload_headers, timeout_in_seconds)
+    response = self._httpx_client.request(
+        method='POST',
+        url=upload_url,
+        headers=upload_headers,
+        content=file_chunk,
+        timeout=timeout_in_seconds,
+    )
+    http_response = HttpResponse(
+        response.headers, response_stream=[response.text]
+    )
+    http_response.status_code = response.status_code
+    _raise_for_rejected_upload(http_response)
+    return http_response
+
   def _upload_fd(
       self,
       file: io.IOBase,
@@ -1380,77 +2154,117 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     """Transfers a file to the given URL.
 
+    A chunk that is not acknowledged by the server is retried after querying
+    the offset the server has persisted, so an interrupted chunk is not sent
+    twice and the bytes already received are not sent again.
+
     Args:
       file: A file like object inherited from io.BytesIO.
       upload_url: The URL to upload the file to.
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent per request.
+      resume: Whether to continue from the offset the server has received.
+      read_ahead: Whether to read the next chunk while the current one is sent.
+
+    Raises:
+      UploadSessionExpiredError: The server rejected the upload session, or
+        the session to resume is no longer active.
 
     returns:
           The HttpResponse object from the finalize request.
     """
+    chunk_size = _validate_upload_chunk_size(chunk_size)
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
+    start_position = file.tell()
     offset = 0
-    # Upload the file in chunks
-    while True:
-      file_chunk = file.read(CHUNK_SIZE)
-      chunk_size = 0
-      if file_chunk:
-        chunk_size = len(file_chunk)
-      upload_command = 'upload'
-      # If last chunk, finalize the upload.
-      if chunk_size + offset >= upload_size:
-        upload_command += ', finalize'
-      http_options = http_options if http_options else self._http_options
-      timeout = (
-          http_options.get('timeout')
-          if isinstance(http_options, dict)
-          else http_options.timeout
+    response: Optional[HttpResponse] = None
+    upload_status: Optional[str] = None
+    if resume:
+      response = self._send_upload_request(
+          upload_url, 'query', 0, b'', timeout_in_seconds
       )
-      if timeout is None:
-        # Per request timeout is not configured. Check the global timeout.
-        timeout = (
-            self._http_options.timeout
-            if isinstance(self._http_options, dict)
-            else self._http_options.timeout
-        )
-      timeout_in_seconds = get_timeout_in_seconds(timeout)
-      upload_headers = {
-          'X-Goog-Upload-Command': upload_command,
-          'X-Goog-Upload-Offset': str(offset),
-          'Content-Length': str(chunk_size),
-      }
-      populate_server_timeout_header(upload_headers, timeout_in_seconds)
-      retry_count = 0
-      while retry_count < MAX_RETRY_COUNT:
-        response = self._httpx_client.request(
-            method='POST',
-            url=upload_url,
-            headers=upload_headers,
-            content=file_chunk,
-            timeout=timeout_in_seconds,
-        )
-        if response.headers.get('x-goog-upload-status'):
-          break
-        delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
-        retry_count += 1
-        time.sleep(delay_seconds)
-
-      offset += chunk_size
-      if response.headers.get('x-goog-upload-status') != 'active':
-        break  # upload is complete or it has been interrupted.
-      if upload_size <= offset:  # Status is not finalized.
-        raise ValueError(
-            f'All content has been uploaded, but the upload status is not'
-            f' finalized.'
-        )
+      upload_status = _get_upload_header(
+          response.headers, 'x-goog-upload-status'
+      )
+      _check_resumed_upload_status(upload_status)
+      offset = int(
+          _get_upload_header(response.headers, 'x-goog-upload-size-received')
+          or 0
+      )
+      file.seek(start_position + offset, os.SEEK_SET)
+
+    retry_count = 0
+    chunks = _iter_file_chunks(file, chunk_size, read_ahead)
+    try:
+      # Upload the file in chunks
+      while upload_status is None or upload_status == 'active':
+        file_chunk = next(chunks)
+        upload_command = 'upload'
+        # If last chunk, finalize the upload.
+        if len(file_chunk) + offset >= upload_size:
+          upload_command += ', finalize'
+        upload_error: Optional[httpx.TransportError] = None
+        try:
+          response = self._send_upload_request(
+              upload_url, upload_command, offset, file_chunk, timeout_in_seconds
+          )
+          upload_status = _get_upload_header(
+              response.headers, 'x-goog-upload-status'
+          )
+        except httpx.TransportError as e:
+          upload_error = e
+          upload_status = None
 
-    if response.headers.get('x-goog-upload-status') != 'final':
+        if upload_status is None:
+          retry_count += 1
+          if retry_count >= MAX_RETRY_COUNT:
+            if upload_error is not None:
+              raise upload_error
+            break
+          time.sleep(
+              INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER ** (retry_count - 1))
+          )
+          # Ask the server how much of the chunk it has persisted.
+          response = self._send_upload_request(
+              upload_url, 'query', 0, b'', timeout_in_seconds
+          )
+          upload_status = _get_upload_header(
+              response.headers, 'x-goog-upload-status'
+          )
+          offset = int(
+              _get_upload_header(
+                  response.headers, 'x-goog-upload-size-received'
+              )
+              or offset
+          )
+          chunks.close()
+          file.seek(start_position + offset, os.SEEK_SET)
+          chunks = _iter_file_chunks(file, chunk_size, read_ahead)
+          continue
+
+        retry_count = 0
+        offset += len(file_chunk)
+        if upload_status != 'active':
+          break  # upload is complete or it has been interrupted.
+        if upload_size <= offset:  # Status is not finalized.
+          raise ValueError(
+              f'All content has been uploaded, but the upload status is not'
+              f' finalized.'
+          )
+    finally:
+      chunks.close()
+
+    if response is None or upload_status != 'final':
       raise ValueError('Failed to upload file: Upload status is not finalized.')
-    return HttpResponse(response.headers, response_stream=[response.text])
+    return response
 
   def download_file(
       self,
@@ -1474,7 +2288,7 @@ class BaseApiClient:
     data: Optional[Union[str, bytes]] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data)
+        data = _serialize_request_data(http_request.data)
       else:
         data = http_request.data
 
@@ -1491,6 +2305,50 @@ class BaseApiClient:
         response.headers, byte_stream=[response.read()]
     ).byte_stream[0]
 
+  def download_file_to(
+      self,
+      path: str,
+      destination: DownloadDestination,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      resume: bool = False,
+  ) -> None:
+    """Streams the file data into the destination.
+
+    The data is written as it is received, so the file is never held in
+    memory as a whole.
+
+    Args:
+      path: The request path with query params.
+      destination: A file path, or a writable binary file object.
+      http_options: The http options to use for the request.
+      resume: Whether to continue a partial download. If the destination is a
+        path to an existing file, only the remaining bytes are requested and
+        appended to it.
+    """
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    offset = _download_offset(destination, resume)
+    headers = http_request.headers
+    if offset:
+      headers = {**headers, 'Range': f'bytes={offset}-'}
+
+    with self._httpx_client.stream(
+        method=http_request.method,
+        url=http_request.url,
+        headers=headers,
+        timeout=http_request.timeout,
+    ) as response:
+      if offset and response.status_code == 416:
+        return  # The partial download is already complete.
+      partial = offset > 0 and response.status_code == 206
+      if not partial:
+        errors.APIError.raise_for_response(response)
+      with _open_download_sink(destination, append=partial) as write:
+        for data in response.iter_bytes(READ_BUFFER_SIZE):
+          write(data)
+
   async def async_upload_file(
       self,
       file_path: Union[str, io.IOBase],
@@ -1498,6 +2356,9 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     """Transfers a file asynchronously to the given URL.
 
@@ -1508,22 +2369,81 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent per request. Must be a multiple of
+        256 KiB. Defaults to 8 MiB.
+      resume: Whether the upload was started before. If set, the upload
+        continues from the offset the server has received.
+      read_ahead: Whether to read the next chunk while the current one is sent.
 
     returns:
           The HttpResponse object from the finalize request.
     """
     if isinstance(file_path, io.IOBase):
       return await self._async_upload_fd(
-          file_path, upload_url, upload_size, http_options=http_options
+          file_path,
+          upload_url,
+          upload_size,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          resume=resume,
+          read_ahead=read_ahead,
       )
     else:
       file = anyio.Path(file_path)
       fd = await file.open('rb')
       async with fd:
         return await self._async_upload_fd(
-            fd, upload_url, upload_size, http_options=http_options
+            fd,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            resume=resume,
+            read_ahead=read_ahead,
         )
 
+  async def _async_send_upload_request(
+      self,
+      upload_url: str,
+      upload_command: str,
+      offset: int,
+      file_chunk: bytes,
+      timeout_in_seconds: Optional[float],
+  ) -> HttpResponse:
+    """Asynchronously sends one request of the resumable upload protocol."""
+    upload_headers = {'X-Goog-Upload-Command': upload_command}
+    if upload_command != 'query':
+      upload_headers['X-Goog-Upload-Offset'] = str(offset)
+    upload_headers['Content-Length'] = str(len(file_chunk))
+    populate_server_timeout_header(upload_headers, timeout_in_seconds)
+    if self._use_aiohttp():
+      response = await self._async_aiohttp_client.request(
+          method='POST',
+          url=upload_url,
+          data=file_chunk,
+          headers=upload_headers,
+          timeout=aiohttp.ClientTimeout(connect=timeout_in_seconds),
+      )
+      http_response = HttpResponse(
+          response.headers, response_stream=[await response.text()]
+      )
+      http_response.status_code = response.status
+    else:
+      # aiohttp is not available. Fall back to httpx.
+      client_response = await self._async_httpx_client.request(
+          method='POST',
+          url=upload_url,
+          content=file_chunk,
+          headers=upload_headers,
+          timeout=timeout_in_seconds,
+      )
+      http_response = HttpResponse(
+          client_response.headers, response_stream=[client_response.text]
+      )
+      http_response.status_code = client_response.status_code
+    _raise_for_rejected_upload(http_response)
+    return http_response
+
   async def _async_upload_fd(
       self,
       file: Union[io.IOBase, anyio.AsyncFile[Any]],
@@ -1531,181 +2451,130 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     """Transfers a file asynchronously to the given URL.
 
+    A chunk that is not acknowledged by the server is retried after querying
+    the offset the server has persisted, so an interrupted chunk is not sent
+    twice and the bytes already received are not sent again.
+
     Args:
       file: A file like object inherited from io.BytesIO.
       upload_url: The URL to upload the file to.
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent per request.
+      resume: Whether to continue from the offset the server has received.
+      read_ahead: Whether to read the next chunk while the current one is sent.
+
+    Raises:
+      UploadSessionExpiredError: The server rejected the upload session, or
+        the session to resume is no longer active.
 
     returns:
           The HttpResponse object from the finalized request.
     """
+    chunk_size = _validate_upload_chunk_size(chunk_size)
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
+    retryable_errors: Tuple[type[Exception], ...] = (httpx.TransportError,)
+    if self._use_aiohttp():
+      retryable_errors += (aiohttp.ClientError,)
+
+    async def seek(position: int) -> None:
+      if isinstance(file, io.IOBase):
+        file.seek(position, os.SEEK_SET)
+      else:
+        await file.seek(position, os.SEEK_SET)
+
+    if isinstance(file, io.IOBase):
+      start_position = file.tell()
+    else:
+      start_position = await file.tell()
     offset = 0
-    # Upload the file in chunks
-    if self._use_aiohttp():  # pylint: disable=g-import-not-at-top
-      session = self._async_aiohttp_client
-      while True:
-        if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
-        else:
-          file_chunk = await file.read(CHUNK_SIZE)
-        chunk_size = 0
-        if file_chunk:
-          chunk_size = len(file_chunk)
+    response: Optional[HttpResponse] = None
+    upload_status: Optional[str] = None
+    if resume:
+      response = await self._async_send_upload_request(
+          upload_url, 'query', 0, b'', timeout_in_seconds
+      )
+      upload_status = _get_upload_header(
+          response.headers, 'x-goog-upload-status'
+      )
+      _check_resumed_upload_status(upload_status)
+      offset = int(
+          _get_upload_header(response.headers, 'x-goog-upload-size-received')
+          or 0
+      )
+      await seek(start_position + offset)
+
+    retry_count = 0
+    chunks = _aiter_file_chunks(file, chunk_size, read_ahead)
+    try:
+      # Upload the file in chunks
+      while upload_status is None or upload_status == 'active':
+        file_chunk = await chunks.__anext__()
         upload_command = 'upload'
         # If last chunk, finalize the upload.
-        if chunk_size + offset >= upload_size:
+        if len(file_chunk) + offset >= upload_size:
           upload_command += ', finalize'
-        http_options = http_options if http_options else self._http_options
-        timeout = (
-            http_options.get('timeout')
-            if isinstance(http_options, dict)
-            else http_options.timeout
-        )
-        if timeout is None:
-          # Per request timeout is not configured. Check the global timeout.
-          timeout = (
-              self._http_options.timeout
-              if isinstance(self._http_options, dict)
-              else self._http_options.timeout
+        upload_error: Optional[Exception] = None
+        try:
+          response = await self._async_send_upload_request(
+              upload_url, upload_command, offset, file_chunk, timeout_in_seconds
           )
-          if timeout is None:
-            # Per request timeout is not configured. Check the global timeout.
-            timeout = (
-                self._http_options.timeout
-                if isinstance(self._http_options, dict)
-                else self._http_options.timeout
-            )
-          timeout_in_seconds = get_timeout_in_seconds(timeout)
-          upload_headers = {
-              'X-Goog-Upload-Command': upload_command,
-              'X-Goog-Upload-Offset': str(offset),
-              'Content-Length': str(chunk_size),
-          }
-          populate_server_timeout_header(upload_headers, timeout_in_seconds)
-
-        retry_count = 0
-        response = None
-        while retry_count < MAX_RETRY_COUNT:
-          response = await session.request(
-              method='POST',
-              url=upload_url,
-              data=file_chunk,
-              headers=upload_headers,
-              timeout=aiohttp.ClientTimeout(connect=timeout_in_seconds),
+          upload_status = _get_upload_header(
+              response.headers, 'x-goog-upload-status'
           )
+        except retryable_errors as e:
+          upload_error = e
+          upload_status = None
 
-          if response.headers.get('X-Goog-Upload-Status'):
+        if upload_status is None:
+          retry_count += 1
+          if retry_count >= MAX_RETRY_COUNT:
+            if upload_error is not None:
+              raise upload_error
             break
-          delay_seconds = INITIAL_RETRY_DELAY * (
-              DELAY_MULTIPLIER**retry_count
+          await asyncio.sleep(
+              INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER ** (retry_count - 1))
           )
-          retry_count += 1
-          time.sleep(delay_seconds)
-
-        offset += chunk_size
-        if (
-            response is not None
-            and response.headers.get('X-Goog-Upload-Status') != 'active'
-        ):
-          break  # upload is complete or it has been interrupted.
-
-        if upload_size <= offset:  # Status is not finalized.
-          raise ValueError(
-              f'All content has been uploaded, but the upload status is not'
-              f' finalized.'
+          # Ask the server how much of the chunk it has persisted.
+          response = await self._async_send_upload_request(
+              upload_url, 'query', 0, b'', timeout_in_seconds
           )
-        if (
-            response is not None
-            and response.headers.get('X-Goog-Upload-Status') != 'final'
-        ):
-          raise ValueError(
-              'Failed to upload file: Upload status is not finalized.'
+          upload_status = _get_upload_header(
+              response.headers, 'x-goog-upload-status'
           )
-        return HttpResponse(
-            response.headers, response_stream=[await response.text()]
-        )
-    else:
-      # aiohttp is not available. Fall back to httpx.
-      while True:
-        if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
-        else:
-          file_chunk = await file.read(CHUNK_SIZE)
-        chunk_size = 0
-        if file_chunk:
-          chunk_size = len(file_chunk)
-        upload_command = 'upload'
-        # If last chunk, finalize the upload.
-        if chunk_size + offset >= upload_size:
-          upload_command += ', finalize'
-        http_options = http_options if http_options else self._http_options
-        timeout = (
-            http_options.get('timeout')
-            if isinstance(http_options, dict)
-            else http_options.timeout
-        )
-        if timeout is None:
-          # Per request timeout is not configured. Check the global timeout.
-          timeout = (
-              self._http_options.timeout
-              if isinstance(self._http_options, dict)
-              else self._http_options.timeout
+          offset = int(
+              _get_upload_header(
+                  response.headers, 'x-goog-upload-size-received'
+              )
+              or offset
           )
-        timeout_in_seconds = get_timeout_in_seconds(timeout)
-        upload_headers = {
-            'X-Goog-Upload-Command': upload_command,
-            'X-Goog-Upload-Offset': str(offset),
-            'Content-Length': str(chunk_size),
-        }
-        populate_server_timeout_header(upload_headers, timeout_in_seconds)
+          await chunks.aclose()
+          await seek(start_position + offset)
+          chunks = _aiter_file_chunks(file, chunk_size, read_ahead)
+          continue
 
         retry_count = 0
-        client_response = None
-        while retry_count < MAX_RETRY_COUNT:
-          client_response = await self._async_httpx_client.request(
-              method='POST',
-              url=upload_url,
-              content=file_chunk,
-              headers=upload_headers,
-              timeout=timeout_in_seconds,
-          )
-          if (
-              client_response is not None
-              and client_response.headers
-              and client_response.headers.get('x-goog-upload-status')
-          ):
-            break
-          delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
-          retry_count += 1
-          time.sleep(delay_seconds)
-
-        offset += chunk_size
-        if (
-            client_response is not None
-            and client_response.headers.get('x-goog-upload-status') != 'active'
-        ):
+        offset += len(file_chunk)
+        if upload_status != 'active':
           break  # upload is complete or it has been interrupted.
-
         if upload_size <= offset:  # Status is not finalized.
           raise ValueError(
               'All content has been uploaded, but the upload status is not'
               ' finalized.'
           )
-      if (
-          client_response is not None
-          and client_response.headers.get('x-goog-upload-status') != 'final'
-      ):
-        raise ValueError(
-            'Failed to upload file: Upload status is not finalized.'
-        )
-      return HttpResponse(
-          client_response.headers, response_stream=[client_response.text]
-      )
+    finally:
+      await chunks.aclose()
+
+    if response is None or upload_status != 'final':
+      raise ValueError('Failed to upload file: Upload status is not finalized.')
+    return response
 
   async def async_download_file(
       self,
@@ -1729,7 +2598,7 @@ class BaseApiClient:
     data: Optional[Union[str, bytes]] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data)
+        data = _serialize_request_data(http_request.data)
       else:
         data = http_request.data
 
@@ -1762,6 +2631,74 @@ class BaseApiClient:
           client_response.headers, byte_stream=[client_response.read()]
       ).byte_stream[0]
 
+  async def async_download_file_to(
+      self,
+      path: str,
+      destination: DownloadDestination,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      resume: bool = False,
+  ) -> None:
+    """Asynchronously streams the file data into the destination.
+
+    The data is written as it is received, so the file is never held in
+    memory as a whole.
+
+    Args:
+      path: The request path with query params.
+      destination: A file path, or a writable binary file object.
+      http_options: The http options to use for the request.
+      resume: Whether to continue a partial download. If the destination is a
+        path to an existing file, only the remaining bytes are requested and
+        appended to it.
+    """
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    offset = _download_offset(destination, resume)
+    headers = http_request.headers
+    if offset:
+      headers = {**headers, 'Range': f'bytes={offset}-'}
+
+    if self._use_aiohttp():
+      response = await self._async_aiohttp_client.request(
+          method=http_request.method,
+          url=http_request.url,
+          headers=headers,
+          timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
+      )
+      try:
+        if offset and response.status == 416:
+          return  # The partial download is already complete.
+        partial = offset > 0 and response.status == 206
+        if not partial:
+          await errors.APIError.raise_for_async_response(response)
+        async with _async_open_download_sink(
+            destination, append=partial
+        ) as write:
+          async for data in response.content.iter_chunked(READ_BUFFER_SIZE):
+            await write(data)
+      finally:
+        response.release()
+    else:
+      # aiohttp is not available. Fall back to httpx.
+      async with self._async_httpx_client.stream(
+          method=http_request.method,
+          url=http_request.url,
+          headers=headers,
+          timeout=http_request.timeout,
+      ) as client_response:
+        if offset and client_response.status_code == 416:
+          return  # The partial download is already complete.
+        partial = offset > 0 and client_response.status_code == 206
+        if not partial:
+          await errors.APIError.raise_for_async_response(client_response)
+        async with _async_open_download_sink(
+            destination, append=partial
+        ) as write:
+          async for data in client_response.aiter_bytes(READ_BUFFER_SIZE):
+            await write(data)
+
   # This method does nothing in the real api client. It is used in the
   # replay_api_client to verify the response from the SDK method matches the
   # recorded response.
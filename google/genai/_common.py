@@ -33,6 +33,9 @@ logger = logging.getLogger('google_genai._common')
 
 StringDict: TypeAlias = dict[str, Any]
 
+# Marks a key that is missing, as opposed to a key set to None.
+_MISSING = object()
+
 
 class ExperimentalWarning(Warning):
   """Warning for experimental features."""
@@ -50,7 +53,17 @@ def set_value_by_path(data: Optional[dict[Any, Any]], keys: list[str], value: An
   """
   if value is None:
     return
-  for i, key in enumerate(keys[:-1]):
+  if len(keys) == 1 and type(data) is dict:
+    # Fast path for the common case of a single key.
+    key = keys[0]
+    existing_data = data.get(key)
+    if existing_data is None:
+      data[key] = value
+      return
+    keys_to_parent: list[str] = []
+  else:
+    keys_to_parent = keys[:-1]
+  for i, key in enumerate(keys_to_parent):
     if key.endswith('[]'):
       key_name = key[:-2]
       if data is not None and key_name not in data:
@@ -111,11 +124,23 @@ def get_value_by_path(data: Any, keys: list[str]) -> Any:
   get_value_by_path({'a': {'b': [{'c': v1}, {'c': v2}]}}, ['a', 'b[]', 'c'])
     -> [v1, v2]
   """
-  if keys == ['_self']:
+  if len(keys) == 1 and keys[0] == '_self':
     return data
   for i, key in enumerate(keys):
     if not data:
       return None
+    # Fast paths for the common case of a plain key into a dict or a model.
+    # `key in model` would iterate over all the fields of the model.
+    if type(data) is dict and not key.endswith(']'):
+      data = data.get(key, _MISSING)
+      if data is _MISSING:
+        return None
+      continue
+    if isinstance(data, BaseModel) and not key.endswith(']'):
+      data = getattr(data, key, _MISSING)
+      if data is _MISSING:
+        return None
+      continue
     if key.endswith('[]'):
       key_name = key[:-2]
       if key_name in data:
@@ -161,6 +186,42 @@ def convert_to_dict(obj: object) -> Any:
     return obj
 
 
+# Config fields read by `BaseModel._from_response` and its overrides.
+_RESPONSE_CONFIG_FIELDS = (
+    'response_schema',
+    'response_json_schema',
+    'include_all_fields',
+)
+
+
+def response_kwargs(parameter_model: pydantic.BaseModel) -> StringDict:
+  """Returns the request fields needed to construct the response object.
+
+  Dumping the whole parameter model would serialize the request again,
+  including inline media bytes and the chat history, while the response only
+  depends on a few config fields.
+
+  Args:
+    parameter_model: The request parameters.
+
+  Returns:
+    A dictionary in the shape of `parameter_model.model_dump()`, containing
+    only the config fields that `_from_response` reads.
+  """
+  config = getattr(parameter_model, 'config', None)
+  if config is None:
+    return {}
+  response_config: StringDict = {}
+  for field in _RESPONSE_CONFIG_FIELDS:
+    if isinstance(config, dict):
+      value = config.get(field)
+    else:
+      value = getattr(config, field, None)
+    if value is not None:
+      response_config[field] = value
+  return {'config': response_config}
+
+
 def _is_struct_type(annotation: type) -> bool:
   """Checks if the given annotation is list[dict[str, typing.Any]]
   or typing.List[typing.Dict[str, typing.Any]].
@@ -193,30 +254,34 @@ def _is_struct_type(annotation: type) -> bool:
   return key_type is str and value_type is typing.Any
 
 
-def _remove_extra_fields(
-    model: Any, response: dict[str, object]
-) -> None:
-  """Removes extra fields from the response that are not in the model.
+# Per model class, maps each field name and alias to the model classes used to
+# prune a nested dict value and the dict items of a list value respectively.
+_ModelClass: TypeAlias = Optional[type[pydantic.BaseModel]]
+_PruningPlan: TypeAlias = dict[str, tuple[_ModelClass, _ModelClass]]
+_pruning_plans: dict[type[pydantic.BaseModel], _PruningPlan] = {}
 
-  Mutates the response in place.
-  """
 
-  key_values = list(response.items())
-
-  for key, value in key_values:
-    # Need to convert to snake case to match model fields names
-    # ex: UsageMetadata
-    alias_map = {
-        field_info.alias: key for key, field_info in model.model_fields.items()
-    }
+def _as_model_class(annotation: Any) -> _ModelClass:
+  try:
+    if isinstance(annotation, type) and issubclass(
+        annotation, pydantic.BaseModel
+    ):
+      return annotation
+  except TypeError:
+    # Generic aliases are types on Python 3.9 and 3.10.
+    pass
+  return None
 
-    if key not in model.model_fields and key not in alias_map:
-      response.pop(key)
-      continue
 
-    key = alias_map.get(key, key)
+def _get_pruning_plan(model: type[pydantic.BaseModel]) -> _PruningPlan:
+  """Returns the cached pruning plan of the model, building it if needed."""
+  plan = _pruning_plans.get(model)
+  if plan is not None:
+    return plan
 
-    annotation = model.model_fields[key].annotation
+  plan = {}
+  for field_name, field_info in model.model_fields.items():
+    annotation: Any = field_info.annotation
 
     # Get the BaseModel if Optional
     if typing.get_origin(annotation) is Union:
@@ -224,16 +289,51 @@ def _remove_extra_fields(
 
     # if dict, assume BaseModel but also check that field type is not dict
     # example: FunctionCall.args
-    if isinstance(value, dict) and typing.get_origin(annotation) is not dict:
-      _remove_extra_fields(annotation, value)
-    elif isinstance(value, list):
-      if _is_struct_type(annotation):
-        continue
+    dict_model = None
+    if typing.get_origin(annotation) is not dict:
+      dict_model = _as_model_class(annotation)
+
+    # assume a list of dict is list of BaseModel
+    item_model = None
+    if annotation is not None and not _is_struct_type(annotation):
+      args = typing.get_args(annotation)
+      if args:
+        item_model = _as_model_class(args[0])
+
+    # Need to accept the alias to match the wire format.
+    # ex: usageMetadata
+    plan[field_name] = (dict_model, item_model)
+    if field_info.alias is not None:
+      plan[field_info.alias] = (dict_model, item_model)
 
+  _pruning_plans[model] = plan
+  return plan
+
+
+def _remove_extra_fields(
+    model: Any, response: dict[str, object]
+) -> None:
+  """Removes extra fields from the response that are not in the model.
+
+  Mutates the response in place.
+  """
+  plan = _get_pruning_plan(model)
+
+  for key in list(response):
+    entry = plan.get(key)
+    if entry is None:
+      del response[key]
+      continue
+
+    value = response[key]
+    dict_model, item_model = entry
+    if isinstance(value, dict):
+      if dict_model is not None:
+        _remove_extra_fields(dict_model, value)
+    elif isinstance(value, list) and item_model is not None:
       for item in value:
-        # assume a list of dict is list of BaseModel
         if isinstance(item, dict):
-          _remove_extra_fields(typing.get_args(annotation)[0], item)
+          _remove_extra_fields(item_model, item)
 
 T = typing.TypeVar('T', bound='BaseModel')
 
@@ -494,42 +594,39 @@ def timestamped_unique_name() -> str:
   return f'{timestamp}_{unique_id}'
 
 
+def _encode_unserializable_value(value: object) -> object:
+  if isinstance(value, bytes):
+    return base64.urlsafe_b64encode(value).decode('ascii')
+  elif isinstance(value, datetime.datetime):
+    return value.isoformat()
+  elif isinstance(value, dict):
+    return encode_unserializable_types(value)
+  elif isinstance(value, list):
+    return [_encode_unserializable_value(v) for v in value]
+  elif isinstance(value, pydantic.BaseModel):
+    return encode_unserializable_types(value.model_dump(exclude_none=True))
+  else:
+    return value
+
+
 def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
   """Converts unserializable types in dict to json.dumps() compatible types.
 
-  This function is called in models.py after calling convert_to_dict(). The
-  convert_to_dict() can convert pydantic object to dict. However, the input to
-  convert_to_dict() is dict mixed of pydantic object and nested dict(the output
-  of converters). So they may be bytes in the dict and they are out of
-  `ser_json_bytes` control in model_dump(mode='json') called in
-  `convert_to_dict`, as well as datetime deserialization in Pydantic json mode.
+  This function is called in models.py on the output of the converters, which
+  is a dict mixed of pydantic objects and nested dicts. Pydantic objects are
+  dumped like in `convert_to_dict()`, and bytes and datetimes, which are out of
+  `ser_json_bytes` control in a python mode model_dump(), are encoded, all in a
+  single pass over the data.
 
   Returns:
     A dictionary with json.dumps() incompatible type (e.g. bytes datetime)
     to compatible type (e.g. base64 encoded string, isoformat date string).
   """
-  processed_data: dict[str, object] = {}
   if not isinstance(data, dict):
     return data
-  for key, value in data.items():
-    if isinstance(value, bytes):
-      processed_data[key] = base64.urlsafe_b64encode(value).decode('ascii')
-    elif isinstance(value, datetime.datetime):
-      processed_data[key] = value.isoformat()
-    elif isinstance(value, dict):
-      processed_data[key] = encode_unserializable_types(value)
-    elif isinstance(value, list):
-      if all(isinstance(v, bytes) for v in value):
-        processed_data[key] = [
-            base64.urlsafe_b64encode(v).decode('ascii') for v in value
-        ]
-      if all(isinstance(v, datetime.datetime) for v in value):
-        processed_data[key] = [v.isoformat() for v in value]
-      else:
-        processed_data[key] = [encode_unserializable_types(v) for v in value]
-    else:
-      processed_data[key] = value
-  return processed_data
+  return {
+      key: _encode_unserializable_value(value) for key, value in data.items()
+  }
 
 
 def experimental_warning(message: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
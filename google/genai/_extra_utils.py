@@ -15,16 +15,25 @@
 
 """Extra utils depending on types that are shared between sync and async modules."""
 
+import array
+import asyncio
+import collections
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+import concurrent.futures
+import contextvars
+from dataclasses import dataclass
 import inspect
 import logging
 import sys
 import typing
-from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin
+from typing import Any, Awaitable, Callable, Dict, Optional, Union, get_args, get_origin
 
 import pydantic
 
+from . import _api_client
 from . import _common
 from . import _mcp_utils
+from . import _partial_json
 from . import _transformers as t
 from . import errors
 from . import types
@@ -53,6 +62,13 @@ _DEFAULT_MAX_REMOTE_CALLS_AFC = 10
 
 logger = logging.getLogger('google_genai.models')
 
+# The name, arguments and function of a function call.
+_FunctionCall = tuple[
+    str,
+    _common.StringDict,
+    Union[Callable[..., Any], McpToGenAiToolAdapter],
+]
+
 
 def _create_generate_content_config_model(
     config: types.GenerateContentConfigOrDict,
@@ -301,12 +317,12 @@ async def invoke_function_from_dict_args_async(
     )
 
 
-def get_function_response_parts(
+def _get_function_calls(
     response: types.GenerateContentResponse,
     function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
-) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
+) -> list[_FunctionCall]:
+  """Returns the function calls in the response."""
+  function_calls: list[_FunctionCall] = []
   if (
       response.candidates is not None
       and isinstance(response.candidates[0].content, types.Content)
@@ -321,66 +337,190 @@ def get_function_response_parts(
         args = convert_number_values_for_dict_function_call_args(
             part.function_call.args
         )
-        func_response: _common.StringDict
-        try:
-          if not isinstance(func, McpToGenAiToolAdapter):
-            func_response = {
-                'result': invoke_function_from_dict_args(args, func)
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
-        )
-        func_response_parts.append(func_response_part)
-  return func_response_parts
+        function_calls.append((func_name, args, func))
+  return function_calls
+
+
+def _get_afc_parallelism(
+    config: Optional[types.GenerateContentConfigOrDict],
+) -> tuple[Optional[int], Optional[float]]:
+  """Returns the maximum parallel calls and the per-call timeout for AFC."""
+  if not config:
+    return None, None
+  config_model = _create_generate_content_config_model(config)
+  afc_config = config_model.automatic_function_calling
+  if not afc_config:
+    return None, None
+  return afc_config.maximum_parallel_calls, afc_config.function_call_timeout
+
+
+def _timeout_error_message(func_name: str, timeout: Optional[float]) -> str:
+  return f'Function {func_name} timed out after {timeout} seconds.'
+
+
+def _not_run_error_message(func_name: str, timeout: Optional[float]) -> str:
+  return (
+      f'Function {func_name} was not run because the function calls timed'
+      f' out after {timeout} seconds.'
+  )
+
+
+def _invoke_function_call(
+    args: _common.StringDict,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+) -> _common.StringDict:
+  """Invokes the function, returning the function response."""
+  func_response: _common.StringDict
+  try:
+    if not isinstance(func, McpToGenAiToolAdapter):
+      func_response = {'result': invoke_function_from_dict_args(args, func)}
+  except Exception as e:  # pylint: disable=broad-except
+    func_response = {'error': str(e)}
+  return func_response
+
+
+def get_function_response_parts(
+    response: types.GenerateContentResponse,
+    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    config: Optional[types.GenerateContentConfigOrDict] = None,
+) -> list[types.Part]:
+  """Returns the function response parts from the response.
+
+  If `automatic_function_calling.maximum_parallel_calls` in the config is more
+  than 1, the function calls run in a thread pool of that size, and the
+  `function_call_timeout` applies to all the calls of the turn. The calls that
+  are still queued then are not run, and the ones still running are left to
+  finish in the background.
+  """
+  function_calls = _get_function_calls(response, function_map)
+  max_workers, timeout = _get_afc_parallelism(config)
+  func_responses: list[_common.StringDict]
+  if len(function_calls) > 1 and max_workers is not None and max_workers > 1:
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(function_calls)),
+        thread_name_prefix='google_genai_afc',
+    )
+    try:
+      futures = [
+          executor.submit(_invoke_function_call, args, func)
+          for _, args, func in function_calls
+      ]
+      # The timeout runs from the start of the turn, so that the calls waiting
+      # for a worker do not add up their timeouts.
+      done, _ = concurrent.futures.wait(futures, timeout=timeout)
+      func_responses = []
+      for (func_name, _, _), future in zip(function_calls, futures):
+        if future in done:
+          func_responses.append(future.result())
+        elif future.cancel():
+          func_responses.append(
+              {'error': _not_run_error_message(func_name, timeout)}
+          )
+        else:
+          func_responses.append(
+              {'error': _timeout_error_message(func_name, timeout)}
+          )
+    finally:
+      # Do not block on function calls that timed out, and do not start the
+      # ones that are still queued.
+      executor.shutdown(wait=False, cancel_futures=True)
+  else:
+    func_responses = [
+        _invoke_function_call(args, func) for _, args, func in function_calls
+    ]
+  return [
+      types.Part.from_function_response(name=name, response=func_response)
+      for (name, _, _), func_response in zip(function_calls, func_responses)
+  ]
+
+
+async def _invoke_function_call_async(
+    func_name: str,
+    args: _common.StringDict,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    timeout: Optional[float],
+    in_thread: bool,
+) -> _common.StringDict:
+  """Invokes the function asynchronously, returning the function response."""
+  func_response: _common.StringDict
+  try:
+    if isinstance(func, McpToGenAiToolAdapter):
+      mcp_tool_response = await asyncio.wait_for(
+          func.call_tool(types.FunctionCall(name=func_name, args=args)),
+          timeout,
+      )
+      if mcp_tool_response.isError:
+        func_response = {'error': mcp_tool_response}
+      else:
+        func_response = {'result': mcp_tool_response}
+    elif inspect.iscoroutinefunction(func):
+      func_response = {
+          'result': await asyncio.wait_for(
+              invoke_function_from_dict_args_async(args, func), timeout
+          )
+      }
+    elif in_thread:
+      # Sync functions run in a thread so that they do not block the event
+      # loop and the other function calls.
+      func_response = {
+          'result': await asyncio.wait_for(
+              asyncio.to_thread(invoke_function_from_dict_args, args, func),
+              timeout,
+          )
+      }
+    else:
+      func_response = {'result': invoke_function_from_dict_args(args, func)}
+  except asyncio.TimeoutError:
+    func_response = {'error': _timeout_error_message(func_name, timeout)}
+  except Exception as e:  # pylint: disable=broad-except
+    func_response = {'error': str(e)}
+  return func_response
 
 
 async def get_function_response_parts_async(
     response: types.GenerateContentResponse,
     function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    config: Optional[types.GenerateContentConfigOrDict] = None,
 ) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
-  if (
-      response.candidates is not None
-      and isinstance(response.candidates[0].content, types.Content)
-      and response.candidates[0].content.parts is not None
-  ):
-    for part in response.candidates[0].content.parts:
-      if not part.function_call:
-        continue
-      func_name = part.function_call.name
-      if func_name is not None and part.function_call.args is not None:
-        func = function_map[func_name]
-        args = convert_number_values_for_dict_function_call_args(
-            part.function_call.args
+  """Returns the function response parts from the response.
+
+  If `automatic_function_calling.maximum_parallel_calls` in the config is set,
+  at most that many function calls run concurrently, and sync functions run in
+  threads. Otherwise the function calls run one by one, and sync functions are
+  called directly.
+  """
+  function_calls = _get_function_calls(response, function_map)
+  max_concurrency, timeout = _get_afc_parallelism(config)
+  func_responses: list[_common.StringDict]
+  if max_concurrency is not None and max_concurrency > 0:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def invoke(
+        func_name: str,
+        args: _common.StringDict,
+        func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    ) -> _common.StringDict:
+      async with semaphore:
+        return await _invoke_function_call_async(
+            func_name, args, func, timeout, in_thread=True
         )
-        func_response: _common.StringDict
-        try:
-          if isinstance(func, McpToGenAiToolAdapter):
-            mcp_tool_response = await func.call_tool(
-                types.FunctionCall(name=func_name, args=args)
-            )
-            if mcp_tool_response.isError:
-              func_response = {'error': mcp_tool_response}
-            else:
-              func_response = {'result': mcp_tool_response}
-          elif inspect.iscoroutinefunction(func):
-            func_response = {
-                'result': await invoke_function_from_dict_args_async(args, func)
-            }
-          else:
-            func_response = {
-                'result': invoke_function_from_dict_args(args, func)
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
+
+    func_responses = list(
+        await asyncio.gather(
+            *(invoke(name, args, func) for name, args, func in function_calls)
+        )
+    )
+  else:
+    func_responses = [
+        await _invoke_function_call_async(
+            name, args, func, timeout, in_thread=False
         )
-        func_response_parts.append(func_response_part)
-  return func_response_parts
+        for name, args, func in function_calls
+    ]
+  return [
+      types.Part.from_function_response(name=name, response=func_response)
+      for (name, _, _), func_response in zip(function_calls, func_responses)
+  ]
 
 
 def should_disable_afc(
@@ -544,3 +684,346 @@ def append_chunk_contents(
     contents = t.t_contents(contents)  # type: ignore[assignment]
     if isinstance(contents, list) and chunk_content is not None:
       contents.append(chunk_content)  # type: ignore[arg-type]
+
+
+# Wire dicts of contents encoded for earlier requests, keyed on the id of the
+# content and holding the content and whether it was encoded for Vertex AI.
+# Chat sessions set it while their requests are encoded, so that each turn
+# only encodes the new contents.
+encoded_contents: contextvars.ContextVar[
+    Optional[dict[int, tuple[types.Content, bool, dict[str, Any]]]]
+] = contextvars.ContextVar('encoded_contents', default=None)
+
+
+def encode_contents(
+    api_client: _api_client.BaseApiClient,
+    contents: list[types.Content],
+    converter: Callable[..., dict[str, Any]],
+    parent_object: dict[str, Any],
+) -> list[dict[str, Any]]:
+  """Converts the contents, reusing the wire dicts in `encoded_contents`."""
+  cache = encoded_contents.get()
+  if cache is None:
+    return [converter(item, parent_object) for item in contents]
+  vertexai = bool(api_client.vertexai)
+  encoded = []
+  for item in contents:
+    entry = cache.get(id(item))
+    if entry is None or entry[0] is not item or entry[1] != vertexai:
+      entry = (
+          item,
+          vertexai,
+          _common.encode_unserializable_types(converter(item, parent_object)),
+      )
+      cache[id(item)] = entry
+    encoded.append(entry[2])
+  return encoded
+
+
+class StructuredOutputStream:
+  """Parses the structured output of a streamed generate_content response.
+
+  A JSON document usually spans several chunks, so parsing each chunk's text
+  on its own fails. The text of the first candidate is fed to a
+  `PartialJsonParser` instead: every chunk gets the document parsed so far as
+  `parsed_partial`, and only the chunk that finishes the candidate gets
+  `parsed`, validated against the response schema. Validating the document
+  before it is complete would fail, so `parsed` is None on the other chunks.
+  """
+
+  def __init__(self, response_kwargs: _common.StringDict) -> None:
+    config = dict(response_kwargs.get('config') or {})
+    response_schema = config.pop('response_schema', None)
+    response_json_schema = config.pop('response_json_schema', None)
+    self.response_schema = (
+        response_schema if response_schema is not None else response_json_schema
+    )
+    # Chunks are not parsed on their own, see update().
+    self.chunk_kwargs: _common.StringDict = {'config': config}
+    self._parser = _partial_json.PartialJsonParser()
+    self._finished = False
+
+  def update(self, chunk: types.GenerateContentResponse) -> None:
+    """Sets the parsed output on the next chunk of the stream."""
+    if self.response_schema is None or self._finished:
+      return
+    text = chunk._get_text(warn_property='parsed')
+    if text:
+      self._parser.feed(text)
+    chunk.parsed_partial = self._parser.value
+    if chunk.candidates and chunk.candidates[0].finish_reason is not None:
+      self._finished = True
+      chunk._set_parsed(self.response_schema, self._parser.text)
+
+
+_EMBED_BULK_BATCH_SIZE = 100
+# Keeps Vertex AI requests under their 20,000 token limit, assuming about four
+# characters per token.
+_EMBED_BULK_VERTEX_MAX_BATCH_CHARACTERS = 60_000
+_EMBED_BULK_MAX_CONCURRENT_REQUESTS = 4
+
+
+@dataclass
+class EmbedContentBulkOptions:
+  """How embed_content_bulk splits the texts into requests."""
+
+  request_config: types.EmbedContentConfig
+  batch_size: int
+  max_batch_characters: Optional[int]
+  max_concurrent_requests: int
+
+
+def get_embed_content_bulk_options(
+    api_client: _api_client.BaseApiClient,
+    config: Optional[types.EmbedContentBulkConfigOrDict],
+) -> EmbedContentBulkOptions:
+  """Returns the request config and batching options for embed_content_bulk."""
+  bulk_config = (
+      types.EmbedContentBulkConfig.model_validate(config)
+      if isinstance(config, dict)
+      else config or types.EmbedContentBulkConfig()
+  )
+  http_options = bulk_config.http_options
+  if bulk_config.retry_options is not None:
+    http_options = (http_options or types.HttpOptions()).model_copy(
+        update={'retry_options': bulk_config.retry_options}
+    )
+  max_batch_characters = bulk_config.max_batch_characters
+  if max_batch_characters is None and api_client.vertexai:
+    max_batch_characters = _EMBED_BULK_VERTEX_MAX_BATCH_CHARACTERS
+  return EmbedContentBulkOptions(
+      request_config=types.EmbedContentConfig(
+          http_options=http_options,
+          task_type=bulk_config.task_type,
+          output_dimensionality=bulk_config.output_dimensionality,
+          mime_type=bulk_config.mime_type,
+          auto_truncate=bulk_config.auto_truncate,
+          output_format=bulk_config.output_format,
+      ),
+      batch_size=bulk_config.batch_size or _EMBED_BULK_BATCH_SIZE,
+      max_batch_characters=max_batch_characters,
+      max_concurrent_requests=(
+          bulk_config.max_concurrent_requests
+          or _EMBED_BULK_MAX_CONCURRENT_REQUESTS
+      ),
+  )
+
+
+class _EmbedBatcher:
+  """Packs texts into batches under the size and character limits."""
+
+  def __init__(self, options: EmbedContentBulkOptions) -> None:
+    self._options = options
+    self._batch: list[str] = []
+    self._characters = 0
+
+  def add(self, text: str) -> Optional[list[str]]:
+    """Adds a text and returns the previous batch if the text did not fit."""
+    full_batch = None
+    max_characters = self._options.max_batch_characters
+    if self._batch and (
+        len(self._batch) >= self._options.batch_size
+        or (
+            max_characters is not None
+            and self._characters + len(text) > max_characters
+        )
+    ):
+      full_batch = self.flush()
+    self._batch.append(text)
+    self._characters += len(text)
+    return full_batch
+
+  def flush(self) -> Optional[list[str]]:
+    """Returns the texts added since the last batch, if any."""
+    batch = self._batch or None
+    self._batch = []
+    self._characters = 0
+    return batch
+
+
+def iter_embed_batches(
+    texts: Iterable[str], options: EmbedContentBulkOptions
+) -> Iterator[list[str]]:
+  """Splits the texts into the batches sent by embed_content_bulk."""
+  batcher = _EmbedBatcher(options)
+  for text in texts:
+    batch = batcher.add(text)
+    if batch:
+      yield batch
+  batch = batcher.flush()
+  if batch:
+    yield batch
+
+
+async def async_iter_embed_batches(
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    options: EmbedContentBulkOptions,
+) -> AsyncIterator[list[str]]:
+  """Splits the texts into the batches sent by embed_content_bulk."""
+  if not isinstance(texts, AsyncIterable):
+    for full_batch in iter_embed_batches(texts, options):
+      yield full_batch
+    return
+  batcher = _EmbedBatcher(options)
+  async for text in texts:
+    batch = batcher.add(text)
+    if batch:
+      yield batch
+  batch = batcher.flush()
+  if batch:
+    yield batch
+
+
+def get_batch_embeddings(
+    batch: list[str], response: types.EmbedContentResponse
+) -> list[types.ContentEmbedding]:
+  """Returns the embeddings of a batch, checking there is one per text."""
+  embeddings = response.embeddings or []
+  if len(embeddings) != len(batch):
+    raise ValueError(
+        f'Expected {len(batch)} embeddings in the response, got'
+        f' {len(embeddings)}.'
+    )
+  return embeddings
+
+
+def embed_content_bulk(
+    embed_content: Callable[..., types.EmbedContentResponse],
+    api_client: _api_client.BaseApiClient,
+    *,
+    model: str,
+    contents: Iterable[str],
+    config: Optional[types.EmbedContentBulkConfigOrDict],
+) -> Iterator[types.ContentEmbedding]:
+  """Embeds the texts in batches sent from a thread pool, for Models."""
+  options = get_embed_content_bulk_options(api_client, config)
+
+  def embed(batch: list[str]) -> list[types.ContentEmbedding]:
+    response = embed_content(
+        model=model, contents=batch, config=options.request_config
+    )
+    return get_batch_embeddings(batch, response)
+
+  pending: collections.deque[
+      concurrent.futures.Future[list[types.ContentEmbedding]]
+  ] = collections.deque()
+  executor = concurrent.futures.ThreadPoolExecutor(
+      max_workers=options.max_concurrent_requests
+  )
+  try:
+    for batch in iter_embed_batches(contents, options):
+      if len(pending) >= options.max_concurrent_requests:
+        yield from pending.popleft().result()
+      pending.append(executor.submit(embed, batch))
+    while pending:
+      yield from pending.popleft().result()
+  finally:
+    for future in pending:
+      future.cancel()
+    executor.shutdown(wait=False)
+
+
+async def async_embed_content_bulk(
+    embed_content: Callable[..., Awaitable[types.EmbedContentResponse]],
+    api_client: _api_client.BaseApiClient,
+    *,
+    model: str,
+    contents: Union[Iterable[str], AsyncIterable[str]],
+    config: Optional[types.EmbedContentBulkConfigOrDict],
+) -> AsyncIterator[types.ContentEmbedding]:
+  """Embeds the texts in batches sent as concurrent tasks, for AsyncModels."""
+  options = get_embed_content_bulk_options(api_client, config)
+
+  async def embed(batch: list[str]) -> list[types.ContentEmbedding]:
+    response = await embed_content(
+        model=model, contents=batch, config=options.request_config
+    )
+    return get_batch_embeddings(batch, response)
+
+  pending: collections.deque[asyncio.Task[list[types.ContentEmbedding]]] = (
+      collections.deque()
+  )
+  try:
+    async for batch in async_iter_embed_batches(contents, options):
+      if len(pending) >= options.max_concurrent_requests:
+        for embedding in await pending.popleft():
+          yield embedding
+      pending.append(asyncio.ensure_future(embed(batch)))
+    while pending:
+      for embedding in await pending.popleft():
+        yield embedding
+  finally:
+    for task in pending:
+      task.cancel()
+
+
+def _import_numpy() -> Any:
+  try:
+    import numpy
+  except ImportError as e:
+    raise ImportError(
+        'output_format="numpy" requires numpy. Please install it with'
+        ' `pip install numpy`.'
+    ) from e
+  return numpy
+
+
+def check_embedding_output_format(
+    config: Optional[types.EmbedContentConfig],
+) -> None:
+  """Raises if the embedding values cannot be returned in the output format.
+
+  Called before the request is sent, so that an unsupported
+  `config.output_format` or a missing numpy does not waste the request.
+  """
+  output_format = None if config is None else config.output_format
+  if output_format not in (None, 'list', 'numpy', 'array'):
+    raise ValueError(
+        f'Unsupported output_format: {output_format}. Expected `list`,'
+        ' `numpy` or `array`.'
+    )
+  if output_format == 'numpy':
+    _import_numpy()
+
+
+def pop_embedding_values(
+    response: _common.StringDict,
+    config: Optional[types.EmbedContentConfig],
+) -> Optional[list[Any]]:
+  """Takes the embedding values out of the response as float32 buffers.
+
+  The values are removed from the response, so that they are not validated one
+  by one when the response is parsed. The response is left as it is unless
+  `config.output_format` is `numpy` or `array`, which
+  `check_embedding_output_format` has checked before the request.
+
+  Returns:
+    The values of each embedding, or None if they are kept in the response.
+  """
+  output_format = None if config is None else config.output_format
+  if output_format is None or output_format == 'list':
+    return None
+  embeddings = response.get('embeddings') or []
+  values = [embedding.pop('values', None) for embedding in embeddings]
+  if output_format == 'array':
+    return [None if v is None else array.array('f', v) for v in values]
+  numpy = _import_numpy()
+  if values and all(
+      v is not None and len(v) == len(values[0]) for v in values
+  ):
+    # The embeddings are rows of one contiguous matrix.
+    return list(numpy.asarray(values, dtype=numpy.float32))
+  return [
+      None if v is None else numpy.asarray(v, dtype=numpy.float32)
+      for v in values
+  ]
+
+
+def set_embedding_values(
+    response: types.EmbedContentResponse, values: Optional[list[Any]]
+) -> None:
+  """Sets the buffers returned by pop_embedding_values on the embeddings."""
+  if values is None:
+    return
+  for embedding, values_array in zip(response.embeddings or [], values):
+    embedding.values_array = values_array
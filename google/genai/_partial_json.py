@@ -0,0 +1,221 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Parses JSON documents that arrive in pieces."""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+_STRING_SPECIAL_CHARS = re.compile(r'["\\]')
+_HIGH_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89abAB][0-9a-fA-F]{2}$')
+
+_Container = Union[list[Any], dict[str, Any]]
+
+
+def _insert(container: _Container, key: Optional[str], value: Any) -> None:
+  if isinstance(container, list):
+    container.append(value)
+  elif key is not None:
+    container[key] = value
+
+
+class PartialJsonParser:
+  """Parses a JSON document that is fed to it in pieces.
+
+  Each piece is scanned once and its complete strings, numbers and literals
+  are added to the document as they end, so the text is never parsed again.
+  `value` returns the document parsed so far: open strings, arrays and
+  objects are closed, and trailing keys, numbers and literals that may still
+  be incomplete are left out. Only the open arrays and objects are copied
+  for it; the values completed earlier are shared between its results.
+
+  Example:
+
+    parser = PartialJsonParser()
+    parser.feed('{"name": "Jo')
+    parser.value  # {'name': 'Jo'}
+    parser.feed('hn", "age": 4')
+    parser.value  # {'name': 'John'}
+    parser.feed('2}')
+    parser.value  # {'name': 'John', 'age': 42}
+  """
+
+  def __init__(self) -> None:
+    self._pieces: list[str] = []
+    self._text = ''
+    # The open arrays and objects, and for each object the key that its
+    # next value goes under.
+    self._stack: list[_Container] = []
+    self._keys: list[Optional[str]] = []
+    self._root: Any = None
+    self._expect_key = False
+    self._in_string = False
+    self._in_key = False
+    # The decoded parts of the open string, and its text not decoded yet.
+    self._string: list[str] = []
+    self._raw = ''
+    # Characters left to consume for the current escape sequence.
+    self._escape = 0
+    self._scalar: list[str] = []
+    # Set when the text is not valid JSON, after which it is not scanned.
+    self._invalid = False
+    self._changed = False
+    self._value: Any = None
+
+  @property
+  def text(self) -> str:
+    """The text fed to the parser so far."""
+    if self._pieces:
+      self._text += ''.join(self._pieces)
+      self._pieces = []
+    return self._text
+
+  @property
+  def value(self) -> Optional[Any]:
+    """The document parsed so far, or None if nothing can be parsed yet."""
+    if not self._changed:
+      return self._value
+    self._changed = False
+    value: Any = None
+    has_value = False
+    if self._in_string and not self._in_key:
+      value, has_value = self._string_value(), True
+    for container, key in zip(reversed(self._stack), reversed(self._keys)):
+      container = container.copy()
+      if has_value:
+        _insert(container, key, value)
+      value, has_value = container, True
+    if has_value:
+      self._value = value
+    elif not self._stack:
+      self._value = self._root
+    return self._value
+
+  def feed(self, piece: str) -> None:
+    """Scans the next piece of the document."""
+    self._pieces.append(piece)
+    if self._invalid or not piece:
+      return
+    self._changed = True
+    self._scan(piece)
+    if self._in_string:
+      self._decode_string()
+
+  def _add(self, value: Any) -> None:
+    if not self._stack:
+      self._root = value
+      return
+    _insert(self._stack[-1], self._keys[-1], value)
+    self._keys[-1] = None
+
+  def _end_scalar(self) -> None:
+    if not self._scalar:
+      return
+    token = ''.join(self._scalar)
+    self._scalar = []
+    try:
+      self._add(json.loads(token))
+    except json.JSONDecodeError:
+      self._invalid = True
+
+  def _decode_string(self, force: bool = False) -> None:
+    """Decodes the text of the open string that forms whole characters.
+
+    A high surrogate escape is kept until the escape that may follow it, so
+    that the pair decodes to one character.
+    """
+    if not self._raw or self._escape:
+      return
+    if not force and _HIGH_SURROGATE_ESCAPE.search(self._raw):
+      return
+    try:
+      self._string.append(json.loads(f'"{self._raw}"', strict=False))
+    except json.JSONDecodeError:
+      self._invalid = True
+    self._raw = ''
+
+  def _string_value(self) -> str:
+    if len(self._string) > 1:
+      self._string = [''.join(self._string)]
+    return self._string[0] if self._string else ''
+
+  def _scan(self, piece: str) -> None:
+    i = 0
+    while i < len(piece) and not self._invalid:
+      if self._in_string:
+        i = self._scan_string(piece, i)
+        continue
+      c = piece[i]
+      if c in ' \t\r\n':
+        self._end_scalar()
+      elif c == '"':
+        self._end_scalar()
+        self._in_string = True
+        self._in_key = self._expect_key
+      elif c in '{[':
+        self._end_scalar()
+        self._stack.append({} if c == '{' else [])
+        self._keys.append(None)
+        self._expect_key = c == '{'
+      elif c in '}]':
+        self._end_scalar()
+        if self._stack:
+          container = self._stack.pop()
+          self._keys.pop()
+          self._add(container)
+        self._expect_key = False
+      elif c == ',':
+        self._end_scalar()
+        self._expect_key = bool(self._stack) and isinstance(
+            self._stack[-1], dict
+        )
+      elif c == ':':
+        self._end_scalar()
+        self._expect_key = False
+      else:
+        # Numbers, true, false and null are only complete once the next
+        # delimiter arrives.
+        self._scalar.append(c)
+      i += 1
+
+  def _scan_string(self, piece: str, i: int) -> int:
+    """Scans string contents from piece[i] and returns where to continue."""
+    if self._escape:
+      if self._escape == 1 and piece[i] == 'u':
+        self._escape = 4
+      else:
+        self._escape -= 1
+      self._raw += piece[i]
+      return i + 1
+    match = _STRING_SPECIAL_CHARS.search(piece, i)
+    end = len(piece) if match is None else match.start()
+    self._raw += piece[i:end]
+    if match is None:
+      return end
+    if match.group() == '\\':
+      self._decode_string()
+      self._raw += '\\'
+      self._escape = 1
+      return end + 1
+    self._decode_string(force=True)
+    string = self._string_value()
+    self._string = []
+    self._in_string = False
+    if self._in_key:
+      self._keys[-1] = string
+    else:
+      self._add(string)
+    return end + 1
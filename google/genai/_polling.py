@@ -0,0 +1,206 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Polls batch jobs and operations until they are done."""
+
+import asyncio
+import concurrent.futures
+import heapq
+import time
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, Sequence, TypeVar
+
+from . import types
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_DEFAULT_INITIAL_INTERVAL = 5.0
+_DEFAULT_MAX_INTERVAL = 60.0
+_DEFAULT_MULTIPLIER = 1.5
+_DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+# Paused jobs do not resume on their own.
+_DONE_JOB_STATES = frozenset([
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    types.JobState.JOB_STATE_PAUSED,
+])
+
+
+def get_wait_config(
+    config: Optional[types.WaitConfigOrDict],
+) -> types.WaitConfig:
+  if isinstance(config, dict):
+    return types.WaitConfig.model_validate(config)
+  return config or types.WaitConfig()
+
+
+def is_batch_job_done(batch_job: types.BatchJob) -> bool:
+  return batch_job.state in _DONE_JOB_STATES
+
+
+def is_operation_done(operation: types.Operation) -> bool:
+  return bool(operation.done)
+
+
+class _Schedule:
+  """When to poll each job next, with the interval growing on every poll.
+
+  All the jobs are due at once to begin with.
+  """
+
+  def __init__(self, count: int, config: types.WaitConfig) -> None:
+    self._initial_interval = (
+        _DEFAULT_INITIAL_INTERVAL
+        if config.initial_interval is None
+        else config.initial_interval
+    )
+    self._max_interval = (
+        _DEFAULT_MAX_INTERVAL
+        if config.max_interval is None
+        else config.max_interval
+    )
+    self._multiplier = (
+        _DEFAULT_MULTIPLIER if config.multiplier is None else config.multiplier
+    )
+    self._intervals = [self._initial_interval] * count
+    now = time.monotonic()
+    # (due time, index) pairs.
+    self._due: list[tuple[float, int]] = [(now, i) for i in range(count)]
+    self._deadline = (
+        None if config.timeout is None else now + config.timeout
+    )
+    self._timed_out = False
+    self.max_concurrent_requests = (
+        config.max_concurrent_requests or _DEFAULT_MAX_CONCURRENT_REQUESTS
+    )
+
+  def __bool__(self) -> bool:
+    return bool(self._due)
+
+  def wait_time(self) -> float:
+    """Returns how long to wait for the next poll, in seconds.
+
+    Raises:
+      TimeoutError: A job is still not done when polled at the deadline.
+    """
+    if self._timed_out:
+      raise TimeoutError(
+          f'{len(self._due)} jobs are still not done after the timeout.'
+      )
+    return max(0.0, self._due[0][0] - time.monotonic())
+
+  def pop_due(self) -> list[int]:
+    """Returns the jobs to poll now, removing them from the schedule."""
+    now = time.monotonic()
+    due = []
+    while self._due and self._due[0][0] <= now:
+      due.append(heapq.heappop(self._due)[1])
+    return due
+
+  def reschedule(self, index: int) -> None:
+    """Schedules the next poll of a job that is not done yet."""
+    interval = self._intervals[index]
+    now = time.monotonic()
+    due = now + interval
+    if self._deadline is not None:
+      # Poll one last time at the deadline.
+      due = min(due, self._deadline)
+      self._timed_out = self._timed_out or now >= self._deadline
+    heapq.heappush(self._due, (due, index))
+    self._intervals[index] = min(
+        self._max_interval, interval * self._multiplier
+    )
+
+
+def poll(
+    keys: Sequence[K],
+    get: Callable[[K], V],
+    is_done: Callable[[V], bool],
+    config: types.WaitConfig,
+) -> Iterator[V]:
+  """Polls the jobs with `get` and yields them as they are done.
+
+  The jobs that are due are polled concurrently, and each job is then polled
+  less often, with exponential backoff.
+
+  Raises:
+    TimeoutError: The jobs are not all done before `config.timeout`.
+  """
+  schedule = _Schedule(len(keys), config)
+  with concurrent.futures.ThreadPoolExecutor(
+      max_workers=schedule.max_concurrent_requests
+  ) as executor:
+    while schedule:
+      wait = schedule.wait_time()
+      if wait > 0:
+        time.sleep(wait)
+      futures = {
+          executor.submit(get, keys[index]): index
+          for index in schedule.pop_due()
+      }
+      try:
+        for future in concurrent.futures.as_completed(futures):
+          value = future.result()
+          if is_done(value):
+            yield value
+          else:
+            schedule.reschedule(futures[future])
+      finally:
+        for future in futures:
+          future.cancel()
+
+
+async def async_poll(
+    keys: Sequence[K],
+    get: Callable[[K], Awaitable[V]],
+    is_done: Callable[[V], bool],
+    config: types.WaitConfig,
+) -> AsyncIterator[V]:
+  """Polls the jobs with `get` and yields them as they are done.
+
+  The jobs that are due are polled concurrently, and each job is then polled
+  less often, with exponential backoff.
+
+  Raises:
+    TimeoutError: The jobs are not all done before `config.timeout`.
+  """
+  schedule = _Schedule(len(keys), config)
+  semaphore = asyncio.Semaphore(schedule.max_concurrent_requests)
+
+  async def poll_one(index: int) -> tuple[int, V]:
+    async with semaphore:
+      return index, await get(keys[index])
+
+  while schedule:
+    wait = schedule.wait_time()
+    if wait > 0:
+      await asyncio.sleep(wait)
+    tasks = [
+        asyncio.ensure_future(poll_one(index))
+        for index in schedule.pop_due()
+    ]
+    try:
+      for next_done in asyncio.as_completed(tasks):
+        index, value = await next_done
+        if is_done(value):
+          yield value
+        else:
+          schedule.reschedule(index)
+    finally:
+      for task in tasks:
+        task.cancel()
@@ -0,0 +1,275 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client-side rate limiting of the requests sent to the API."""
+
+import asyncio
+import contextlib
+import datetime
+import email.utils
+import math
+import re
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Iterator, Optional
+
+from . import errors
+from .types import HttpRateLimitOptions
+
+# Matches the model and the method in request URLs such as
+# `v1beta/models/gemini-2.0-flash:generateContent`.
+_MODEL_METHOD_PATTERN = re.compile(r'models/([^/:?]+):(\w+)')
+# Methods that share a quota with another method.
+_METHOD_ALIASES = {'streamGenerateContent': 'generateContent'}
+_RETRY_INFO_TYPE = 'type.googleapis.com/google.rpc.RetryInfo'
+_DURATION_PATTERN = re.compile(r'^(\d+(?:\.\d*)?)s$')
+# The adaptive rate is halved on every 429 but does not drop below this
+# fraction of the configured rate, and recovers by this fraction of the
+# configured rate on every success.
+_MIN_RATE_FRACTION = 0.1
+_RATE_RECOVERY_FRACTION = 0.05
+
+
+def _get_retry_after_header(error: errors.APIError) -> Optional[str]:
+  headers = getattr(error.response, 'headers', None)
+  if not headers:
+    return None
+  for key, value in headers.items():
+    if key.lower() == 'retry-after':
+      return str(value)
+  return None
+
+
+def retry_delay(error: errors.APIError) -> Optional[float]:
+  """Returns the delay the API asked for before retrying, in seconds.
+
+  The delay comes from the `Retry-After` response header, either in seconds or
+  as an HTTP date, or from the `RetryInfo` error detail.
+
+  Args:
+    error: The error returned by the API.
+
+  Returns:
+    The delay in seconds, or None if the API did not ask for one.
+  """
+  retry_after = _get_retry_after_header(error)
+  if retry_after:
+    try:
+      return max(0.0, float(retry_after))
+    except ValueError:
+      pass
+    try:
+      retry_date = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+      retry_date = None
+    if retry_date is not None:
+      if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+      now = datetime.datetime.now(datetime.timezone.utc)
+      return max(0.0, (retry_date - now).total_seconds())
+
+  details = error.details if isinstance(error.details, dict) else {}
+  error_details = details.get('error', details).get('details')
+  if isinstance(error_details, list):
+    for detail in error_details:
+      if not isinstance(detail, dict):
+        continue
+      if detail.get('@type') != _RETRY_INFO_TYPE:
+        continue
+      match = _DURATION_PATTERN.match(str(detail.get('retryDelay', '')))
+      if match:
+        return float(match.group(1))
+  return None
+
+
+class _Limit:
+  """Token bucket and concurrency limit for one model and method."""
+
+  def __init__(self, options: HttpRateLimitOptions) -> None:
+    self._lock = threading.Lock()
+    self._max_rate: Optional[float] = None
+    if options.requests_per_minute:
+      self._max_rate = options.requests_per_minute / 60
+    self._rate = self._max_rate
+    self._adaptive = options.adaptive is not False
+    self._capacity = float(
+        options.burst
+        if options.burst
+        else max(1, math.ceil(self._max_rate or 1))
+    )
+    self._tokens = self._capacity
+    self._updated = time.monotonic()
+    self._paused_until = 0.0
+    self._max_concurrent_requests = options.max_concurrent_requests
+    self._semaphore: Optional[threading.BoundedSemaphore] = None
+    if self._max_concurrent_requests:
+      self._semaphore = threading.BoundedSemaphore(
+          self._max_concurrent_requests
+      )
+    # asyncio primitives are bound to the loop that first waits on them, so
+    # each running loop gets its own semaphore.
+    self._async_semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = weakref.WeakKeyDictionary()
+
+  @property
+  def rate(self) -> Optional[float]:
+    """The current rate, in requests per second."""
+    return self._rate
+
+  def async_semaphore(self) -> Optional[asyncio.Semaphore]:
+    """Returns the semaphore of the running event loop, if limited."""
+    if not self._max_concurrent_requests:
+      return None
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      semaphore = self._async_semaphores.get(loop)
+      if semaphore is None:
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        self._async_semaphores[loop] = semaphore
+      return semaphore
+
+  def semaphore(self) -> Optional[threading.BoundedSemaphore]:
+    return self._semaphore
+
+  def reserve(self) -> float:
+    """Takes a token and returns how long to wait before sending, in seconds.
+
+    Tokens are taken in advance: when the bucket is empty, the token count
+    goes negative, so that concurrent callers wait in turn.
+    """
+    with self._lock:
+      now = time.monotonic()
+      wait = self._paused_until - now
+      if self._rate is not None:
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+          wait = max(wait, -self._tokens / self._rate)
+      return max(0.0, wait)
+
+  def record_success(self) -> None:
+    with self._lock:
+      if self._rate is not None and self._max_rate is not None:
+        self._rate = min(
+            self._max_rate,
+            self._rate + self._max_rate * _RATE_RECOVERY_FRACTION,
+        )
+
+  def record_error(self, error: errors.APIError) -> None:
+    if error.code != 429:
+      return
+    delay = retry_delay(error)
+    with self._lock:
+      now = time.monotonic()
+      if delay is not None:
+        self._paused_until = max(self._paused_until, now + delay)
+      if self._rate is not None and self._max_rate is not None:
+        # Requests sent after the pause do not burst.
+        self._tokens = min(self._tokens, 0.0)
+        if self._adaptive:
+          self._rate = max(
+              self._max_rate * _MIN_RATE_FRACTION, self._rate / 2
+          )
+
+
+class RateLimiter:
+  """Limits the rate and concurrency of the requests sent to models.
+
+  Requests are limited separately for each model and method, for example
+  `generateContent` on `gemini-2.0-flash`. Requests that do not target a
+  model method are not limited. When the API returns 429, the limiter pauses
+  the requests for the delay the API asked for and, if adaptive, halves the
+  rate, which then recovers as requests succeed.
+
+  The sync and async requests of a client each get `max_concurrent_requests`.
+  """
+
+  def __init__(self, options: HttpRateLimitOptions) -> None:
+    self._options = options
+    self._methods = (
+        None
+        if options.methods is None
+        else {_METHOD_ALIASES.get(m, m) for m in options.methods}
+    )
+    self._limits: dict[tuple[str, str], _Limit] = {}
+    self._lock = threading.Lock()
+
+  def get_limit(self, url: str) -> Optional[_Limit]:
+    """Returns the limit for the model method requested by the url."""
+    match = _MODEL_METHOD_PATTERN.search(url)
+    if match is None:
+      return None
+    model, method = match.groups()
+    method = _METHOD_ALIASES.get(method, method)
+    if self._methods is not None and method not in self._methods:
+      return None
+    with self._lock:
+      limit = self._limits.get((model, method))
+      if limit is None:
+        limit = self._limits[(model, method)] = _Limit(self._options)
+      return limit
+
+  @contextlib.contextmanager
+  def limit(self, url: str) -> Iterator[None]:
+    """Waits until a request to the url can be sent."""
+    limit = self.get_limit(url)
+    if limit is None:
+      yield
+      return
+    semaphore = limit.semaphore()
+    if semaphore is not None:
+      semaphore.acquire()
+    try:
+      wait = limit.reserve()
+      if wait > 0:
+        time.sleep(wait)
+      try:
+        yield
+      except errors.APIError as e:
+        limit.record_error(e)
+        raise
+      limit.record_success()
+    finally:
+      if semaphore is not None:
+        semaphore.release()
+
+  @contextlib.asynccontextmanager
+  async def async_limit(self, url: str) -> AsyncIterator[None]:
+    """Waits until a request to the url can be sent."""
+    limit = self.get_limit(url)
+    if limit is None:
+      yield
+      return
+    semaphore = limit.async_semaphore()
+    if semaphore is not None:
+      await semaphore.acquire()
+    try:
+      wait = limit.reserve()
+      if wait > 0:
+        await asyncio.sleep(wait)
+      try:
+        yield
+      except errors.APIError as e:
+        limit.record_error(e)
+        raise
+      limit.record_success()
+    finally:
+      if semaphore is not None:
+        semaphore.release()
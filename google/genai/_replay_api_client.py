@@ -30,7 +30,10 @@ import google.auth
 from requests.exceptions import HTTPError
 
 from . import errors
+from ._api_client import _async_open_download_sink
+from ._api_client import _open_download_sink
 from ._api_client import BaseApiClient
+from ._api_client import DownloadDestination
 from ._api_client import HttpRequest
 from ._api_client import HttpResponse
 from ._common import BaseModel
@@ -215,6 +218,14 @@ class ReplayRequest(BaseModel):
   body_segments: list[dict[str, object]]
 
 
+class ReplayTiming(BaseModel):
+  """Timings of a recorded response, in seconds since the request was sent."""
+
+  ttfb: float
+  latency: float
+  segment_offsets: Optional[list[float]] = None
+
+
 class ReplayResponse(BaseModel):
   """Represents a single response in a replay."""
 
@@ -223,6 +234,7 @@ class ReplayResponse(BaseModel):
   body_segments: list[dict[str, object]]
   byte_segments: Optional[list[bytes]] = None
   sdk_response_segments: list[dict[str, object]]
+  timing: Optional[ReplayTiming] = None
 
   def model_post_init(self, __context: Any) -> None:
     pop_undeterministic_headers(self.headers)
@@ -543,6 +555,9 @@ class ReplayApiClient(BaseApiClient):
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     if isinstance(file_path, io.IOBase):
       offset = file_path.tell()
@@ -562,7 +577,13 @@ class ReplayApiClient(BaseApiClient):
       result: Union[str, HttpResponse]
       try:
         result = super().upload_file(
-            file_path, upload_url, upload_size, http_options=http_options
+            file_path,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            resume=resume,
+            read_ahead=read_ahead,
         )
       except HTTPError as e:
         result = HttpResponse(
@@ -582,6 +603,9 @@ class ReplayApiClient(BaseApiClient):
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      read_ahead: bool = False,
   ) -> HttpResponse:
     if isinstance(file_path, io.IOBase):
       offset = file_path.tell()
@@ -601,7 +625,13 @@ class ReplayApiClient(BaseApiClient):
       result: HttpResponse
       try:
         result = await super().async_upload_file(
-            file_path, upload_url, upload_size, http_options=http_options
+            file_path,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            resume=resume,
+            read_ahead=read_ahead,
         )
       except HTTPError as e:
         result = HttpResponse(
@@ -635,6 +665,19 @@ class ReplayApiClient(BaseApiClient):
     else:
       return self._build_response_from_replay(request).byte_stream[0]
 
+  def download_file_to(
+      self,
+      path: str,
+      destination: DownloadDestination,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      resume: bool = False,
+  ) -> None:
+    # Recorded and replayed as a whole file download.
+    data: bytes = self.download_file(path, http_options=http_options)  # type: ignore[assignment]
+    with _open_download_sink(destination, append=False) as write:
+      write(data)
+
   async def async_download_file(
       self, path: str, *, http_options: Optional[HttpOptionsOrDict] = None
   ) -> Any:
@@ -657,3 +700,16 @@ class ReplayApiClient(BaseApiClient):
       return result
     else:
       return self._build_response_from_replay(request).byte_stream[0]
+
+  async def async_download_file_to(
+      self,
+      path: str,
+      destination: DownloadDestination,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      resume: bool = False,
+  ) -> None:
+    # Recorded and replayed as a whole file download.
+    data = await self.async_download_file(path, http_options=http_options)
+    async with _async_open_download_sink(destination, append=False) as write:
+      await write(data)
@@ -0,0 +1,455 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""HTTP transports that record and replay responses, for load tests.
+
+Unlike the replay client, the replay transport looks the recorded responses
+up by the hash of the request, so requests can come in any order and from
+many concurrent callers, and it can pace the responses by their recorded
+timings. Both transports work with the sync and async httpx clients:
+
+  transport = ReplayTransport(ReplayIndex.load('recordings/'))
+  client = Client(
+      api_key='...',
+      http_options={
+          'client_args': {'transport': transport},
+          'async_client_args': {'transport': transport},
+      },
+  )
+
+Setting the async transport also makes the async requests go through httpx
+rather than aiohttp.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+import httpx
+
+from . import _response_cache
+from ._api_client import _ResponseStreamFramer
+from ._replay_api_client import _normalize_json_case
+from ._replay_api_client import _redact_request_body
+from ._replay_api_client import _redact_request_headers
+from ._replay_api_client import _redact_request_url
+from ._replay_api_client import ReplayFile
+from ._replay_api_client import ReplayInteraction
+from ._replay_api_client import ReplayRequest
+from ._replay_api_client import ReplayResponse
+from ._replay_api_client import ReplayTiming
+
+# Matches the base URLs that the replay client does not redact, such as
+# `https://proxy.example.com/genai/v1beta`, up to the API version.
+_CUSTOM_BASE_URL_PATTERN = re.compile(
+    r'^[a-z]+://[^/]+(?:/[^?]*?)?/v\d+\w*(?=/)'
+)
+# Headers that describe how the recorded body was sent rather than the body
+# that is replayed.
+_ENCODING_HEADERS = frozenset(
+    ['content-encoding', 'content-length', 'transfer-encoding']
+)
+
+
+def _request_body(content: bytes) -> dict[str, object]:
+  """Returns the JSON body of a request, or the hash of a binary body."""
+  if not content:
+    return {}
+  try:
+    body = json.loads(content)
+  except ValueError:
+    body = None
+  if isinstance(body, dict):
+    return body
+  return {'sha256': hashlib.sha256(content).hexdigest()}
+
+
+def _redact_url(url: str) -> str:
+  """Redacts the base URL, including custom ones, up to the API version."""
+  return _CUSTOM_BASE_URL_PATTERN.sub(
+      '{MLDEV_URL_PREFIX}', _redact_request_url(url)
+  )
+
+
+def _request_key(method: str, url: str, body: dict[str, object]) -> str:
+  """Returns the hash of a request, after redacting what varies by project."""
+  redacted_body = dict(body)
+  _redact_request_body(redacted_body)
+  return _response_cache.cache_key(
+      method, _redact_url(url), _normalize_json_case(redacted_body)
+  )
+
+
+def _is_streamed(url: str) -> bool:
+  return 'alt=sse' in url
+
+
+@dataclass
+class _Reply:
+  """A recorded response, encoded once to be replayed many times."""
+
+  status_code: int
+  headers: list[tuple[str, str]]
+  chunks: list[bytes]
+  # Seconds before the response headers and before each chunk.
+  ttfb: float
+  delays: list[float]
+
+
+def _reply(interaction: ReplayInteraction) -> _Reply:
+  response = interaction.response
+  if _is_streamed(interaction.request.url):
+    chunks = [
+        b'data: ' + json.dumps(segment).encode('utf-8') + b'\r\n\r\n'
+        for segment in response.body_segments
+    ]
+  elif response.body_segments and response.body_segments != [{}]:
+    chunks = [json.dumps(response.body_segments[0]).encode('utf-8')]
+  else:
+    chunks = list(response.byte_segments or [])
+
+  timing = response.timing
+  if timing is None:
+    return _Reply(
+        status_code=response.status_code,
+        headers=_replayed_headers(response.headers),
+        chunks=chunks,
+        ttfb=0.0,
+        delays=[0.0] * len(chunks),
+    )
+  offsets = timing.segment_offsets
+  if offsets is None or len(offsets) != len(chunks):
+    offsets = [timing.latency] * len(chunks)
+  delays = []
+  previous = timing.ttfb
+  for offset in offsets:
+    delays.append(max(0.0, offset - previous))
+    previous = max(previous, offset)
+  return _Reply(
+      status_code=response.status_code,
+      headers=_replayed_headers(response.headers),
+      chunks=chunks,
+      ttfb=timing.ttfb,
+      delays=delays,
+  )
+
+
+def _replayed_headers(headers: dict[str, str]) -> list[tuple[str, str]]:
+  return [
+      (key, value)
+      for key, value in headers.items()
+      if key.lower() not in _ENCODING_HEADERS
+  ]
+
+
+class _ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+  """Yields the chunks of a recorded response, after their delays."""
+
+  def __init__(self, chunks: list[bytes], delays: list[float]) -> None:
+    self._chunks = chunks
+    self._delays = delays
+
+  def __iter__(self) -> Iterator[bytes]:
+    for chunk, delay in zip(self._chunks, self._delays):
+      if delay > 0:
+        time.sleep(delay)
+      yield chunk
+
+  async def __aiter__(self) -> AsyncIterator[bytes]:
+    for chunk, delay in zip(self._chunks, self._delays):
+      if delay > 0:
+        await asyncio.sleep(delay)
+      yield chunk
+
+
+class ReplayIndex:
+  """Recorded interactions, looked up by the hash of their request.
+
+  The requests are matched by method, URL and body, with the parts that vary
+  by project and the key case normalized as in the replay client. Headers
+  are not matched. When the same request was recorded several times, for
+  example to poll an operation, the recorded responses are replayed in turn.
+  """
+
+  def __init__(self, interactions: Iterable[ReplayInteraction] = ()) -> None:
+    self._replies: dict[str, list[_Reply]] = {}
+    self._next_reply: dict[str, int] = {}
+    self._lock = threading.Lock()
+    for interaction in interactions:
+      self.add(interaction)
+
+  def __len__(self) -> int:
+    return sum(len(replies) for replies in self._replies.values())
+
+  @classmethod
+  def load(cls, path: str) -> 'ReplayIndex':
+    """Loads the replay files (`.json`) and recordings (`.jsonl`) at a path.
+
+    Args:
+      path: A file, or a directory to search for files.
+
+    Returns:
+      The index of the interactions in the files.
+    """
+    if os.path.isdir(path):
+      file_paths = sorted(
+          os.path.join(directory, name)
+          for directory, _, names in os.walk(path)
+          for name in names
+          if name.endswith(('.json', '.jsonl'))
+      )
+    else:
+      file_paths = [path]
+    index = cls()
+    for file_path in file_paths:
+      with open(file_path, 'r') as f:
+        if file_path.endswith('.jsonl'):
+          for line in f:
+            if line.strip():
+              index.add(ReplayInteraction.model_validate_json(line))
+        else:
+          for interaction in ReplayFile.model_validate_json(
+              f.read()
+          ).interactions:
+            index.add(interaction)
+    return index
+
+  def add(self, interaction: ReplayInteraction) -> None:
+    request = interaction.request
+    body = request.body_segments[0] if request.body_segments else {}
+    key = _request_key(request.method, request.url, body)
+    reply = _reply(interaction)
+    with self._lock:
+      self._replies.setdefault(key, []).append(reply)
+
+  def find(self, request: httpx.Request, content: bytes) -> _Reply:
+    """Returns the next recorded response to a request.
+
+    Raises:
+      ValueError: The request was not recorded.
+    """
+    key = _request_key(request.method, str(request.url), _request_body(content))
+    with self._lock:
+      replies = self._replies.get(key)
+      if not replies:
+        raise ValueError(
+            f'No recorded response for {request.method} {request.url}.'
+        )
+      index = self._next_reply.get(key, 0)
+      self._next_reply[key] = (index + 1) % len(replies)
+    return replies[index]
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+  """Sends the recorded responses instead of calling the API.
+
+  If `simulate_timing` is set, the responses are paced by their recorded
+  time to first byte and the arrival of each streamed chunk, scaled by
+  `time_scale`.
+  """
+
+  def __init__(
+      self,
+      index: ReplayIndex,
+      *,
+      simulate_timing: bool = False,
+      time_scale: float = 1.0,
+  ) -> None:
+    self._index = index
+    self._time_scale = time_scale if simulate_timing else 0.0
+
+  def _response(self, reply: _Reply) -> httpx.Response:
+    return httpx.Response(
+        reply.status_code,
+        headers=reply.headers,
+        stream=_ReplayStream(
+            reply.chunks,
+            [delay * self._time_scale for delay in reply.delays],
+        ),
+    )
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    reply = self._index.find(request, request.read())
+    if reply.ttfb and self._time_scale:
+      time.sleep(reply.ttfb * self._time_scale)
+    return self._response(reply)
+
+  async def handle_async_request(
+      self, request: httpx.Request
+  ) -> httpx.Response:
+    reply = self._index.find(request, await request.aread())
+    if reply.ttfb and self._time_scale:
+      await asyncio.sleep(reply.ttfb * self._time_scale)
+    return self._response(reply)
+
+
+class _ResponseRecorder:
+  """Collects the body of a response and when its segments arrived."""
+
+  def __init__(self, streamed: bool, start: float) -> None:
+    self._start = start
+    self._framer = _ResponseStreamFramer() if streamed else None
+    self.body = bytearray()
+    self.segments: list[dict[str, object]] = []
+    self.segment_offsets: list[float] = []
+
+  def feed(self, chunk: bytes) -> None:
+    self.body += chunk
+    if self._framer is not None:
+      self._add_segments(self._framer.feed(chunk))
+
+  def flush(self) -> None:
+    if self._framer is not None:
+      self._add_segments(self._framer.flush())
+
+  def _add_segments(self, frames: list[str]) -> None:
+    offset = time.monotonic() - self._start
+    for frame in frames:
+      self.segments.append(json.loads(frame))
+      self.segment_offsets.append(offset)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+  """Sends the requests with another transport and records the responses.
+
+  Each interaction is appended to a JSON Lines file as soon as its response
+  is complete, with its timings, and can be replayed with `ReplayTransport`.
+  The request headers are redacted as in the replay client. The responses
+  are read in full before they are returned.
+  """
+
+  def __init__(
+      self,
+      path: str,
+      *,
+      transport: Optional[httpx.BaseTransport] = None,
+      async_transport: Optional[httpx.AsyncBaseTransport] = None,
+  ) -> None:
+    self._path = path
+    self._transport = transport or httpx.HTTPTransport()
+    self._async_transport = async_transport or httpx.AsyncHTTPTransport()
+    self._lock = threading.Lock()
+
+  def _write(
+      self,
+      request: httpx.Request,
+      response: httpx.Response,
+      recorder: _ResponseRecorder,
+      ttfb: float,
+      latency: float,
+  ) -> httpx.Response:
+    url = str(request.url)
+    body = _request_body(request.content)
+    _redact_request_body(body)
+    segment_offsets = None
+    if _is_streamed(url):
+      body_segments = recorder.segments
+      byte_segments = None
+      segment_offsets = recorder.segment_offsets
+    else:
+      try:
+        response_body = json.loads(recorder.body) if recorder.body else {}
+      except ValueError:
+        response_body = None
+      if isinstance(response_body, dict):
+        body_segments, byte_segments = [response_body], None
+      else:
+        body_segments, byte_segments = [], [bytes(recorder.body)]
+    headers = {
+        key: ', '.join(response.headers.get_list(key))
+        for key in response.headers.keys()
+    }
+    interaction = ReplayInteraction(
+        request=ReplayRequest(
+            method=request.method,
+            url=_redact_url(url),
+            headers=_redact_request_headers(dict(request.headers)),
+            body_segments=[body],
+        ),
+        response=ReplayResponse(
+            status_code=response.status_code,
+            headers=headers,
+            body_segments=body_segments,
+            byte_segments=byte_segments,
+            sdk_response_segments=[],
+            timing=ReplayTiming(
+                ttfb=ttfb, latency=latency, segment_offsets=segment_offsets
+            ),
+        ),
+    )
+    line = interaction.model_dump_json(exclude_none=True) + '\n'
+    with self._lock:
+      with open(self._path, 'a') as f:
+        f.write(line)
+    return httpx.Response(
+        response.status_code,
+        headers=_replayed_headers(headers),
+        content=bytes(recorder.body),
+        request=request,
+    )
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    request.read()
+    start = time.monotonic()
+    response = self._transport.handle_request(request)
+    ttfb = time.monotonic() - start
+    # Wraps the raw stream so that the body is decoded.
+    response = httpx.Response(
+        response.status_code, headers=response.headers, stream=response.stream
+    )
+    recorder = _ResponseRecorder(_is_streamed(str(request.url)), start)
+    try:
+      for chunk in response.iter_bytes():
+        recorder.feed(chunk)
+    finally:
+      response.close()
+    recorder.flush()
+    return self._write(
+        request, response, recorder, ttfb, time.monotonic() - start
+    )
+
+  async def handle_async_request(
+      self, request: httpx.Request
+  ) -> httpx.Response:
+    await request.aread()
+    start = time.monotonic()
+    response = await self._async_transport.handle_async_request(request)
+    ttfb = time.monotonic() - start
+    # Wraps the raw stream so that the body is decoded.
+    response = httpx.Response(
+        response.status_code, headers=response.headers, stream=response.stream
+    )
+    recorder = _ResponseRecorder(_is_streamed(str(request.url)), start)
+    try:
+      async for chunk in response.aiter_bytes():
+        recorder.feed(chunk)
+    finally:
+      await response.aclose()
+    recorder.flush()
+    return self._write(
+        request, response, recorder, ttfb, time.monotonic() - start
+    )
+
+  def close(self) -> None:
+    self._transport.close()
+
+  async def aclose(self) -> None:
+    await self._async_transport.aclose()
@@ -0,0 +1,317 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client-side cache of the responses to deterministic model requests."""
+
+import abc
+import collections
+from dataclasses import dataclass
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional, Union
+
+import anyio
+
+from .types import HttpCacheOptions
+from .types import HttpResponse as SdkHttpResponse
+
+# Matches the method in request URLs such as
+# `v1beta/models/gemini-2.0-flash:generateContent`.
+_MODEL_METHOD_PATTERN = re.compile(r'models/[^/:?]+:(\w+)')
+_DEFAULT_METHODS = frozenset(
+    ['generateContent', 'embedContent', 'batchEmbedContents', 'countTokens']
+)
+# Methods whose responses are only deterministic at temperature 0.
+_SAMPLED_METHODS = frozenset(['generateContent'])
+_DEFAULT_MAX_ENTRIES = 1000
+# Headers that change between identical requests. The credentials they carry
+# are part of the key through the client identity instead.
+_UNKEYED_HEADERS = frozenset(['authorization'])
+
+
+def cache_key(
+    method: str,
+    url: str,
+    body: dict[str, object],
+    headers: Optional[dict[str, str]] = None,
+    identity: Optional[str] = None,
+) -> str:
+  """Returns the hash of a request, with the body keys in canonical order."""
+  keyed_headers = {
+      key.lower(): value
+      for key, value in (headers or {}).items()
+      if key.lower() not in _UNKEYED_HEADERS
+  }
+  canonical = json.dumps(
+      [method.upper(), url, body, keyed_headers, identity],
+      sort_keys=True,
+      separators=(',', ':'),
+      ensure_ascii=False,
+  )
+  return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def client_identity(
+    api_key: Optional[str], project: Optional[str], location: Optional[str]
+) -> str:
+  """Returns a hash identifying the account a client sends requests for."""
+  identity = json.dumps([api_key, project, location])
+  return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+def _is_deterministic(body: dict[str, object]) -> bool:
+  generation_config = body.get('generationConfig')
+  if not isinstance(generation_config, dict):
+    return False
+  temperature = generation_config.get('temperature')
+  return temperature is not None and temperature == 0
+
+
+@dataclass
+class _Entry:
+  headers: dict[str, str]
+  body: str
+  size: int
+  expires_at: Optional[float]
+
+  def response(self) -> SdkHttpResponse:
+    return SdkHttpResponse(headers=dict(self.headers), body=self.body)
+
+
+class ResponseCache(abc.ABC):
+  """Stores the responses to model requests by the hash of the request.
+
+  Subclasses implement `get` and `set`. The async methods call them directly
+  unless overridden, which suits backends that do not block.
+  """
+
+  def __init__(self, options: HttpCacheOptions) -> None:
+    self._ttl = options.ttl
+    self._max_entries = (
+        _DEFAULT_MAX_ENTRIES
+        if options.max_entries is None
+        else options.max_entries
+    )
+    self._max_size_bytes = options.max_size_bytes
+    self._methods = (
+        _DEFAULT_METHODS if options.methods is None else set(options.methods)
+    )
+
+  def get_key(
+      self,
+      method: str,
+      url: str,
+      body: Union[dict[str, object], bytes],
+      headers: dict[str, str],
+      identity: str,
+  ) -> Optional[str]:
+    """Returns the cache key of a request, or None if it is not cacheable.
+
+    Args:
+      method: The HTTP method.
+      url: The request URL, which includes the model.
+      body: The request body.
+      headers: The request headers.
+      identity: Identifies the account the request is sent for, such as the
+        API key or the project and location, so that a shared cache does not
+        return the responses of one account to another.
+    """
+    if method.lower() != 'post' or not isinstance(body, dict):
+      return None
+    match = _MODEL_METHOD_PATTERN.search(url)
+    if match is None or match.group(1) not in self._methods:
+      return None
+    if match.group(1) in _SAMPLED_METHODS and not _is_deterministic(body):
+      return None
+    return cache_key(method, url, body, headers, identity)
+
+  def _entry(self, response: SdkHttpResponse, now: float) -> _Entry:
+    body = response.body or ''
+    return _Entry(
+        headers=dict(response.headers or {}),
+        body=body,
+        size=len(body.encode('utf-8')),
+        expires_at=None if self._ttl is None else now + self._ttl,
+    )
+
+  @abc.abstractmethod
+  def get(self, key: str) -> Optional[SdkHttpResponse]:
+    """Returns the cached response, or None if there is none or it expired."""
+
+  @abc.abstractmethod
+  def set(self, key: str, response: SdkHttpResponse) -> None:
+    """Caches a response, evicting the least recently used ones if full."""
+
+  async def async_get(self, key: str) -> Optional[SdkHttpResponse]:
+    return self.get(key)
+
+  async def async_set(self, key: str, response: SdkHttpResponse) -> None:
+    self.set(key, response)
+
+
+class InMemoryResponseCache(ResponseCache):
+  """Least recently used cache of the responses, kept in memory."""
+
+  def __init__(self, options: HttpCacheOptions) -> None:
+    super().__init__(options)
+    self._entries: collections.OrderedDict[str, _Entry] = (
+        collections.OrderedDict()
+    )
+    self._size = 0
+    self._lock = threading.Lock()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def _pop(self, key: str) -> None:
+    entry = self._entries.pop(key, None)
+    if entry is not None:
+      self._size -= entry.size
+
+  def get(self, key: str) -> Optional[SdkHttpResponse]:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+        self._pop(key)
+        return None
+      self._entries.move_to_end(key)
+      return entry.response()
+
+  def set(self, key: str, response: SdkHttpResponse) -> None:
+    entry = self._entry(response, time.monotonic())
+    if self._max_size_bytes is not None and entry.size > self._max_size_bytes:
+      return
+    with self._lock:
+      self._pop(key)
+      self._entries[key] = entry
+      self._size += entry.size
+      while len(self._entries) > self._max_entries or (
+          self._max_size_bytes is not None
+          and self._size > self._max_size_bytes
+      ):
+        self._pop(next(iter(self._entries)))
+
+
+class SqliteResponseCache(ResponseCache):
+  """Least recently used cache of the responses, kept in a sqlite database.
+
+  The database can be shared by several processes. Its expiry times are wall
+  clock times, so that they hold across processes.
+  """
+
+  def __init__(self, options: HttpCacheOptions) -> None:
+    if not options.path:
+      raise ValueError('cache_options.path is required for the sqlite backend.')
+    super().__init__(options)
+    self._lock = threading.Lock()
+    self._connection = sqlite3.connect(
+        options.path, check_same_thread=False, isolation_level=None
+    )
+    with self._lock:
+      self._connection.execute(
+          'CREATE TABLE IF NOT EXISTS responses ('
+          'key TEXT PRIMARY KEY, headers TEXT NOT NULL, body TEXT NOT NULL, '
+          'size INTEGER NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)'
+      )
+      self._connection.execute(
+          'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+          'ON responses (accessed_at)'
+      )
+
+  def __len__(self) -> int:
+    with self._lock:
+      (count,) = self._connection.execute(
+          'SELECT COUNT(*) FROM responses'
+      ).fetchone()
+    return int(count)
+
+  def get(self, key: str) -> Optional[SdkHttpResponse]:
+    now = time.time()
+    with self._lock:
+      row = self._connection.execute(
+          'SELECT headers, body, expires_at FROM responses WHERE key = ?',
+          (key,),
+      ).fetchone()
+      if row is None:
+        return None
+      headers, body, expires_at = row
+      if expires_at is not None and expires_at <= now:
+        self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+        return None
+      self._connection.execute(
+          'UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key)
+      )
+    return SdkHttpResponse(headers=json.loads(headers), body=body)
+
+  def set(self, key: str, response: SdkHttpResponse) -> None:
+    now = time.time()
+    entry = self._entry(response, now)
+    if self._max_size_bytes is not None and entry.size > self._max_size_bytes:
+      return
+    with self._lock:
+      self._connection.execute(
+          'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+          (
+              key,
+              json.dumps(entry.headers),
+              entry.body,
+              entry.size,
+              entry.expires_at,
+              now,
+          ),
+      )
+      self._connection.execute(
+          'DELETE FROM responses WHERE expires_at <= ?', (now,)
+      )
+      # The most recently used responses come first, and later rows are
+      # evicted once there are too many of them or they are too large.
+      self._connection.execute(
+          'DELETE FROM responses WHERE key IN ('
+          'SELECT key FROM responses '
+          'ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)',
+          (self._max_entries,),
+      )
+      if self._max_size_bytes is not None:
+        self._connection.execute(
+            'DELETE FROM responses WHERE key IN ('
+            'SELECT key FROM (SELECT key, SUM(size) OVER ('
+            'ORDER BY accessed_at DESC, rowid DESC) AS total FROM responses) '
+            'WHERE total > ?)',
+            (self._max_size_bytes,),
+        )
+
+  async def async_get(self, key: str) -> Optional[SdkHttpResponse]:
+    return await anyio.to_thread.run_sync(self.get, key)
+
+  async def async_set(self, key: str, response: SdkHttpResponse) -> None:
+    await anyio.to_thread.run_sync(self.set, key, response)
+
+
+def create_response_cache(options: HttpCacheOptions) -> ResponseCache:
+  """Returns the cache for the backend in the options."""
+  backend = options.backend or 'memory'
+  if backend == 'memory':
+    return InMemoryResponseCache(options)
+  if backend == 'sqlite':
+    return SqliteResponseCache(options)
+  raise ValueError(
+      f'Unsupported cache backend: {backend}. Use `memory` or `sqlite`.'
+  )
@@ -16,6 +16,7 @@
 """Transformers for Google GenAI SDK."""
 
 import base64
+import copy
 from collections.abc import Iterable, Mapping
 from enum import Enum, EnumMeta
 import inspect
@@ -26,7 +27,8 @@ import sys
 import time
 import types as builtin_types
 import typing
-from typing import Any, GenericAlias, List, Optional, Sequence, Union  # type: ignore[attr-defined]
+from typing import Any, Callable, GenericAlias, List, Optional, Sequence, Union  # type: ignore[attr-defined]
+import weakref
 from ._mcp_utils import mcp_to_gemini_tool
 from ._common import get_value_by_path as getv
 
@@ -829,26 +831,18 @@ def _is_type_dict_str_any(
   )
 
 
-def t_schema(
-    client: Optional[_api_client.BaseApiClient],
-    origin: Union[types.SchemaUnionDict, Any],
-) -> Optional[types.Schema]:
-  if not origin:
-    return None
-  if isinstance(origin, dict) and _is_type_dict_str_any(origin):
-    process_schema(origin, client)
-    return types.Schema.model_validate(origin)
+# Schemas built from pydantic models, enums and typing annotations, keyed on
+# the annotation and on the API flavor. The cached schemas are shared and must
+# not be mutated.
+_schemas: dict[tuple[Any, Optional[bool]], types.Schema] = {}
+_MAX_CACHED_SCHEMAS = 256
+
+
+def _schema_from_annotation(
+    client: Optional[_api_client.BaseApiClient], origin: Any
+) -> types.Schema:
   if isinstance(origin, EnumMeta):
     return _process_enum(origin, client)
-  if isinstance(origin, types.Schema):
-    if dict(origin) == dict(types.Schema()):
-      # response_schema value was coerced to an empty Schema instance because
-      # it did not adhere to the Schema field annotation
-      _raise_for_unsupported_schema_type(origin)
-    schema = origin.model_dump(exclude_unset=True)
-    process_schema(schema, client)
-    return types.Schema.model_validate(schema)
-
   if (
       # in Python 3.9 Generic alias list[int] counts as a type,
       # and breaks issubclass because it's not a class.
@@ -877,6 +871,40 @@ def t_schema(
   raise ValueError(f'Unsupported schema type: {origin}')
 
 
+def t_schema(
+    client: Optional[_api_client.BaseApiClient],
+    origin: Union[types.SchemaUnionDict, Any],
+) -> Optional[types.Schema]:
+  if not origin:
+    return None
+  if isinstance(origin, dict) and _is_type_dict_str_any(origin):
+    # Do not modify the caller's schema.
+    schema = copy.deepcopy(origin)
+    process_schema(schema, client)
+    return types.Schema.model_validate(schema)
+  if isinstance(origin, types.Schema):
+    if dict(origin) == dict(types.Schema()):
+      # response_schema value was coerced to an empty Schema instance because
+      # it did not adhere to the Schema field annotation
+      _raise_for_unsupported_schema_type(origin)
+    schema = origin.model_dump(exclude_unset=True)
+    process_schema(schema, client)
+    return types.Schema.model_validate(schema)
+
+  key = (origin, None if client is None else bool(client.vertexai))
+  try:
+    cached_schema = _schemas.get(key)
+  except TypeError:
+    # Unhashable annotation.
+    return _schema_from_annotation(client, origin)
+  if cached_schema is None:
+    cached_schema = _schema_from_annotation(client, origin)
+    if len(_schemas) >= _MAX_CACHED_SCHEMAS:
+      _schemas.clear()
+    _schemas[key] = cached_schema
+  return cached_schema
+
+
 def t_speech_config(
     origin: Union[types.SpeechConfigUnionDict, Any],
 ) -> Optional[types.SpeechConfig]:
@@ -912,6 +940,37 @@ def t_live_speech_config(
   return speech_config
 
 
+# Function declarations built from Python functions, keyed on the function and
+# on (vertexai, is bound method). A bound method shares the entry of its
+# function since the bound argument is not part of the declaration. The cached
+# declarations are shared and must not be mutated.
+_function_declarations: weakref.WeakKeyDictionary[
+    Callable[..., Any], dict[tuple[bool, bool], types.FunctionDeclaration]
+] = weakref.WeakKeyDictionary()
+_MAX_CACHED_FUNCTIONS = 1024
+
+
+def _function_declaration_from_callable(
+    client: _api_client.BaseApiClient, origin: Callable[..., Any]
+) -> types.FunctionDeclaration:
+  """Returns the cached function declaration of the function or method."""
+  is_method = inspect.ismethod(origin)
+  func = origin.__func__ if is_method else origin  # type: ignore[attr-defined]
+  key = (bool(client.vertexai), is_method)
+  declarations = _function_declarations.get(func)
+  if declarations is None:
+    if len(_function_declarations) >= _MAX_CACHED_FUNCTIONS:
+      _function_declarations.clear()
+    declarations = _function_declarations.setdefault(func, {})
+  declaration = declarations.get(key)
+  if declaration is None:
+    declaration = types.FunctionDeclaration.from_callable(
+        client=client, callable=origin
+    )
+    declarations[key] = declaration
+  return declaration
+
+
 def t_tool(
     client: _api_client.BaseApiClient, origin: Any
 ) -> Optional[Union[types.Tool, Any]]:
@@ -920,9 +979,7 @@ def t_tool(
   if inspect.isfunction(origin) or inspect.ismethod(origin):
     return types.Tool(
         function_declarations=[
-            types.FunctionDeclaration.from_callable(
-                client=client, callable=origin
-            )
+            _function_declaration_from_callable(client, origin)
         ]
     )
   elif McpTool is not None and isinstance(origin, McpTool):
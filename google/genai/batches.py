@@ -17,12 +17,13 @@
 
 import json
 import logging
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Union
 from urllib.parse import urlencode
 
 from . import _api_module
 from . import _common
 from . import _extra_utils
+from . import _polling
 from . import _transformers as t
 from . import types
 from ._api_client import BaseApiClient
@@ -1915,7 +1916,6 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1931,7 +1931,7 @@ class Batches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1997,7 +1997,6 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -2011,7 +2010,7 @@ class Batches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2078,7 +2077,6 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -2121,7 +2119,6 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -2135,7 +2132,7 @@ class Batches(_api_module.BaseModule):
       response_dict = _ListBatchJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListBatchJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2204,7 +2201,6 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -2220,7 +2216,7 @@ class Batches(_api_module.BaseModule):
       response_dict = _DeleteResourceJob_from_mldev(response_dict)
 
     return_value = types.DeleteResourceJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2298,7 +2294,6 @@ class Batches(_api_module.BaseModule):
           path = f'{path}?{urlencode(query_params)}'
         request_dict.pop('config', None)
 
-        request_dict = _common.convert_to_dict(request_dict)
         request_dict = _common.encode_unserializable_types(request_dict)
         # Move system instruction to 'request':
         # {'systemInstruction': system_instruction}
@@ -2330,7 +2325,8 @@ class Batches(_api_module.BaseModule):
         response_dict = _BatchJob_from_mldev(response_dict)
 
         return_value = types.BatchJob._from_response(
-            response=response_dict, kwargs=parameter_model.model_dump()
+            response=response_dict,
+            kwargs=_common.response_kwargs(parameter_model),
         )
 
         self._api_client._verify_response(return_value)
@@ -2367,6 +2363,44 @@ class Batches(_api_module.BaseModule):
         config,
     )
 
+  def wait(
+      self,
+      *,
+      names: Sequence[str],
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> Iterator[types.BatchJob]:
+    """Waits for batch jobs to be done.
+
+    The jobs are polled concurrently, each one less often as it keeps running,
+    and yielded as they reach a final state such as `JOB_STATE_SUCCEEDED` or
+    `JOB_STATE_FAILED`.
+
+    Args:
+      names (list[str]): Fully-qualified BatchJob resource names or IDs.
+      config (WaitConfig): Optional configuration for the polling.
+
+    Returns:
+      An iterator over the batch jobs, in the order they are done.
+
+    Raises:
+      TimeoutError: The jobs are not all done before `config.timeout`.
+
+    Usage:
+
+    .. code-block:: python
+
+      for batch_job in client.batches.wait(names=[job1.name, job2.name]):
+        print(f"Batch job: {batch_job.name}, state {batch_job.state}")
+    """
+    wait_config = _polling.get_wait_config(config)
+    get_config = types.GetBatchJobConfig(http_options=wait_config.http_options)
+    return _polling.poll(
+        names,
+        lambda name: self.get(name=name, config=get_config),
+        _polling.is_batch_job_done,
+        wait_config,
+    )
+
 
 class AsyncBatches(_api_module.BaseModule):
 
@@ -2416,7 +2450,6 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2432,7 +2465,7 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2498,7 +2531,6 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2514,7 +2546,7 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2581,7 +2613,6 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2624,7 +2655,6 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2640,7 +2670,7 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _ListBatchJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListBatchJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2709,7 +2739,6 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2725,7 +2754,7 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _DeleteResourceJob_from_mldev(response_dict)
 
     return_value = types.DeleteResourceJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2802,7 +2831,6 @@ class AsyncBatches(_api_module.BaseModule):
           path = f'{path}?{urlencode(query_params)}'
         request_dict.pop('config', None)
 
-        request_dict = _common.convert_to_dict(request_dict)
         request_dict = _common.encode_unserializable_types(request_dict)
         # Move system instruction to 'request':
         # {'systemInstruction': system_instruction}
@@ -2834,7 +2862,8 @@ class AsyncBatches(_api_module.BaseModule):
         response_dict = _BatchJob_from_mldev(response_dict)
 
         return_value = types.BatchJob._from_response(
-            response=response_dict, kwargs=parameter_model.model_dump()
+            response=response_dict,
+            kwargs=_common.response_kwargs(parameter_model),
         )
 
         self._api_client._verify_response(return_value)
@@ -2871,3 +2900,45 @@ class AsyncBatches(_api_module.BaseModule):
         await self._list(config=config),
         config,
     )
+
+  async def wait(
+      self,
+      *,
+      names: Sequence[str],
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> AsyncIterator[types.BatchJob]:
+    """Waits for batch jobs to be done asynchronously.
+
+    The jobs are polled concurrently, each one less often as it keeps running,
+    and yielded as they reach a final state such as `JOB_STATE_SUCCEEDED` or
+    `JOB_STATE_FAILED`.
+
+    Args:
+      names (list[str]): Fully-qualified BatchJob resource names or IDs.
+      config (WaitConfig): Optional configuration for the polling.
+
+    Yields:
+      The batch jobs, in the order they are done.
+
+    Raises:
+      TimeoutError: The jobs are not all done before `config.timeout`.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for batch_job in client.aio.batches.wait(
+          names=[job1.name, job2.name]
+      ):
+        print(f"Batch job: {batch_job.name}, state {batch_job.state}")
+    """
+    wait_config = _polling.get_wait_config(config)
+    get_config = types.GetBatchJobConfig(http_options=wait_config.http_options)
+
+    async def get(name: str) -> types.BatchJob:
+      return await self.get(name=name, config=get_config)
+
+    async for batch_job in _polling.async_poll(
+        names, get, _polling.is_batch_job_done, wait_config
+    ):
+      yield batch_job
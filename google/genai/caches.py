@@ -1521,7 +1521,6 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1537,7 +1536,7 @@ class Caches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1594,7 +1593,6 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -1608,7 +1606,7 @@ class Caches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1667,7 +1665,6 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1683,7 +1680,7 @@ class Caches(_api_module.BaseModule):
       response_dict = _DeleteCachedContentResponse_from_mldev(response_dict)
 
     return_value = types.DeleteCachedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1745,7 +1742,6 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1761,7 +1757,7 @@ class Caches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1812,7 +1808,6 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -1826,7 +1821,7 @@ class Caches(_api_module.BaseModule):
       response_dict = _ListCachedContentsResponse_from_mldev(response_dict)
 
     return_value = types.ListCachedContentsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1909,7 +1904,6 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1925,7 +1919,7 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1983,7 +1977,6 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1999,7 +1992,7 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2059,7 +2052,6 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2075,7 +2067,7 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _DeleteCachedContentResponse_from_mldev(response_dict)
 
     return_value = types.DeleteCachedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2137,7 +2129,6 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2153,7 +2144,7 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _CachedContent_from_mldev(response_dict)
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -2204,7 +2195,6 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -2220,7 +2210,7 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _ListCachedContentsResponse_from_mldev(response_dict)
 
     return_value = types.ListCachedContentsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -13,10 +13,14 @@
 # limitations under the License.
 #
 
-from collections.abc import Iterator
+import asyncio
+from collections.abc import Iterable, Iterator
+import contextlib
+import os
 import sys
-from typing import AsyncIterator, Awaitable, Optional, Union, get_args
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union, get_args
 
+from . import _extra_utils
 from . import _transformers as t
 from . import types
 from .models import AsyncModels, Models
@@ -104,6 +108,213 @@ def _extract_curated_history(
   return curated_history
 
 
+def _split_turns(history: list[Content]) -> list[list[Content]]:
+  """Splits the history into turns, each starting with a user input.
+
+  Function responses sent by automatic function calling belong to the turn of
+  the user input that triggered the function calls.
+  """
+  turns: list[list[Content]] = []
+  for content in history:
+    is_user_input = content.role == "user" and not any(
+        part.function_response for part in content.parts or []
+    )
+    if is_user_input or not turns:
+      turns.append([])
+    turns[-1].append(content)
+  return turns
+
+
+def _estimate_tokens(content: Content) -> int:
+  """Roughly estimates the number of tokens of the content."""
+  tokens = 0
+  for part in content.parts or []:
+    if part.text is not None:
+      tokens += len(part.text) // 4 + 1
+    elif part.inline_data is not None or part.file_data is not None:
+      # Media is billed per item or per second, use the cost of an image.
+      tokens += 258
+    else:
+      tokens += len(part.model_dump_json(exclude_none=True)) // 4 + 1
+  return tokens
+
+
+class ChatHistoryPolicy:
+  """Decides which turns of the curated history are sent in the next requests.
+
+  The default policy keeps the whole history. Subclasses override `compact`,
+  which is called after each turn is recorded. Async chats call
+  `async_compact` instead, which subclasses override when compacting calls
+  out, for example to a model.
+  """
+
+  def compact(self, history: list[Content]) -> list[Content]:
+    """Returns the curated history to keep.
+
+    Args:
+      history: The curated history, including the latest turn.
+
+    Returns:
+      The history to send in the next requests. It should start with a user
+      input, and it may reuse the given `Content` objects.
+    """
+    return history
+
+  async def async_compact(self, history: list[Content]) -> list[Content]:
+    """Returns the curated history to keep, in async chats."""
+    return self.compact(history)
+
+
+class DropOldestTurnsPolicy(ChatHistoryPolicy):
+  """Drops the oldest turns of the history to stay within the limits.
+
+  The latest turn is always kept.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_turns: Optional[int] = None,
+      max_tokens: Optional[int] = None,
+      estimate_tokens: Callable[[Content], int] = _estimate_tokens,
+  ):
+    """Initializes the policy.
+
+    Args:
+      max_turns: The maximum number of turns to keep. A turn is a user input
+        with the model responses and function calls that follow it.
+      max_tokens: The maximum estimated number of tokens to keep.
+      estimate_tokens: Estimates the number of tokens of a content. Defaults
+        to a rough estimate of four characters per token.
+    """
+    self.max_turns = max_turns
+    self.max_tokens = max_tokens
+    self.estimate_tokens = estimate_tokens
+
+  def compact(self, history: list[Content]) -> list[Content]:
+    turns = _split_turns(history)
+    kept = self._num_turns_to_keep(turns)
+    if kept == len(turns):
+      return history
+    return [content for turn in turns[-kept:] for content in turn]
+
+  def _num_turns_to_keep(self, turns: list[list[Content]]) -> int:
+    kept = len(turns)
+    if self.max_turns is not None:
+      kept = min(kept, max(self.max_turns, 1))
+    if self.max_tokens is not None:
+      tokens = 0
+      for i, turn in enumerate(reversed(turns[len(turns) - kept :])):
+        tokens += sum(self.estimate_tokens(content) for content in turn)
+        if tokens > self.max_tokens and i > 0:
+          kept = i
+          break
+    return kept
+
+
+class SummarizeOldestTurnsPolicy(DropOldestTurnsPolicy):
+  """Replaces the oldest turns of the history by a summary of them.
+
+  Once the history exceeds the limits, the dropped turns are summarized and
+  the summary is prepended to the first kept user input.
+
+  In async chats, `async_summarize` is awaited if given. Otherwise
+  `summarize` runs in a worker thread, so that it does not block the event
+  loop.
+  """
+
+  def __init__(
+      self,
+      *,
+      summarize: Callable[[list[Content]], str],
+      async_summarize: Optional[
+          Callable[[list[Content]], Awaitable[str]]
+      ] = None,
+      max_turns: Optional[int] = None,
+      max_tokens: Optional[int] = None,
+      keep_turns: int = 1,
+      estimate_tokens: Callable[[Content], int] = _estimate_tokens,
+  ):
+    """Initializes the policy.
+
+    Args:
+      summarize: Returns the summary of the given contents, for example by
+        asking a model to summarize them.
+      async_summarize: Returns the summary of the given contents in async
+        chats, for example with `client.aio.models.generate_content`.
+      max_turns: The number of turns above which the history is summarized.
+      max_tokens: The estimated number of tokens above which the history is
+        summarized.
+      keep_turns: The number of latest turns kept as is when summarizing.
+      estimate_tokens: Estimates the number of tokens of a content. Defaults
+        to a rough estimate of four characters per token.
+    """
+    super().__init__(
+        max_turns=max_turns,
+        max_tokens=max_tokens,
+        estimate_tokens=estimate_tokens,
+    )
+    self.summarize = summarize
+    self.async_summarize = async_summarize
+    self.keep_turns = max(keep_turns, 1)
+
+  def compact(self, history: list[Content]) -> list[Content]:
+    turns = _split_turns(history)
+    dropped = self._turns_to_summarize(turns)
+    if not dropped:
+      return history
+    return self._summarized(turns, self.summarize(dropped))
+
+  async def async_compact(self, history: list[Content]) -> list[Content]:
+    if self.async_summarize is None:
+      return await asyncio.to_thread(self.compact, history)
+    turns = _split_turns(history)
+    dropped = self._turns_to_summarize(turns)
+    if not dropped:
+      return history
+    return self._summarized(turns, await self.async_summarize(dropped))
+
+  def _turns_to_summarize(self, turns: list[list[Content]]) -> list[Content]:
+    if self._num_turns_to_keep(turns) == len(turns):
+      return []
+    kept = min(self.keep_turns, len(turns))
+    return [content for turn in turns[:-kept] for content in turn]
+
+  def _summarized(
+      self, turns: list[list[Content]], summary_text: str
+  ) -> list[Content]:
+    summary = Part.from_text(
+        text=f"Summary of the earlier conversation: {summary_text}"
+    )
+    kept = min(self.keep_turns, len(turns))
+    first_turn, *other_turns = turns[-kept:]
+    first_input = first_turn[0]
+    return [
+        Content(role="user", parts=[summary] + (first_input.parts or [])),
+        *first_turn[1:],
+        *(content for turn in other_turns for content in turn),
+    ]
+
+
+class _JsonlHistory:
+  """Comprehensive history appended to a JSON Lines file instead of memory."""
+
+  def __init__(self, path: str):
+    self._path = path
+
+  def extend(self, contents: Iterable[Content]) -> None:
+    with open(self._path, "a", encoding="utf-8") as f:
+      for content in contents:
+        f.write(content.model_dump_json(exclude_none=True))
+        f.write("\n")
+
+  def get(self) -> list[Content]:
+    if not os.path.exists(self._path):
+      return []
+    with open(self._path, encoding="utf-8") as f:
+      return [Content.model_validate_json(line) for line in f if line.strip()]
+
+
 class _BaseChat:
   """Base chat session."""
 
@@ -113,6 +324,8 @@ class _BaseChat:
       model: str,
       config: Optional[GenerateContentConfigOrDict] = None,
       history: list[ContentOrDict],
+      history_policy: Optional[ChatHistoryPolicy] = None,
+      history_path: Optional[str] = None,
   ):
     self._model = model
     self._config = config
@@ -123,12 +336,79 @@ class _BaseChat:
       else:
         content_model = content
       content_models.append(content_model)
-    self._comprehensive_history = content_models
+    self._history_policy = history_policy or ChatHistoryPolicy()
+    self._comprehensive_history: Union[list[Content], _JsonlHistory]
     """Comprehensive history is the full history of the chat, including turns of the invalid contents from the model and their associated inputs.
     """
+    if history_path:
+      self._comprehensive_history = _JsonlHistory(history_path)
+      persisted_history = self._comprehensive_history.get()
+      if not persisted_history:
+        self._comprehensive_history.extend(content_models)
+      elif content_models and content_models != persisted_history:
+        raise ValueError(
+            f"{history_path} already holds a different chat history. Pass no"
+            " history to resume it, or use another history_path."
+        )
+      else:
+        # Resumes the persisted chat, without appending its history again.
+        content_models = persisted_history
+    else:
+      self._comprehensive_history = list(content_models)
     self._curated_history = _extract_curated_history(content_models)
     """Curated history is the set of valid turns that will be used in the subsequent send requests.
     """
+    self._compact_initial_history()
+    self._encoded_contents: dict[
+        int, tuple[Content, bool, dict[str, Any]]
+    ] = {}
+    """Wire dicts of the curated history, reused by the subsequent send requests.
+    """
+
+  def _compact_initial_history(self) -> None:
+    self._curated_history = self._history_policy.compact(
+        self._curated_history
+    )
+
+  @contextlib.contextmanager
+  def _reuse_encoded_history(self) -> Iterator[None]:
+    """Reuses the wire dicts of the history in the requests sent in this scope.
+
+    The scope must not span a yield to the caller, whose code would otherwise
+    run with the wire dicts of this chat. The contents of the history are
+    expected not to be modified in place.
+    """
+    token = _extra_utils.encoded_contents.set(self._encoded_contents)
+    try:
+      yield
+    finally:
+      _extra_utils.encoded_contents.reset(token)
+
+  def _reuse_encoded_history_in_stream(
+      self, stream: Iterable[GenerateContentResponse]
+  ) -> Iterator[GenerateContentResponse]:
+    """Yields the chunks of a stream, reusing the history while it advances."""
+    chunks = iter(stream)
+    while True:
+      with self._reuse_encoded_history():
+        chunk = next(chunks, None)
+      if chunk is None:
+        return
+      yield chunk
+
+  async def _async_reuse_encoded_history_in_stream(
+      self, stream: Awaitable[AsyncIterator[GenerateContentResponse]]
+  ) -> AsyncIterator[GenerateContentResponse]:
+    """Yields the chunks of a stream, reusing the history while it advances."""
+    with self._reuse_encoded_history():
+      chunks = await stream
+    while True:
+      with self._reuse_encoded_history():
+        try:
+          chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+          return
+      yield chunk
 
   def record_history(
       self,
@@ -151,6 +431,22 @@ class _BaseChat:
       is_valid: A boolean flag indicating whether the current model output is
         considered valid.
     """
+    if self._append_history(
+        user_input, model_output, automatic_function_calling_history, is_valid
+    ):
+      self._curated_history = self._history_policy.compact(
+          self._curated_history
+      )
+    self._prune_encoded_contents()
+
+  def _append_history(
+      self,
+      user_input: Content,
+      model_output: list[Content],
+      automatic_function_calling_history: list[Content],
+      is_valid: bool,
+  ) -> bool:
+    """Appends the turn to the histories, and returns whether it is valid."""
     input_contents = (
         # Because the AFC input contains the entire curated chat history in
         # addition to the new user input, we need to truncate the AFC history
@@ -164,11 +460,18 @@ class _BaseChat:
     output_contents = (
         model_output if model_output else [Content(role="model", parts=[])]
     )
-    self._comprehensive_history.extend(input_contents)
-    self._comprehensive_history.extend(output_contents)
+    self._comprehensive_history.extend(input_contents + output_contents)
     if is_valid:
       self._curated_history.extend(input_contents)
       self._curated_history.extend(output_contents)
+    return is_valid
+
+  def _prune_encoded_contents(self) -> None:
+    # Only keep the wire dicts of contents that will be sent again.
+    curated_ids = {id(content) for content in self._curated_history}
+    for content_id in list(self._encoded_contents):
+      if content_id not in curated_ids:
+        del self._encoded_contents[content_id]
 
   def get_history(self, curated: bool = False) -> list[Content]:
     """Returns the chat history.
@@ -179,10 +482,14 @@ class _BaseChat:
           (returns the comprehensive history).
 
     Returns:
-        A list of `Content` objects representing the chat history.
+        A list of `Content` objects representing the chat history. If the chat
+        was created with a `history_path`, the comprehensive history is read
+        from that file.
     """
     if curated:
       return self._curated_history
+    elif isinstance(self._comprehensive_history, _JsonlHistory):
+      return self._comprehensive_history.get()
     else:
       return self._comprehensive_history
 
@@ -214,12 +521,16 @@ class Chat(_BaseChat):
       model: str,
       config: Optional[GenerateContentConfigOrDict] = None,
       history: list[ContentOrDict],
+      history_policy: Optional[ChatHistoryPolicy] = None,
+      history_path: Optional[str] = None,
   ):
     self._modules = modules
     super().__init__(
         model=model,
         config=config,
         history=history,
+        history_policy=history_policy,
+        history_path=history_path,
     )
 
   def send_message(
@@ -251,11 +562,12 @@ class Chat(_BaseChat):
           f" {types.PartUnionDict}, got {type(message)}"
       )
     input_content = t.t_content(message)
-    response = self._modules.generate_content(
-        model=self._model,
-        contents=self._curated_history + [input_content],  # type: ignore[arg-type]
-        config=config if config else self._config,
-    )
+    with self._reuse_encoded_history():
+      response = self._modules.generate_content(
+          model=self._model,
+          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+          config=config if config else self._config,
+      )
     model_output = (
         [response.candidates[0].content]
         if response.candidates and response.candidates[0].content
@@ -309,10 +621,12 @@ class Chat(_BaseChat):
     is_valid = True
     chunk = None
     if isinstance(self._modules, Models):
-      for chunk in self._modules.generate_content_stream(
-          model=self._model,
-          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
-          config=config if config else self._config,
+      for chunk in self._reuse_encoded_history_in_stream(
+          self._modules.generate_content_stream(
+              model=self._model,
+              contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+              config=config if config else self._config,
+          )
       ):
         if not _validate_response(chunk):
           is_valid = False
@@ -348,6 +662,8 @@ class Chats:
       model: str,
       config: Optional[GenerateContentConfigOrDict] = None,
       history: Optional[list[ContentOrDict]] = None,
+      history_policy: Optional[ChatHistoryPolicy] = None,
+      history_path: Optional[str] = None,
   ) -> Chat:
     """Creates a new chat session.
 
@@ -355,6 +671,12 @@ class Chats:
       model: The model to use for the chat.
       config: The configuration to use for the generate content request.
       history: The history to use for the chat.
+      history_policy: The policy bounding the history sent in the requests,
+        for example `DropOldestTurnsPolicy(max_turns=20)`. Defaults to keeping
+        the whole history.
+      history_path: A JSON Lines file the comprehensive history is appended to
+        instead of being kept in memory. If the file already holds a history,
+        the chat resumes it, and `history` must be empty or the same.
 
     Returns:
       A new chat session.
@@ -364,11 +686,17 @@ class Chats:
         model=model,
         config=config,
         history=history if history else [],
+        history_policy=history_policy,
+        history_path=history_path,
     )
 
 
 class AsyncChat(_BaseChat):
-  """Async chat session."""
+  """Async chat session.
+
+  The history policy is applied with `ChatHistoryPolicy.async_compact`, and
+  the initial history is compacted by the first request.
+  """
 
   def __init__(
       self,
@@ -377,14 +705,45 @@ class AsyncChat(_BaseChat):
       model: str,
       config: Optional[GenerateContentConfigOrDict] = None,
       history: list[ContentOrDict],
+      history_policy: Optional[ChatHistoryPolicy] = None,
+      history_path: Optional[str] = None,
   ):
     self._modules = modules
     super().__init__(
         model=model,
         config=config,
         history=history,
+        history_policy=history_policy,
+        history_path=history_path,
     )
 
+  def _compact_initial_history(self) -> None:
+    # Compacting may call a model, so it waits for the first request.
+    self._initial_history_compacted = False
+
+  async def _async_compact_initial_history(self) -> None:
+    if not self._initial_history_compacted:
+      self._curated_history = await self._history_policy.async_compact(
+          self._curated_history
+      )
+      self._initial_history_compacted = True
+
+  async def _async_record_history(
+      self,
+      user_input: Content,
+      model_output: list[Content],
+      automatic_function_calling_history: list[Content],
+      is_valid: bool,
+  ) -> None:
+    """Records the chat history, compacting it without blocking."""
+    if self._append_history(
+        user_input, model_output, automatic_function_calling_history, is_valid
+    ):
+      self._curated_history = await self._history_policy.async_compact(
+          self._curated_history
+      )
+    self._prune_encoded_contents()
+
   async def send_message(
       self,
       message: Union[list[PartUnionDict], PartUnionDict],
@@ -413,11 +772,13 @@ class AsyncChat(_BaseChat):
           f" {types.PartUnionDict}, got {type(message)}"
       )
     input_content = t.t_content(message)
-    response = await self._modules.generate_content(
-        model=self._model,
-        contents=self._curated_history + [input_content],  # type: ignore[arg-type]
-        config=config if config else self._config,
-    )
+    await self._async_compact_initial_history()
+    with self._reuse_encoded_history():
+      response = await self._modules.generate_content(
+          model=self._model,
+          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+          config=config if config else self._config,
+      )
     model_output = (
         [response.candidates[0].content]
         if response.candidates and response.candidates[0].content
@@ -428,7 +789,7 @@ class AsyncChat(_BaseChat):
         if response.automatic_function_calling_history
         else []
     )
-    self.record_history(
+    await self._async_record_history(
         user_input=input_content,
         model_output=model_output,
         automatic_function_calling_history=automatic_function_calling_history,
@@ -472,10 +833,13 @@ class AsyncChat(_BaseChat):
       finish_reason = None
       is_valid = True
       chunk = None
-      async for chunk in await self._modules.generate_content_stream(  # type: ignore[attr-defined]
-          model=self._model,
-          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
-          config=config if config else self._config,
+      await self._async_compact_initial_history()
+      async for chunk in self._async_reuse_encoded_history_in_stream(
+          self._modules.generate_content_stream(
+              model=self._model,
+              contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+              config=config if config else self._config,
+          )
       ):
         if not _validate_response(chunk):
           is_valid = False
@@ -488,7 +852,7 @@ class AsyncChat(_BaseChat):
       if not output_contents or finish_reason is None:
         is_valid = False
 
-      self.record_history(
+      await self._async_record_history(
           user_input=input_content,
           model_output=output_contents,
           automatic_function_calling_history=chunk.automatic_function_calling_history
@@ -512,6 +876,8 @@ class AsyncChats:
       model: str,
       config: Optional[GenerateContentConfigOrDict] = None,
       history: Optional[list[ContentOrDict]] = None,
+      history_policy: Optional[ChatHistoryPolicy] = None,
+      history_path: Optional[str] = None,
   ) -> AsyncChat:
     """Creates a new chat session.
 
@@ -519,6 +885,12 @@ class AsyncChats:
       model: The model to use for the chat.
       config: The configuration to use for the generate content request.
       history: The history to use for the chat.
+      history_policy: The policy bounding the history sent in the requests,
+        for example `DropOldestTurnsPolicy(max_turns=20)`. Defaults to keeping
+        the whole history.
+      history_path: A JSON Lines file the comprehensive history is appended to
+        instead of being kept in memory. If the file already holds a history,
+        the chat resumes it, and `history` must be empty or the same.
 
     Returns:
       A new chat session.
@@ -528,4 +900,6 @@ class AsyncChats:
         model=model,
         config=config,
         history=history if history else [],
+        history_policy=history_policy,
+        history_path=history_path,
     )
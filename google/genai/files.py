@@ -15,14 +15,16 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
+import hashlib
 import io
 import json
 import logging
 import mimetypes
 import os
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, overload
 from urllib.parse import urlencode
 
+from . import _api_client
 from . import _api_module
 from . import _common
 from . import _transformers as t
@@ -311,6 +313,87 @@ def _DeleteFileResponse_from_mldev(
   return to_object
 
 
+# Bytes at the start and at the end of a file hashed to tell whether an
+# interrupted upload was of the same content.
+_FINGERPRINT_CHUNK_SIZE = 64 * 1024
+
+
+def _upload_fingerprint(
+    file: Union[str, io.IOBase], size_bytes: Optional[int]
+) -> dict[str, object]:
+  """Returns what identifies the content of a file to upload."""
+  fingerprint: dict[str, object] = {}
+  size = size_bytes or 0
+
+  def hash_head_and_tail(f: Any, start: int) -> str:
+    digest = hashlib.sha256(f.read(min(size, _FINGERPRINT_CHUNK_SIZE)))
+    if size > _FINGERPRINT_CHUNK_SIZE:
+      f.seek(
+          start + max(_FINGERPRINT_CHUNK_SIZE, size - _FINGERPRINT_CHUNK_SIZE)
+      )
+      digest.update(f.read(_FINGERPRINT_CHUNK_SIZE))
+    return digest.hexdigest()
+
+  if isinstance(file, io.IOBase):
+    start = file.tell()
+    try:
+      fingerprint['sha256'] = hash_head_and_tail(file, start)
+    finally:
+      file.seek(start, os.SEEK_SET)
+  else:
+    fingerprint['path'] = os.path.abspath(file)
+    fingerprint['mtime_ns'] = os.stat(file).st_mtime_ns
+    with open(file, 'rb') as f:
+      fingerprint['sha256'] = hash_head_and_tail(f, 0)
+  return fingerprint
+
+
+def _load_upload_state(
+    path: str, file_obj: types.File, fingerprint: dict[str, object]
+) -> Optional[str]:
+  """Returns the upload URL persisted by an interrupted upload of the file."""
+  try:
+    with open(path, 'r') as f:
+      state = json.load(f)
+  except (OSError, ValueError):
+    return None
+  if (
+      not isinstance(state, dict)
+      or state.get('size_bytes') != file_obj.size_bytes
+      or state.get('mime_type') != file_obj.mime_type
+      or state.get('fingerprint') != fingerprint
+  ):
+    return None
+  upload_url = state.get('upload_url')
+  return upload_url if isinstance(upload_url, str) else None
+
+
+def _save_upload_state(
+    path: str,
+    upload_url: str,
+    file_obj: types.File,
+    fingerprint: dict[str, object],
+) -> None:
+  """Persists the resumable upload session so that it can be resumed."""
+  with open(path, 'w') as f:
+    json.dump(
+        {
+            'upload_url': upload_url,
+            'size_bytes': file_obj.size_bytes,
+            'mime_type': file_obj.mime_type,
+            'fingerprint': fingerprint,
+        },
+        f,
+    )
+
+
+def _remove_upload_state(path: str) -> None:
+  try:
+    os.remove(path)
+  except FileNotFoundError:
+    pass
+
+
 class Files(_api_module.BaseModule):
 
   def _list(
@@ -363,7 +446,6 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -374,7 +456,7 @@ class Files(_api_module.BaseModule):
       response_dict = _ListFilesResponse_from_mldev(response_dict)
 
     return_value = types.ListFilesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -419,7 +501,6 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -438,7 +519,7 @@ class Files(_api_module.BaseModule):
       response_dict = _CreateFileResponse_from_mldev(response_dict)
 
     return_value = types.CreateFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -495,7 +576,6 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -506,7 +586,7 @@ class Files(_api_module.BaseModule):
       response_dict = _File_from_mldev(response_dict)
 
     return_value = types.File._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -562,7 +642,6 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -575,7 +654,7 @@ class Files(_api_module.BaseModule):
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
 
     return_value = types.DeleteFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -595,7 +674,8 @@ class Files(_api_module.BaseModule):
         binary mode. In other words, do not use non-blocking mode or text mode.
         The given stream must be seekable, that is, it must be able to call
         `seek()` on 'path'.
-      config: Optional parameters to set `diplay_name`, `mime_type`, and `name`.
+      config: Optional parameters to set `diplay_name`, `mime_type`, and `name`,
+        and to tune the chunking and resumption of the upload.
     """
     if self._api_client.vertexai:
       raise ValueError(
@@ -665,32 +745,63 @@ class Files(_api_module.BaseModule):
               'X-Goog-Upload-Header-Content-Type': f'{file_obj.mime_type}',
           },
       )
-    response = self._create(
-        file=file_obj,
-        config=types.CreateFileConfig(
-            http_options=http_options, should_return_http_response=True
-        ),
-    )
-
-    if (
-        response.sdk_http_response is None
-        or response.sdk_http_response.headers is None
-        or 'x-goog-upload-url' not in response.sdk_http_response.headers
-    ):
-      raise KeyError(
-          'Failed to create file. Upload URL did not returned from the create'
-          ' file request.'
+    resume_state_path = config_model.resume_state_path
+    fingerprint: dict[str, object] = {}
+    upload_url: Optional[str] = None
+    if resume_state_path:
+      fingerprint = _upload_fingerprint(
+          file if isinstance(file, io.IOBase) else fs_path, file_obj.size_bytes
       )
-    upload_url = response.sdk_http_response.headers['x-goog-upload-url']
+      upload_url = _load_upload_state(resume_state_path, file_obj, fingerprint)
+    start_position = file.tell() if isinstance(file, io.IOBase) else 0
+
+    while True:
+      resume = upload_url is not None
+      if upload_url is None:
+        response = self._create(
+            file=file_obj,
+            config=types.CreateFileConfig(
+                http_options=http_options, should_return_http_response=True
+            ),
+        )
 
-    if isinstance(file, io.IOBase):
-      return_file = self._api_client.upload_file(
-          file, upload_url, file_obj.size_bytes, http_options=http_options
-      )
-    else:
-      return_file = self._api_client.upload_file(
-          fs_path, upload_url, file_obj.size_bytes, http_options=http_options
-      )
+        if (
+            response.sdk_http_response is None
+            or response.sdk_http_response.headers is None
+            or 'x-goog-upload-url' not in response.sdk_http_response.headers
+        ):
+          raise KeyError(
+              'Failed to create file. Upload URL did not returned from the'
+              ' create file request.'
+          )
+        upload_url = response.sdk_http_response.headers['x-goog-upload-url']
+        if resume_state_path:
+          _save_upload_state(
+              resume_state_path, upload_url, file_obj, fingerprint
+          )
+
+      try:
+        return_file = self._api_client.upload_file(
+            file if isinstance(file, io.IOBase) else fs_path,
+            upload_url,
+            file_obj.size_bytes,
+            http_options=http_options,
+            chunk_size=config_model.chunk_size,
+            resume=resume,
+            read_ahead=bool(config_model.read_ahead),
+        )
+        break
+      except _api_client.UploadSessionExpiredError:
+        if resume_state_path:
+          _remove_upload_state(resume_state_path)
+        if not resume:
+          raise
+        # The persisted session is gone, so start over with a new one.
+        upload_url = None
+        if isinstance(file, io.IOBase):
+          file.seek(start_position, os.SEEK_SET)
+    if resume_state_path:
+      _remove_upload_state(resume_state_path)
 
     return types.File._from_response(
         response=_File_from_mldev(return_file.json['file']),
@@ -707,29 +818,53 @@ class Files(_api_module.BaseModule):
         config,
     )
 
+  @overload
   def download(
       self,
       *,
       file: Union[str, types.File, types.Video, types.GeneratedVideo],
       config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: None = None,
   ) -> bytes:
+    ...
+
+  @overload
+  def download(
+      self,
+      *,
+      file: Union[str, types.File, types.Video, types.GeneratedVideo],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Union[str, 'os.PathLike[str]', io.IOBase],
+  ) -> None:
+    ...
+
+  def download(
+      self,
+      *,
+      file: Union[str, types.File, types.Video, types.GeneratedVideo],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Optional[Union[str, 'os.PathLike[str]', io.IOBase]] = None,
+  ) -> Optional[bytes]:
     """Downloads a file's data from storage.
 
     Files created by `upload` can't be downloaded. You can tell which files are
     downloadable by checking the `source` or `download_uri` property.
 
-    Note: This method returns the data as bytes. For `Video` and
-    `GeneratedVideo` objects there is an additional side effect, that it also
-    sets the `video_bytes` property on the `Video` object.
+    Note: Without a `destination`, this method returns the data as bytes. For
+    `Video` and `GeneratedVideo` objects there is an additional side effect,
+    that it also sets the `video_bytes` property on the `Video` object.
 
     Args:
       file (str): A file name, uri, or file object. Identifying which file to
         download.
       config (DownloadFileConfigOrDict): Optional, configuration for the get
         method.
+      destination: Optional, a file path or a writable binary file object. If
+        set, the data is streamed into it instead of being held in memory,
+        and nothing is returned.
 
     Returns:
-      File: The file data as bytes.
+      File: The file data as bytes, or None if a `destination` is given.
 
     Usage:
 
@@ -747,6 +882,8 @@ class Files(_api_module.BaseModule):
       video = types.Video(uri=file.uri)
       video_bytes = client.files.download(file=video)
       video.video_bytes
+
+      client.files.download(file=video, destination='video.mp4')
     """
     if self._api_client.vertexai:
       raise ValueError(
@@ -776,6 +913,15 @@ class Files(_api_module.BaseModule):
     if getv(config_model, ['http_options']) is not None:
       http_options = getv(config_model, ['http_options'])
 
+    if destination is not None:
+      self._api_client.download_file_to(
+          path,
+          destination,
+          http_options=http_options,
+          resume=bool(getv(config_model, ['resume'])),
+      )
+      return None
+
     data = self._api_client.download_file(
         path,
         http_options=http_options,
@@ -841,7 +987,6 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -854,7 +999,7 @@ class AsyncFiles(_api_module.BaseModule):
       response_dict = _ListFilesResponse_from_mldev(response_dict)
 
     return_value = types.ListFilesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -899,7 +1044,6 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -918,7 +1062,7 @@ class AsyncFiles(_api_module.BaseModule):
       response_dict = _CreateFileResponse_from_mldev(response_dict)
 
     return_value = types.CreateFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -975,7 +1119,6 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -988,7 +1131,7 @@ class AsyncFiles(_api_module.BaseModule):
       response_dict = _File_from_mldev(response_dict)
 
     return_value = types.File._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1044,7 +1187,6 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1057,7 +1199,7 @@ class AsyncFiles(_api_module.BaseModule):
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
 
     return_value = types.DeleteFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -1077,7 +1219,8 @@ class AsyncFiles(_api_module.BaseModule):
         binary mode. In other words, do not use non-blocking mode or text mode.
         The given stream must be seekable, that is, it must be able to call
         `seek()` on 'path'.
-      config: Optional parameters to set `diplay_name`, `mime_type`, and `name`.
+      config: Optional parameters to set `diplay_name`, `mime_type`, and `name`,
+        and to tune the chunking and resumption of the upload.
     """
     if self._api_client.vertexai:
       raise ValueError(
@@ -1147,37 +1290,73 @@ class AsyncFiles(_api_module.BaseModule):
               'X-Goog-Upload-Header-Content-Type': f'{file_obj.mime_type}',
           },
       )
-    response = await self._create(
-        file=file_obj,
-        config=types.CreateFileConfig(
-            http_options=http_options, should_return_http_response=True
-        ),
-    )
-    if (
-        response.sdk_http_response is None
-        or response.sdk_http_response.headers is None
-        or (
-            'x-goog-upload-url' not in response.sdk_http_response.headers
-            and 'X-Goog-Upload-URL' not in response.sdk_http_response.headers
-        )
-    ):
-      raise KeyError(
-          'Failed to create file. Upload URL did not returned from the create'
-          ' file request.'
-      )
-    elif 'x-goog-upload-url' in response.sdk_http_response.headers:
-      upload_url = response.sdk_http_response.headers['x-goog-upload-url']
-    else:
-      upload_url = response.sdk_http_response.headers['X-Goog-Upload-URL']
-
-    if isinstance(file, io.IOBase):
-      return_file = await self._api_client.async_upload_file(
-          file, upload_url, file_obj.size_bytes, http_options=http_options
-      )
-    else:
-      return_file = await self._api_client.async_upload_file(
-          fs_path, upload_url, file_obj.size_bytes, http_options=http_options
+    resume_state_path = config_model.resume_state_path
+    fingerprint: dict[str, object] = {}
+    upload_url: Optional[str] = None
+    if resume_state_path:
+      fingerprint = _upload_fingerprint(
+          file if isinstance(file, io.IOBase) else fs_path, file_obj.size_bytes
       )
+      upload_url = _load_upload_state(resume_state_path, file_obj, fingerprint)
+    start_position = file.tell() if isinstance(file, io.IOBase) else 0
+
+    while True:
+      resume = upload_url is not None
+      if upload_url is None:
+        response = await self._create(
+            file=file_obj,
+            config=types.CreateFileConfig(
+                http_options=http_options, should_return_http_response=True
+            ),
+        )
+        if (
+            response.sdk_http_response is None
+            or response.sdk_http_response.headers is None
+            or (
+                'x-goog-upload-url' not in response.sdk_http_response.headers
+                and 'X-Goog-Upload-URL'
+                not in response.sdk_http_response.headers
+            )
+        ):
+          raise KeyError(
+              'Failed to create file. Upload URL did not returned from the'
+              ' create file request.'
+          )
+        elif 'x-goog-upload-url' in response.sdk_http_response.headers:
+          upload_url = response.sdk_http_response.headers[
+              'x-goog-upload-url'
+          ]
+        else:
+          upload_url = response.sdk_http_response.headers[
+              'X-Goog-Upload-URL'
+          ]
+        if resume_state_path:
+          _save_upload_state(
+              resume_state_path, upload_url, file_obj, fingerprint
+          )
+
+      try:
+        return_file = await self._api_client.async_upload_file(
+            file if isinstance(file, io.IOBase) else fs_path,
+            upload_url,
+            file_obj.size_bytes,
+            http_options=http_options,
+            chunk_size=config_model.chunk_size,
+            resume=resume,
+            read_ahead=bool(config_model.read_ahead),
+        )
+        break
+      except _api_client.UploadSessionExpiredError:
+        if resume_state_path:
+          _remove_upload_state(resume_state_path)
+        if not resume:
+          raise
+        # The persisted session is gone, so start over with a new one.
+        upload_url = None
+        if isinstance(file, io.IOBase):
+          file.seek(start_position, os.SEEK_SET)
+    if resume_state_path:
+      _remove_upload_state(resume_state_path)
 
     return types.File._from_response(
         response=_File_from_mldev(return_file.json['file']),
@@ -1194,12 +1373,33 @@ class AsyncFiles(_api_module.BaseModule):
         config,
     )
 
+  @overload
   async def download(
       self,
       *,
       file: Union[str, types.File],
       config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: None = None,
   ) -> bytes:
+    ...
+
+  @overload
+  async def download(
+      self,
+      *,
+      file: Union[str, types.File],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Union[str, 'os.PathLike[str]', io.IOBase],
+  ) -> None:
+    ...
+
+  async def download(
+      self,
+      *,
+      file: Union[str, types.File],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Optional[Union[str, 'os.PathLike[str]', io.IOBase]] = None,
+  ) -> Optional[bytes]:
     """Downloads a file's data from the file service.
 
     The Vertex-AI implementation of the API foes not include the file service.
@@ -1212,9 +1412,12 @@ class AsyncFiles(_api_module.BaseModule):
         download.
       config (DownloadFileConfigOrDict): Optional, configuration for the get
         method.
+      destination: Optional, a file path or a writable binary file object. If
+        set, the data is streamed into it instead of being held in memory,
+        and nothing is returned.
 
     Returns:
-      File: The file data as bytes.
+      File: The file data as bytes, or None if a `destination` is given.
 
     Usage:
 
@@ -1253,6 +1456,15 @@ class AsyncFiles(_api_module.BaseModule):
     if query_params:
       path = f'{path}?{urlencode(query_params)}'
 
+    if destination is not None:
+      await self._api_client.async_download_file_to(
+          path,
+          destination,
+          http_options=http_options,
+          resume=bool(getv(config_model, ['resume'])),
+      )
+      return None
+
     data = await self._api_client.async_download_file(
         path,
         http_options=http_options,
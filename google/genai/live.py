@@ -326,7 +326,6 @@ class AsyncSession:
               from_object=realtime_input
           )
       )
-    realtime_input_dict = _common.convert_to_dict(realtime_input_dict)
     realtime_input_dict = _common.encode_unserializable_types(
         realtime_input_dict
     )
@@ -538,7 +537,7 @@ class AsyncSession:
       response_dict = live_converters._LiveServerMessage_from_mldev(response)
 
     return types.LiveServerMessage._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
   async def _send_loop(
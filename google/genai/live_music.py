@@ -139,7 +139,7 @@ class AsyncMusicSession:
       )
 
     return types.LiveMusicServerMessage._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
   async def close(self) -> None:
@@ -15,6 +15,7 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
+from collections.abc import AsyncIterable, Iterable
 import json
 import logging
 from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, Union
@@ -838,10 +839,12 @@ def _GenerateContentParameters_to_mldev(
     setv(
         to_object,
         ['contents'],
-        [
-            _Content_to_mldev(item, to_object)
-            for item in t.t_contents(getv(from_object, ['contents']))
-        ],
+        _extra_utils.encode_contents(
+            api_client,
+            t.t_contents(getv(from_object, ['contents'])),
+            _Content_to_mldev,
+            to_object,
+        ),
     )
 
   if getv(from_object, ['config']) is not None:
@@ -2252,10 +2255,12 @@ def _GenerateContentParameters_to_vertex(
     setv(
         to_object,
         ['contents'],
-        [
-            _Content_to_vertex(item, to_object)
-            for item in t.t_contents(getv(from_object, ['contents']))
-        ],
+        _extra_utils.encode_contents(
+            api_client,
+            t.t_contents(getv(from_object, ['contents'])),
+            _Content_to_vertex,
+            to_object,
+        ),
     )
 
   if getv(from_object, ['config']) is not None:
@@ -5125,7 +5130,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5141,7 +5145,7 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
     return_value = types.GenerateContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5199,7 +5203,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     if config is not None and getattr(
@@ -5210,12 +5213,13 @@ class Models(_api_module.BaseModule):
           ' methods.'
       )
 
-    for response in self._api_client.request_streamed(
+    structured_output = _extra_utils.StructuredOutputStream(
+        _common.response_kwargs(parameter_model)
+    )
+    for headers, response_dict in self._api_client.request_streamed_json(
         'post', path, request_dict, http_options
     ):
 
-      response_dict = '' if not response.body else json.loads(response.body)
-
       if self._api_client.vertexai:
         response_dict = _GenerateContentResponse_from_vertex(response_dict)
 
@@ -5223,12 +5227,11 @@ class Models(_api_module.BaseModule):
         response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
       return_value = types.GenerateContentResponse._from_response(
-          response=response_dict, kwargs=parameter_model.model_dump()
-      )
-      return_value.sdk_http_response = types.HttpResponse(
-          headers=response.headers
+          response=response_dict, kwargs=structured_output.chunk_kwargs
       )
+      return_value.sdk_http_response = types.HttpResponse(headers=headers)
       self._api_client._verify_response(return_value)
+      structured_output.update(return_value)
       yield return_value
 
   def embed_content(
@@ -5266,6 +5269,7 @@ class Models(_api_module.BaseModule):
         contents=contents,
         config=config,
     )
+    _extra_utils.check_embedding_output_format(parameter_model.config)
 
     request_url_dict: Optional[dict[str, str]]
 
@@ -5300,7 +5304,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5315,9 +5318,13 @@ class Models(_api_module.BaseModule):
     else:
       response_dict = _EmbedContentResponse_from_mldev(response_dict)
 
+    embedding_values = _extra_utils.pop_embedding_values(
+        response_dict, parameter_model.config
+    )
     return_value = types.EmbedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
+    _extra_utils.set_embedding_values(return_value, embedding_values)
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
     )
@@ -5378,7 +5385,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5394,7 +5400,7 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateImagesResponse_from_mldev(response_dict)
 
     return_value = types.GenerateImagesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5485,7 +5491,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5498,7 +5503,7 @@ class Models(_api_module.BaseModule):
       response_dict = _EditImageResponse_from_vertex(response_dict)
 
     return_value = types.EditImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5556,7 +5561,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5569,7 +5573,7 @@ class Models(_api_module.BaseModule):
       response_dict = _UpscaleImageResponse_from_vertex(response_dict)
 
     return_value = types.UpscaleImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5664,7 +5668,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5677,7 +5680,7 @@ class Models(_api_module.BaseModule):
       response_dict = _RecontextImageResponse_from_vertex(response_dict)
 
     return_value = types.RecontextImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -5747,7 +5750,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5760,7 +5762,7 @@ class Models(_api_module.BaseModule):
       response_dict = _SegmentImageResponse_from_vertex(response_dict)
 
     return_value = types.SegmentImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -5807,7 +5809,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -5821,7 +5822,7 @@ class Models(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -5867,7 +5868,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -5881,7 +5881,7 @@ class Models(_api_module.BaseModule):
       response_dict = _ListModelsResponse_from_mldev(response_dict)
 
     return_value = types.ListModelsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5933,7 +5933,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -5949,7 +5948,7 @@ class Models(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -5999,7 +5998,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -6015,7 +6013,7 @@ class Models(_api_module.BaseModule):
       response_dict = _DeleteModelResponse_from_mldev(response_dict)
 
     return_value = types.DeleteModelResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -6088,7 +6086,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -6104,7 +6101,7 @@ class Models(_api_module.BaseModule):
       response_dict = _CountTokensResponse_from_mldev(response_dict)
 
     return_value = types.CountTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6174,7 +6171,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -6187,7 +6183,7 @@ class Models(_api_module.BaseModule):
       response_dict = _ComputeTokensResponse_from_vertex(response_dict)
 
     return_value = types.ComputeTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6279,7 +6275,6 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -6295,7 +6290,7 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateVideosOperation_from_mldev(response_dict)
 
     return_value = types.GenerateVideosOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -6410,7 +6405,7 @@ class Models(_api_module.BaseModule):
       ):
         break
       func_response_parts = _extra_utils.get_function_response_parts(
-          response, function_map
+          response, function_map, parsed_config
       )
       if not func_response_parts:
         break
@@ -6554,7 +6549,7 @@ class Models(_api_module.BaseModule):
             ):
               break
             func_response_parts = _extra_utils.get_function_response_parts(
-                chunk, function_map
+                chunk, function_map, parsed_config
             )
             if not func_response_parts:
               _extra_utils.append_chunk_contents(contents, chunk)
@@ -6577,7 +6572,7 @@ class Models(_api_module.BaseModule):
         ):
           break
         func_response_parts = _extra_utils.get_function_response_parts(
-            chunk, function_map
+            chunk, function_map, parsed_config
         )
 
       if not function_map:
@@ -6713,6 +6708,45 @@ class Models(_api_module.BaseModule):
         config=config,
     )
 
+  def embed_content_bulk(
+      self,
+      *,
+      model: str,
+      contents: Iterable[str],
+      config: Optional[types.EmbedContentBulkConfigOrDict] = None,
+  ) -> Iterator[types.ContentEmbedding]:
+    """Calculates embeddings for a large number of texts.
+
+    The texts are read lazily and packed into requests under the size limits
+    of the API, which are sent concurrently. The embeddings are yielded in the
+    order of the texts. Failed requests are retried on their own according to
+    the client's retry options, or to `config.retry_options` if set.
+
+    Args:
+      model (str): The model to use.
+      contents (Iterable[str]): The texts to embed.
+      config (EmbedContentBulkConfig): Optional configuration for embeddings
+        and batching.
+
+    Usage:
+
+    .. code-block:: python
+
+      for embedding in client.models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=(document.text for document in documents),
+          config={'max_concurrent_requests': 8},
+      ):
+        index.add(embedding.values)
+    """
+    return _extra_utils.embed_content_bulk(
+        self.embed_content,
+        self._api_client,
+        model=model,
+        contents=contents,
+        config=config,
+    )
+
   def upscale_image(
       self,
       *,
@@ -6932,7 +6966,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -6948,7 +6981,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
     return_value = types.GenerateContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7006,7 +7039,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     if config is not None and getattr(
@@ -7017,14 +7049,16 @@ class AsyncModels(_api_module.BaseModule):
           ' methods.'
       )
 
-    response_stream = await self._api_client.async_request_streamed(
+    response_stream = await self._api_client.async_request_streamed_json(
         'post', path, request_dict, http_options
     )
 
-    async def async_generator():  # type: ignore[no-untyped-def]
-      async for response in response_stream:
+    structured_output = _extra_utils.StructuredOutputStream(
+        _common.response_kwargs(parameter_model)
+    )
 
-        response_dict = '' if not response.body else json.loads(response.body)
+    async def async_generator():  # type: ignore[no-untyped-def]
+      async for headers, response_dict in response_stream:
 
         if self._api_client.vertexai:
           response_dict = _GenerateContentResponse_from_vertex(response_dict)
@@ -7033,12 +7067,11 @@ class AsyncModels(_api_module.BaseModule):
           response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
         return_value = types.GenerateContentResponse._from_response(
-            response=response_dict, kwargs=parameter_model.model_dump()
-        )
-        return_value.sdk_http_response = types.HttpResponse(
-            headers=response.headers
+            response=response_dict, kwargs=structured_output.chunk_kwargs
         )
+        return_value.sdk_http_response = types.HttpResponse(headers=headers)
         self._api_client._verify_response(return_value)
+        structured_output.update(return_value)
         yield return_value
 
     return async_generator()  # type: ignore[no-untyped-call, no-any-return]
@@ -7078,6 +7111,7 @@ class AsyncModels(_api_module.BaseModule):
         contents=contents,
         config=config,
     )
+    _extra_utils.check_embedding_output_format(parameter_model.config)
 
     request_url_dict: Optional[dict[str, str]]
 
@@ -7112,7 +7146,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7127,9 +7160,13 @@ class AsyncModels(_api_module.BaseModule):
     else:
       response_dict = _EmbedContentResponse_from_mldev(response_dict)
 
+    embedding_values = _extra_utils.pop_embedding_values(
+        response_dict, parameter_model.config
+    )
     return_value = types.EmbedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
+    _extra_utils.set_embedding_values(return_value, embedding_values)
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
     )
@@ -7190,7 +7227,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7206,7 +7242,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateImagesResponse_from_mldev(response_dict)
 
     return_value = types.GenerateImagesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7297,7 +7333,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7310,7 +7345,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _EditImageResponse_from_vertex(response_dict)
 
     return_value = types.EditImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7368,7 +7403,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7381,7 +7415,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _UpscaleImageResponse_from_vertex(response_dict)
 
     return_value = types.UpscaleImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7476,7 +7510,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7489,7 +7522,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _RecontextImageResponse_from_vertex(response_dict)
 
     return_value = types.RecontextImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -7562,7 +7595,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7575,7 +7607,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _SegmentImageResponse_from_vertex(response_dict)
 
     return_value = types.SegmentImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -7622,7 +7654,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7638,7 +7669,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -7684,7 +7715,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7700,7 +7730,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _ListModelsResponse_from_mldev(response_dict)
 
     return_value = types.ListModelsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7752,7 +7782,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7768,7 +7797,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -7818,7 +7847,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7834,7 +7862,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _DeleteModelResponse_from_mldev(response_dict)
 
     return_value = types.DeleteModelResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -7907,7 +7935,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -7923,7 +7950,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _CountTokensResponse_from_mldev(response_dict)
 
     return_value = types.CountTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -7992,7 +8019,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -8005,7 +8031,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _ComputeTokensResponse_from_vertex(response_dict)
 
     return_value = types.ComputeTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -8097,7 +8123,6 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -8113,7 +8138,7 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateVideosOperation_from_mldev(response_dict)
 
     return_value = types.GenerateVideosOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
 
     self._api_client._verify_response(return_value)
@@ -8196,7 +8221,7 @@ class AsyncModels(_api_module.BaseModule):
         break
       func_response_parts = (
           await _extra_utils.get_function_response_parts_async(
-              response, function_map
+              response, function_map, parsed_config
           )
       )
       if not func_response_parts:
@@ -8346,7 +8371,7 @@ class AsyncModels(_api_module.BaseModule):
                 break
               func_response_parts = (
                   await _extra_utils.get_function_response_parts_async(
-                      chunk, function_map
+                      chunk, function_map, config
                   )
               )
               if not func_response_parts:
@@ -8372,7 +8397,7 @@ class AsyncModels(_api_module.BaseModule):
             break
           func_response_parts = (
               await _extra_utils.get_function_response_parts_async(
-                  chunk, function_map
+                  chunk, function_map, config
               )
           )
         if not function_map:
@@ -8564,6 +8589,45 @@ class AsyncModels(_api_module.BaseModule):
     )
     return response
 
+  async def embed_content_bulk(
+      self,
+      *,
+      model: str,
+      contents: Union[Iterable[str], AsyncIterable[str]],
+      config: Optional[types.EmbedContentBulkConfigOrDict] = None,
+  ) -> AsyncIterator[types.ContentEmbedding]:
+    """Calculates embeddings for a large number of texts.
+
+    The texts are read lazily and packed into requests under the size limits
+    of the API, which are sent concurrently. The embeddings are yielded in the
+    order of the texts. Failed requests are retried on their own according to
+    the client's retry options, or to `config.retry_options` if set.
+
+    Args:
+      model (str): The model to use.
+      contents (Iterable[str] | AsyncIterable[str]): The texts to embed.
+      config (EmbedContentBulkConfig): Optional configuration for embeddings
+        and batching.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for embedding in await client.aio.models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=read_documents(),
+          config={'max_concurrent_requests': 8},
+      ):
+        index.add(embedding.values)
+    """
+    return _extra_utils.async_embed_content_bulk(
+        self.embed_content,
+        self._api_client,
+        model=model,
+        contents=contents,
+        config=config,
+    )
+
   async def upscale_image(
       self,
       *,
@@ -17,11 +17,12 @@
 
 import json
 import logging
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, TypeVar, Union
 from urllib.parse import urlencode
 
 from . import _api_module
 from . import _common
+from . import _polling
 from . import types
 from ._common import get_value_by_path as getv
 from ._common import set_value_by_path as setv
@@ -129,7 +130,6 @@ class Operations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -177,7 +177,6 @@ class Operations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -240,6 +239,38 @@ class Operations(_api_module.BaseModule):
       )
       return response_operation  # type: ignore[no-any-return]
 
+  def wait(
+      self,
+      operations: Sequence[T],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> Iterator[T]:
+    """Waits for operations to be done.
+
+    The operations are polled concurrently, each one less often as it keeps
+    running, and yielded as they are done.
+
+    Raises:
+      TimeoutError: The operations are not all done before `config.timeout`.
+
+    Usage:
+
+    .. code-block:: python
+
+      for operation in client.operations.wait([operation1, operation2]):
+        print(operation.response)
+    """
+    wait_config = _polling.get_wait_config(config)
+    get_config = types.GetOperationConfig(
+        http_options=wait_config.http_options
+    )
+    return _polling.poll(
+        operations,
+        lambda operation: self.get(operation, config=get_config),
+        _polling.is_operation_done,
+        wait_config,
+    )
+
 
 class AsyncOperations(_api_module.BaseModule):
 
@@ -283,7 +314,6 @@ class AsyncOperations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -333,7 +363,6 @@ class AsyncOperations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -392,3 +421,39 @@ class AsyncOperations(_api_module.BaseModule):
           response_dict, is_vertex_ai=False
       )
       return response_operation  # type: ignore[no-any-return]
+
+  async def wait(
+      self,
+      operations: Sequence[T],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> AsyncIterator[T]:
+    """Waits for operations to be done asynchronously.
+
+    The operations are polled concurrently, each one less often as it keeps
+    running, and yielded as they are done.
+
+    Raises:
+      TimeoutError: The operations are not all done before `config.timeout`.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for operation in client.aio.operations.wait(
+          [operation1, operation2]
+      ):
+        print(operation.response)
+    """
+    wait_config = _polling.get_wait_config(config)
+    get_config = types.GetOperationConfig(
+        http_options=wait_config.http_options
+    )
+
+    async def get(operation: AsyncOperations.T) -> AsyncOperations.T:
+      return await self.get(operation, config=get_config)
+
+    async for operation in _polling.async_poll(
+        operations, get, _polling.is_operation_done, wait_config
+    ):
+      yield operation
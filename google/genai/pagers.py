@@ -17,8 +17,10 @@
 
 # pylint: disable=protected-access
 
-import copy
-from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, Literal, TypeVar, Union
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Generic, Iterator, Literal, TypeVar, Union
 from . import _common
 from . import types
 
@@ -28,6 +30,93 @@ PagedItem = Literal[
     'batch_jobs', 'models', 'tuning_jobs', 'files', 'cached_contents'
 ]
 
+# How often a prefetching thread checks whether the pages are still wanted,
+# in seconds.
+_PREFETCH_POLL_INTERVAL = 0.1
+
+
+def _prefetch_responses(
+    request: Callable[..., Any], config: _common.StringDict, depth: int
+) -> Iterator[Any]:
+  """Fetches the pages after `config['page_token']` in a background thread.
+
+  Up to `depth` responses are fetched ahead of the caller. The thread stops
+  once the caller closes the iterator.
+  """
+  responses: queue.Queue[Any] = queue.Queue(maxsize=depth)
+  stopped = threading.Event()
+
+  def put(item: Any) -> bool:
+    while not stopped.is_set():
+      try:
+        responses.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+        return True
+      except queue.Full:
+        pass
+    return False
+
+  def fetch() -> None:
+    page_token = config.get('page_token')
+    try:
+      while page_token:
+        response = request(config={**config, 'page_token': page_token})
+        if not put(response):
+          return
+        page_token = getattr(response, 'next_page_token', None)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      put(e)
+      return
+    put(None)
+
+  threading.Thread(target=fetch, daemon=True).start()
+  try:
+    while True:
+      item = responses.get()
+      if item is None:
+        return
+      if isinstance(item, Exception):
+        raise item
+      yield item
+  finally:
+    stopped.set()
+
+
+async def _async_prefetch_responses(
+    request: Callable[..., Awaitable[Any]],
+    config: _common.StringDict,
+    depth: int,
+) -> AsyncGenerator[Any, None]:
+  """Fetches the pages after `config['page_token']` in a background task.
+
+  Up to `depth` responses are fetched ahead of the caller. The task is
+  cancelled once the caller closes the iterator.
+  """
+  responses: asyncio.Queue[Any] = asyncio.Queue(maxsize=depth)
+
+  async def fetch() -> None:
+    page_token = config.get('page_token')
+    try:
+      while page_token:
+        response = await request(config={**config, 'page_token': page_token})
+        await responses.put(response)
+        page_token = getattr(response, 'next_page_token', None)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      await responses.put(e)
+      return
+    await responses.put(None)
+
+  task = asyncio.ensure_future(fetch())
+  try:
+    while True:
+      item = await responses.get()
+      if item is None:
+        return
+      if isinstance(item, Exception):
+        raise item
+      yield item
+  finally:
+    task.cancel()
+
 
 class _BasePager(Generic[T]):
   """Base pager class for iterating through paginated results."""
@@ -47,12 +136,9 @@ class _BasePager(Generic[T]):
 
     self._sdk_http_response = getattr(response, 'sdk_http_response', None)
 
-    if not config:
-      request_config = {}
-    elif isinstance(config, dict):
-      request_config = copy.deepcopy(config)
-    else:
-      request_config = dict(config)
+    # Only the page token changes between pages, so a shallow copy keeps the
+    # caller's config unchanged.
+    request_config = dict(config) if config else {}
     request_config['page_token'] = getattr(response, 'next_page_token')
     self._config = request_config
 
@@ -201,6 +287,32 @@ class Pager(_BasePager[T]):
     self._init_next_page(response)
     return self.page
 
+  def iter_pages(self, prefetch: int = 0) -> Iterator[list[T]]:
+    """Returns an iterator over the pages, starting with the current one.
+
+    Args:
+      prefetch: The number of pages to fetch ahead in a background thread while
+        the current page is processed. By default, each page is fetched once
+        the previous one has been processed.
+
+    Usage:
+
+    .. code-block:: python
+
+      batch_jobs_pager = client.batches.list(config={'page_size': 100})
+      for page in batch_jobs_pager.iter_pages(prefetch=1):
+        print(f"{len(page)} batch jobs")
+    """
+
+    yield self.page
+    if prefetch <= 0:
+      while self.config.get('page_token'):
+        yield self.next_page()
+      return
+    for response in _prefetch_responses(self._request, self.config, prefetch):
+      self._init_next_page(response)
+      yield self.page
+
 
 class AsyncPager(_BasePager[T]):
   """AsyncPager class for iterating through paginated results."""
@@ -260,3 +372,33 @@ class AsyncPager(_BasePager[T]):
     response = await self._request(config=self.config)
     self._init_next_page(response)
     return self.page
+
+  async def iter_pages(self, prefetch: int = 0) -> AsyncIterator[list[T]]:
+    """Returns an async iterator over the pages, starting with the current one.
+
+    Args:
+      prefetch: The number of pages to fetch ahead in a background task while
+        the current page is processed. By default, each page is fetched once
+        the previous one has been processed.
+
+    Usage:
+
+    .. code-block:: python
+
+      batch_jobs_pager = await client.aio.batches.list(config={'page_size': 100})
+      async for page in batch_jobs_pager.iter_pages(prefetch=1):
+        print(f"{len(page)} batch jobs")
+    """
+
+    yield self.page
+    if prefetch <= 0:
+      while self.config.get('page_token'):
+        yield await self.next_page()
+      return
+    responses = _async_prefetch_responses(self._request, self.config, prefetch)
+    try:
+      async for response in responses:
+        self._init_next_page(response)
+        yield self.page
+    finally:
+      await responses.aclose()
@@ -16,15 +16,20 @@
 
 """Tests for get_function_response_parts."""
 
+import asyncio
+import threading
+import time
 import typing
 from typing import Any
 import pytest
 from ..._extra_utils import get_function_response_parts, get_function_response_parts_async
 from ...errors import UnsupportedFunctionError
+from ...types import AutomaticFunctionCallingConfig
 from ...types import Candidate
 from ...types import Content
 from ...types import FunctionCall
 from ...types import FunctionResponse
+from ...types import GenerateContentConfig
 from ...types import GenerateContentResponse
 from ...types import Part
 
@@ -275,3 +280,217 @@ async def test_mcp_tool_error():
     assert actual_part.model_dump_json(
         exclude_none=True
     ) == expected_part.model_dump_json(exclude_none=True)
+
+
+def _function_calls_response(*names: str) -> GenerateContentResponse:
+  return GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  parts=[
+                      Part(function_call=FunctionCall(name=name, args={}))
+                      for name in names
+                  ]
+              )
+          )
+      ]
+  )
+
+
+def test_parallel_calls_in_thread_pool():
+  barrier = threading.Barrier(3, timeout=5)
+
+  def wait_for_others() -> str:
+    barrier.wait()
+    return threading.current_thread().name
+
+  response = _function_calls_response('first', 'second', 'third')
+  function_map = {
+      'first': wait_for_others,
+      'second': wait_for_others,
+      'third': wait_for_others,
+  }
+  config = GenerateContentConfig(
+      automatic_function_calling=AutomaticFunctionCallingConfig(
+          maximum_parallel_calls=3
+      )
+  )
+
+  actual_parts = get_function_response_parts(response, function_map, config)
+
+  assert [part.function_response.name for part in actual_parts] == [
+      'first',
+      'second',
+      'third',
+  ]
+  for part in actual_parts:
+    assert part.function_response.response['result'].startswith(
+        'google_genai_afc'
+    )
+
+
+def test_parallel_call_timeout_in_thread_pool():
+  event = threading.Event()
+
+  def slow() -> int:
+    event.wait(5)
+    return 1
+
+  def fast() -> int:
+    return 2
+
+  response = _function_calls_response('slow', 'fast')
+  config = {
+      'automatic_function_calling': {
+          'maximum_parallel_calls': 2,
+          'function_call_timeout': 0.01,
+      }
+  }
+
+  actual_parts = get_function_response_parts(
+      response, {'slow': slow, 'fast': fast}, config
+  )
+  event.set()
+
+  assert 'timed out' in actual_parts[0].function_response.response['error']
+  assert actual_parts[1].function_response.response == {'result': 2}
+
+
+@pytest.mark.asyncio
+async def test_async_calls_run_concurrently_if_limited():
+  running = 0
+  max_running = 0
+
+  async def tool() -> int:
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    await asyncio.sleep(0.01)
+    running -= 1
+    return max_running
+
+  response = _function_calls_response('a', 'b', 'c', 'd')
+  function_map = {'a': tool, 'b': tool, 'c': tool, 'd': tool}
+
+  await get_function_response_parts_async(response, function_map)
+  assert max_running == 1
+
+  max_running = 0
+  config = GenerateContentConfig(
+      automatic_function_calling=AutomaticFunctionCallingConfig(
+          maximum_parallel_calls=2
+      )
+  )
+  actual_parts = await get_function_response_parts_async(
+      response, function_map, config
+  )
+  assert max_running == 2
+  assert [part.function_response.name for part in actual_parts] == [
+      'a',
+      'b',
+      'c',
+      'd',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_async_call_timeout():
+
+  async def slow() -> int:
+    await asyncio.sleep(5)
+    return 1
+
+  async def fast() -> int:
+    return 2
+
+  response = _function_calls_response('slow', 'fast')
+  config = GenerateContentConfig(
+      automatic_function_calling=AutomaticFunctionCallingConfig(
+          function_call_timeout=0.01
+      )
+  )
+
+  actual_parts = await get_function_response_parts_async(
+      response, {'slow': slow, 'fast': fast}, config
+  )
+
+  assert 'timed out' in actual_parts[0].function_response.response['error']
+  assert actual_parts[1].function_response.response == {'result': 2}
+
+
+def test_parallel_call_timeout_is_per_turn():
+  event = threading.Event()
+  fast_calls = []
+
+  def slow() -> int:
+    event.wait(5)
+    return 1
+
+  def fast() -> int:
+    fast_calls.append(1)
+    return 2
+
+  response = _function_calls_response('slow', 'slow', 'fast')
+  config = {
+      'automatic_function_calling': {
+          'maximum_parallel_calls': 2,
+          'function_call_timeout': 0.2,
+      }
+  }
+
+  start = time.monotonic()
+  actual_parts = get_function_response_parts(
+      response, {'slow': slow, 'fast': fast}, config
+  )
+  elapsed = time.monotonic() - start
+  event.set()
+  time.sleep(0.05)
+
+  assert elapsed < 0.5
+  errors = [part.function_response.response['error'] for part in actual_parts]
+  assert 'timed out' in errors[0] and 'timed out' in errors[1]
+  assert 'was not run' in errors[2]
+  assert not fast_calls
+
+
+@pytest.mark.asyncio
+async def test_async_sync_functions_run_concurrently():
+  barrier = threading.Barrier(2, timeout=5)
+
+  def wait_for_other() -> int:
+    barrier.wait()
+    return 1
+
+  response = _function_calls_response('a', 'b')
+  config = GenerateContentConfig(
+      automatic_function_calling=AutomaticFunctionCallingConfig(
+          maximum_parallel_calls=2
+      )
+  )
+
+  actual_parts = await get_function_response_parts_async(
+      response, {'a': wait_for_other, 'b': wait_for_other}, config
+  )
+
+  assert [part.function_response.response for part in actual_parts] == [
+      {'result': 1},
+      {'result': 1},
+  ]
+
+
+@pytest.mark.asyncio
+async def test_async_sync_functions_run_inline_by_default():
+
+  def current_thread() -> str:
+    return threading.current_thread().name
+
+  response = _function_calls_response('a', 'b')
+
+  actual_parts = await get_function_response_parts_async(
+      response, {'a': current_thread, 'b': current_thread}
+  )
+
+  assert [part.function_response.response for part in actual_parts] == [
+      {'result': threading.current_thread().name},
+      {'result': threading.current_thread().name},
+  ]
@@ -0,0 +1,165 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests reusing the encoded chat history across turns."""
+
+import asyncio
+import base64
+import json
+from unittest import mock
+
+import httpx
+
+from ... import _extra_utils
+from ... import models
+from ... import types
+
+
+class _FakeModelServer:
+  """Stand-in for generateContent, recording the request bodies."""
+
+  def __init__(self):
+    self.requests: list[dict] = []
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    self.requests.append(json.loads(request.read()))
+    return httpx.Response(
+        200,
+        json={
+            'candidates': [{
+                'content': {
+                    'role': 'model',
+                    'parts': [{'text': f'reply {len(self.requests)}'}],
+                },
+                'finishReason': 'STOP',
+            }]
+        },
+    )
+
+
+_IMAGE = types.Part.from_bytes(data=b'\x89PNG image', mime_type='image/png')
+
+
+def test_history_is_encoded_once(mock_transport_client):
+  server = _FakeModelServer()
+  chat = mock_transport_client(server).chats.create(model='gemini-2.0-flash')
+
+  with mock.patch.object(
+      models, '_Content_to_mldev', wraps=models._Content_to_mldev
+  ) as content_to_mldev:
+    chat.send_message(['describe', _IMAGE])
+    chat.send_message('and now?')
+    chat.send_message('thanks')
+
+  # Each turn only encodes the new input and the previous model output.
+  assert content_to_mldev.call_count == 5
+  assert server.requests[2]['contents'] == [
+      {
+          'role': 'user',
+          'parts': [
+              {'text': 'describe'},
+              {
+                  'inlineData': {
+                      'data': base64.urlsafe_b64encode(b'\x89PNG image')
+                      .decode('ascii'),
+                      'mimeType': 'image/png',
+                  }
+              },
+          ],
+      },
+      {'role': 'model', 'parts': [{'text': 'reply 1'}]},
+      {'role': 'user', 'parts': [{'text': 'and now?'}]},
+      {'role': 'model', 'parts': [{'text': 'reply 2'}]},
+      {'role': 'user', 'parts': [{'text': 'thanks'}]},
+  ]
+
+
+def test_encoded_history_is_scoped_to_chat(mock_transport_client):
+  server = _FakeModelServer()
+  client = mock_transport_client(server)
+  chat = client.chats.create(model='gemini-2.0-flash')
+  chat.send_message('hello')
+
+  assert _extra_utils.encoded_contents.get() is None
+  assert set(chat._encoded_contents) == {
+      id(content) for content in chat.get_history(curated=True)[:1]
+  }
+
+  client.models.generate_content(
+      model='gemini-2.0-flash', contents=chat.get_history(curated=True)
+  )
+  assert server.requests[-1]['contents'][1] == {
+      'role': 'model',
+      'parts': [{'text': 'reply 1'}],
+  }
+
+
+def test_stream_history_is_encoded_once(mock_transport_client):
+  server = _FakeModelServer()
+  chat = mock_transport_client(server).chats.create(model='gemini-2.0-flash')
+
+  with mock.patch.object(
+      models, '_Content_to_mldev', wraps=models._Content_to_mldev
+  ) as content_to_mldev:
+    for message in ['hello', 'again']:
+      for _ in chat.send_message_stream(message):
+        # The wire dicts of the chat are not visible between chunks.
+        assert _extra_utils.encoded_contents.get() is None
+
+  assert content_to_mldev.call_count == 3
+  assert _extra_utils.encoded_contents.get() is None
+
+
+def test_async_history_is_encoded_once(mock_transport_client):
+  server = _FakeModelServer()
+  client = mock_transport_client(server)
+
+  async def run():
+    chat = client.aio.chats.create(model='gemini-2.0-flash')
+    await chat.send_message('hello')
+    await chat.send_message('again')
+
+  with mock.patch.object(
+      models, '_Content_to_mldev', wraps=models._Content_to_mldev
+  ) as content_to_mldev:
+    asyncio.run(run())
+
+  assert content_to_mldev.call_count == 3
+  assert [content['role'] for content in server.requests[1]['contents']] == [
+      'user',
+      'model',
+      'user',
+  ]
+
+
+def test_async_stream_history_is_encoded_once(mock_transport_client):
+  server = _FakeModelServer()
+  client = mock_transport_client(server)
+  contexts = []
+
+  async def run():
+    chat = client.aio.chats.create(model='gemini-2.0-flash')
+    for message in ['hello', 'again']:
+      async for _ in await chat.send_message_stream(message):
+        contexts.append(_extra_utils.encoded_contents.get())
+
+  with mock.patch.object(
+      models, '_Content_to_mldev', wraps=models._Content_to_mldev
+  ) as content_to_mldev:
+    asyncio.run(run())
+
+  assert content_to_mldev.call_count == 3
+  assert contexts == [None, None]
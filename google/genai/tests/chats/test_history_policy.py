@@ -0,0 +1,266 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for bounding the chat history."""
+
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from ... import _api_client
+from ... import chats
+from ... import models
+from ... import types
+
+
+def _user(text: str) -> types.Content:
+  return types.Content(role='user', parts=[types.Part.from_text(text=text)])
+
+
+def _model(text: str) -> types.Content:
+  return types.Content(role='model', parts=[types.Part.from_text(text=text)])
+
+
+def _turn(i: int) -> list[types.Content]:
+  return [_user(f'question {i}'), _model(f'answer {i}')]
+
+
+def _history(num_turns: int) -> list[types.Content]:
+  return [content for i in range(num_turns) for content in _turn(i)]
+
+
+@pytest.fixture
+def mock_generate_content():
+  with mock.patch.object(
+      models.Models, 'generate_content'
+  ) as mock_generate_content:
+    mock_generate_content.return_value = types.GenerateContentResponse(
+        candidates=[types.Candidate(content=_model('answer'))]
+    )
+    yield mock_generate_content
+
+
+def _chats() -> chats.Chats:
+  api_client = mock.MagicMock(spec=_api_client.BaseApiClient)
+  return chats.Chats(modules=models.Models(api_client))
+
+
+def test_default_policy_keeps_history():
+  history = _history(3)
+  assert chats.ChatHistoryPolicy().compact(history) == history
+
+
+def test_drop_oldest_turns_by_count():
+  policy = chats.DropOldestTurnsPolicy(max_turns=2)
+  assert policy.compact(_history(5)) == _turn(3) + _turn(4)
+
+
+def test_drop_oldest_turns_keeps_function_calls_in_turn():
+  afc_turn = [
+      _user('weather?'),
+      types.Content(
+          role='model',
+          parts=[
+              types.Part.from_function_call(name='get_weather', args={})
+          ]
+      ),
+      types.Content(
+          role='user',
+          parts=[
+              types.Part.from_function_response(
+                  name='get_weather', response={'result': 'sunny'}
+              )
+          ]
+      ),
+      _model('It is sunny.'),
+  ]
+  policy = chats.DropOldestTurnsPolicy(max_turns=1)
+
+  assert policy.compact(_turn(0) + afc_turn) == afc_turn
+
+
+def test_drop_oldest_turns_by_tokens():
+  policy = chats.DropOldestTurnsPolicy(
+      max_tokens=10, estimate_tokens=lambda content: 3
+  )
+  # Each turn is estimated to 6 tokens, the latest turn is always kept.
+  assert policy.compact(_history(4)) == _turn(3)
+  assert chats.DropOldestTurnsPolicy(max_tokens=1).compact(
+      _history(2)
+  ) == _turn(1)
+
+
+def test_summarize_oldest_turns():
+  summarize = mock.Mock(return_value='We talked.')
+  policy = chats.SummarizeOldestTurnsPolicy(
+      summarize=summarize, max_turns=3, keep_turns=2
+  )
+
+  assert policy.compact(_history(3)) == _history(3)
+  summarize.assert_not_called()
+
+  compacted = policy.compact(_history(4))
+
+  summarize.assert_called_once_with(_history(2))
+  assert compacted == [
+      types.Content(
+          role='user',
+          parts=[
+              types.Part.from_text(
+                  text='Summary of the earlier conversation: We talked.'
+              ),
+              types.Part.from_text(text='question 2'),
+          ]
+      ),
+      *_turn(2)[1:],
+      *_turn(3),
+  ]
+
+
+def test_chat_applies_history_policy(mock_generate_content):
+  chat = _chats().create(
+      model='gemini-2.0-flash',
+      history=_history(2),
+      history_policy=chats.DropOldestTurnsPolicy(max_turns=2),
+  )
+
+  chat.send_message('question 2')
+
+  assert chat.get_history(curated=True) == _turn(1) + [
+      types.UserContent(parts=[types.Part.from_text(text='question 2')]),
+      _model('answer'),
+  ]
+  assert len(chat.get_history()) == 6
+  assert mock_generate_content.call_args.kwargs['contents'][0] == _turn(0)[0]
+
+
+def test_chat_history_path(tmp_path, mock_generate_content):
+  history_path = str(tmp_path / 'history.jsonl')
+  chat = _chats().create(
+      model='gemini-2.0-flash',
+      history=_history(1),
+      history_path=history_path,
+  )
+
+  chat.send_message('question 1')
+
+  # Contents are read back from the file as plain `Content` objects.
+  assert chat.get_history() == _history(1) + [
+      _user('question 1'),
+      _model('answer'),
+  ]
+  with open(history_path) as f:
+    assert len(f.readlines()) == 4
+
+
+def test_chat_history_path_resumes_history(tmp_path, mock_generate_content):
+  history_path = str(tmp_path / 'history.jsonl')
+  chat = _chats().create(
+      model='gemini-2.0-flash',
+      history=_history(1),
+      history_path=history_path,
+  )
+  chat.send_message('question 1')
+
+  for history in [None, chat.get_history()]:
+    resumed_chat = _chats().create(
+        model='gemini-2.0-flash', history=history, history_path=history_path
+    )
+
+    assert resumed_chat.get_history() == chat.get_history()
+    assert resumed_chat.get_history(curated=True) == chat.get_history()
+  with open(history_path) as f:
+    assert len(f.readlines()) == 4
+
+
+def test_chat_history_path_rejects_other_history(tmp_path):
+  history_path = str(tmp_path / 'history.jsonl')
+  _chats().create(
+      model='gemini-2.0-flash',
+      history=_history(1),
+      history_path=history_path,
+  )
+
+  with pytest.raises(ValueError, match='different chat history'):
+    _chats().create(
+        model='gemini-2.0-flash',
+        history=_history(2),
+        history_path=history_path,
+    )
+
+
+def _async_chats() -> chats.AsyncChats:
+  api_client = mock.MagicMock(spec=_api_client.BaseApiClient)
+  return chats.AsyncChats(modules=models.AsyncModels(api_client))
+
+
+@pytest.fixture
+def mock_async_generate_content():
+  with mock.patch.object(
+      models.AsyncModels, 'generate_content'
+  ) as mock_generate_content:
+    mock_generate_content.return_value = types.GenerateContentResponse(
+        candidates=[types.Candidate(content=_model('answer'))]
+    )
+    yield mock_generate_content
+
+
+def test_async_chat_awaits_async_summarize(mock_async_generate_content):
+  summarize = mock.Mock(return_value='sync summary')
+  async_summarize = mock.AsyncMock(return_value='We talked.')
+  chat = _async_chats().create(
+      model='gemini-2.0-flash',
+      history=_history(3),
+      history_policy=chats.SummarizeOldestTurnsPolicy(
+          summarize=summarize,
+          async_summarize=async_summarize,
+          max_turns=2,
+      ),
+  )
+  summarize.assert_not_called()
+
+  asyncio.run(chat.send_message('question 3'))
+
+  summarize.assert_not_called()
+  async_summarize.assert_awaited_once_with(_history(2))
+  sent_contents = mock_async_generate_content.call_args.kwargs['contents']
+  assert len(sent_contents) == 3
+  assert chat.get_history(curated=True)[0].parts[0].text == (
+      'Summary of the earlier conversation: We talked.'
+  )
+
+
+def test_async_chat_summarizes_in_thread(mock_async_generate_content):
+  summarize_threads = []
+
+  def summarize(contents):
+    summarize_threads.append(threading.get_ident())
+    return 'We talked.'
+
+  chat = _async_chats().create(
+      model='gemini-2.0-flash',
+      history=_history(2),
+      history_policy=chats.SummarizeOldestTurnsPolicy(
+          summarize=summarize, max_turns=2
+      ),
+  )
+
+  asyncio.run(chat.send_message('question 2'))
+
+  assert len(summarize_threads) == 1
+  assert summarize_threads[0] != threading.get_ident()
@@ -16,10 +16,14 @@
 
 """Tests for client initialization."""
 
+import asyncio
+import http.server
 import httpx
+import json
 import logging
 import os
 import ssl
+import threading
 
 import certifi
 import google.auth
@@ -1124,3 +1128,190 @@ def test_async_transport_forces_httpx_regardless_of_aiohttp_availability():
 
   api_client.has_aiohttp = True
   assert not client._api_client._use_aiohttp()
+
+
+def test_connection_options_set_httpx_limits(monkeypatch):
+  monkeypatch.setattr(api_client, "has_aiohttp", False)
+  client = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(
+          connection_options=types.HttpConnectionOptions(
+              max_connections=500, keepalive_expiry=60
+          )
+      ),
+  )
+
+  for httpx_client in (
+      client._api_client._httpx_client,
+      client._api_client._async_httpx_client,
+  ):
+    pool = httpx_client._transport._pool
+    assert pool._max_connections == 500
+    assert pool._max_keepalive_connections == 20
+    assert pool._keepalive_expiry == 60
+
+
+def test_connection_args():
+  assert api_client.connection_args(None) == {}
+  assert api_client.connection_args(types.HttpConnectionOptions()) == {}
+
+  args = api_client.connection_args(
+      types.HttpConnectionOptions(max_keepalive_connections=50, http2=True)
+  )
+
+  assert args == {
+      "limits": httpx.Limits(
+          max_connections=100, max_keepalive_connections=50
+      ),
+      "http2": True,
+  }
+
+
+def test_client_args_limits_take_precedence(monkeypatch):
+  monkeypatch.setattr(api_client, "has_aiohttp", False)
+  client = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(
+          client_args={"limits": httpx.Limits(max_connections=7)},
+          connection_options=types.HttpConnectionOptions(max_connections=500),
+      ),
+  )
+
+  assert client._api_client._httpx_client._transport._pool._max_connections == 7
+  assert (
+      client._api_client._async_httpx_client._transport._pool._max_connections
+      == 500
+  )
+
+
+def test_shared_transport_is_reused_across_clients(monkeypatch):
+  monkeypatch.setattr(api_client, "has_aiohttp", False)
+  http_options = types.HttpOptions(
+      connection_options=types.HttpConnectionOptions(
+          max_connections=300, share_transport=True
+      )
+  )
+  first = Client(api_key="google_api_key", http_options=http_options)
+  second = Client(
+      vertexai=True,
+      project="fake_project_id",
+      location="fake-location",
+      http_options=http_options,
+  )
+  unshared = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(
+          connection_options=types.HttpConnectionOptions(max_connections=300)
+      ),
+  )
+
+  transport = first._api_client._httpx_client._transport
+  async_transport = first._api_client._async_httpx_client._transport
+  assert second._api_client._httpx_client._transport is transport
+  assert second._api_client._async_httpx_client._transport is async_transport
+  assert unshared._api_client._httpx_client._transport is not transport
+
+  first._api_client._httpx_client.close()
+
+  assert not transport._transport._pool.connections
+  assert not second._api_client._httpx_client.is_closed
+
+
+def test_shared_transport_is_not_shared_across_ssl_settings(monkeypatch):
+  monkeypatch.setattr(api_client, "has_aiohttp", False)
+  connection_options = types.HttpConnectionOptions(share_transport=True)
+  default_client = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(connection_options=connection_options),
+  )
+  unverified_client = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(
+          client_args={"verify": False},
+          connection_options=connection_options,
+      ),
+  )
+
+  assert (
+      default_client._api_client._httpx_client._transport
+      is not unverified_client._api_client._httpx_client._transport
+  )
+
+
+class _CountTokensHandler(http.server.BaseHTTPRequestHandler):
+  """Answers countTokens over keep-alive connections."""
+
+  protocol_version = "HTTP/1.1"
+
+  def do_POST(self):
+    self.rfile.read(int(self.headers["Content-Length"]))
+    body = json.dumps({"totalTokens": 1}).encode()
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+
+def test_async_shared_transport_is_reused_across_event_loops(monkeypatch):
+  monkeypatch.setattr(api_client, "has_aiohttp", False)
+  server = http.server.ThreadingHTTPServer(
+      ("127.0.0.1", 0), _CountTokensHandler
+  )
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  client = Client(
+      api_key="google_api_key",
+      http_options=types.HttpOptions(
+          base_url=f"http://127.0.0.1:{server.server_address[1]}/",
+          connection_options=types.HttpConnectionOptions(
+              share_transport=True
+          ),
+      ),
+  )
+
+  try:
+    tokens = [
+        asyncio.run(
+            client.aio.models.count_tokens(
+                model="gemini-2.0-flash", contents="a"
+            )
+        ).total_tokens
+        for _ in range(2)
+    ]
+  finally:
+    server.shutdown()
+
+  assert tokens == [1, 1]
+
+
+def test_shared_transport_forces_httpx():
+  client = Client(
+      vertexai=True,
+      project="fake_project_id",
+      location="fake-location",
+      http_options=types.HttpOptions(
+          connection_options=types.HttpConnectionOptions(share_transport=True)
+      ),
+  )
+
+  api_client.has_aiohttp = True
+  assert not client._api_client._use_aiohttp()
+
+
+def test_http2_forces_httpx():
+  pytest.importorskip("h2")
+  client = Client(
+      vertexai=True,
+      project="fake_project_id",
+      location="fake-location",
+      http_options=types.HttpOptions(
+          connection_options=types.HttpConnectionOptions(http2=True)
+      ),
+  )
+
+  assert client._api_client._httpx_client._transport._pool._http2
+  api_client.has_aiohttp = True
+  assert not client._api_client._use_aiohttp()
@@ -17,6 +17,7 @@
 """Tests for client behavior when issuing requests."""
 
 import http
+import json
 
 from ... import _api_client as api_client
 from ... import Client
@@ -146,3 +147,22 @@ def test_build_request_keeps_sdk_version_headers(monkeypatch):
   assert 'gl-python/' in request.headers['x-goog-api-client']
   assert 'google-genai-sdk/' in request.headers['x-goog-api-client']
   assert 'gl-python/' in request.headers['x-goog-api-client']
+
+
+def test_serialize_request_data():
+  data = {'contents': [{'parts': [{'text': 'héllo'}]}], 'n': 1}
+  serialized = api_client._serialize_request_data(data)
+
+  assert json.loads(serialized) == data
+
+
+def test_serialize_request_data_without_orjson(monkeypatch):
+  monkeypatch.setattr(api_client, 'has_orjson', False)
+  data = {'contents': [{'parts': [{'text': 'héllo'}]}], 'n': 1}
+
+  assert api_client._serialize_request_data(data) == json.dumps(data)
+
+
+def test_serialize_request_data_falls_back_for_big_integers():
+  data = {'n': 2**70}
+  assert json.loads(api_client._serialize_request_data(data)) == data
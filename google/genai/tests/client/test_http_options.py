@@ -31,6 +31,9 @@ def test_patch_http_options_with_copies_all_fields():
       async_client_args={'http1': True},
       extra_body={'key': 'value'},
       retry_options=types.HttpRetryOptions(attempts=10),
+      connection_options=types.HttpConnectionOptions(max_connections=10),
+      rate_limit_options=types.HttpRateLimitOptions(requests_per_minute=10),
+      cache_options=types.HttpCacheOptions(ttl=60),
   )
   options = types.HttpOptions()
   patched = _api_client.patch_http_options(options, patch_options)
@@ -43,6 +46,9 @@ def test_patch_http_options_with_copies_all_fields():
   assert patched.headers['X-Custom-Header'] == 'custom_value'
   assert patched.timeout == 10000
   assert patched.retry_options.attempts == 10
+  assert patched.connection_options.max_connections == 10
+  assert patched.rate_limit_options.requests_per_minute == 10
+  assert patched.cache_options.ttl == 60
   assert patched.client_args['http2']
   assert patched.async_client_args['http1']
 
@@ -149,3 +155,85 @@ def test_server_timeout_not_set_by_default():
 def test_retry_options_not_set_by_default():
   options = types.HttpOptions()
   assert options.retry_options is None
+
+
+def test_patched_http_options_are_memoized():
+  api_client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+  )
+
+  first = api_client._get_patched_http_options({'timeout': 5000})
+  second = api_client._get_patched_http_options({'timeout': 5000})
+  other = api_client._get_patched_http_options({'timeout': 6000})
+  model = api_client._get_patched_http_options(
+      types.HttpOptions(timeout=5000)
+  )
+
+  assert first is second
+  assert first.timeout == 5000
+  assert other.timeout == 6000
+  assert model.timeout == 5000
+  assert model is api_client._get_patched_http_options(
+      types.HttpOptions(timeout=5000)
+  )
+
+
+def test_patched_http_options_are_keyed_by_type():
+  api_client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+  )
+
+  with_true = api_client._get_patched_http_options(
+      {'extra_body': {'flag': True}}
+  )
+  with_one = api_client._get_patched_http_options({'extra_body': {'flag': 1}})
+
+  assert with_true.extra_body == {'flag': True}
+  assert with_one.extra_body['flag'] is not True
+
+
+def test_patched_http_options_follow_client_headers():
+  api_client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+  )
+  first = api_client._get_patched_http_options({'timeout': 5000})
+
+  api_client._http_options.headers['x-test'] = 'yes'
+
+  second = api_client._get_patched_http_options({'timeout': 5000})
+  assert second.headers['x-test'] == 'yes'
+  assert 'x-test' not in first.headers
+
+
+def test_unhashable_http_options_are_patched():
+  api_client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+  )
+  http_options = {'client_args': {'unhashable': [bytearray(b'x')]}}
+
+  patched = api_client._get_patched_http_options(http_options)
+
+  assert patched.client_args == {'unhashable': [bytearray(b'x')]}
+  assert not api_client._patched_http_options
+
+
+def test_request_headers_are_not_shared():
+  api_client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+  )
+
+  first = api_client._build_request(
+      'POST', 'sample/path', {}, {'timeout': 5000}
+  )
+  first.headers['Authorization'] = 'Bearer token'
+  second = api_client._build_request(
+      'POST', 'sample/path', {}, {'timeout': 5000}
+  )
+
+  assert 'Authorization' not in second.headers
+  assert second.headers['X-Server-Timeout'] == '5'
@@ -0,0 +1,209 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import _rate_limit
+from ... import errors
+from ... import types
+
+
+def _client(
+    rate_limit_options: types.HttpRateLimitOptions, handler=None
+) -> api_client.BaseApiClient:
+  transport = httpx.MockTransport(
+      handler or (lambda request: httpx.Response(200, json={}))
+  )
+  return api_client.BaseApiClient(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          client_args={'transport': transport},
+          async_client_args={'transport': transport},
+          rate_limit_options=rate_limit_options,
+      ),
+  )
+
+
+def _error(headers=None, details=None) -> errors.APIError:
+  response_json = {'error': {'code': 429, 'details': details or []}}
+  return errors.APIError(
+      429, response_json, httpx.Response(429, headers=headers or {})
+  )
+
+
+def test_retry_delay_from_header_seconds():
+  assert _rate_limit.retry_delay(_error({'Retry-After': '7'})) == 7
+
+
+def test_retry_delay_from_header_date():
+  retry_after = email.utils.formatdate(time.time() + 60, usegmt=True)
+
+  delay = _rate_limit.retry_delay(_error({'Retry-After': retry_after}))
+
+  assert 55 < delay <= 60
+
+
+def test_retry_delay_from_retry_info():
+  error = _error(
+      details=[
+          {'@type': 'type.googleapis.com/google.rpc.QuotaFailure'},
+          {
+              '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+              'retryDelay': '12.5s',
+          },
+      ]
+  )
+
+  assert _rate_limit.retry_delay(error) == 12.5
+
+
+def test_retry_delay_missing():
+  assert _rate_limit.retry_delay(_error()) is None
+
+
+def test_requests_are_spaced_by_rate(clock):
+  client = _client(types.HttpRateLimitOptions(requests_per_minute=60))
+
+  for _ in range(3):
+    client.request('post', 'models/gemini-2.0-flash:generateContent', {})
+
+  assert clock.sleeps == [1.0, 1.0]
+
+
+def test_burst_is_sent_at_once(clock):
+  client = _client(
+      types.HttpRateLimitOptions(requests_per_minute=60, burst=3)
+  )
+
+  for _ in range(4):
+    client.request('post', 'models/gemini-2.0-flash:generateContent', {})
+
+  assert clock.sleeps == [1.0]
+
+
+def test_requests_are_limited_per_model_and_method(clock):
+  client = _client(types.HttpRateLimitOptions(requests_per_minute=60))
+
+  client.request('post', 'models/gemini-2.0-flash:generateContent', {})
+  client.request('post', 'models/gemini-2.0-flash:streamGenerateContent', {})
+  client.request('post', 'models/gemini-2.0-flash:countTokens', {})
+  client.request('post', 'models/gemini-2.5-pro:generateContent', {})
+  client.request('get', 'files', {})
+
+  assert clock.sleeps == [1.0]
+
+
+def test_only_listed_methods_are_limited(clock):
+  client = _client(
+      types.HttpRateLimitOptions(
+          requests_per_minute=60, methods=['embedContent']
+      )
+  )
+
+  for _ in range(3):
+    client.request('post', 'models/gemini-2.0-flash:generateContent', {})
+
+  assert not clock.sleeps
+
+
+def test_too_many_requests_pauses_and_slows_down(clock):
+  responses = iter([
+      httpx.Response(429, headers={'Retry-After': '30'}, json={}),
+      httpx.Response(200, json={}),
+  ])
+  client = _client(
+      types.HttpRateLimitOptions(requests_per_minute=600, burst=10),
+      lambda request: next(responses),
+  )
+  path = 'models/gemini-2.0-flash:generateContent'
+
+  with pytest.raises(errors.ClientError):
+    client.request('post', path, {})
+  client.request('post', path, {})
+
+  assert clock.sleeps == [30.0]
+  limit = client._rate_limiter.get_limit(path)
+  assert limit.rate == pytest.approx(10 / 2 + 10 * 0.05)
+
+
+def test_non_adaptive_rate_is_kept(clock):
+  client = _client(
+      types.HttpRateLimitOptions(requests_per_minute=600, adaptive=False),
+      lambda request: httpx.Response(429, json={}),
+  )
+  path = 'models/gemini-2.0-flash:generateContent'
+
+  with pytest.raises(errors.ClientError):
+    client.request('post', path, {})
+
+  assert client._rate_limiter.get_limit(path).rate == 10
+
+
+def test_async_concurrency_is_limited():
+  in_flight = 0
+  max_in_flight = 0
+
+  async def handler(request):
+    nonlocal in_flight, max_in_flight
+    in_flight += 1
+    max_in_flight = max(max_in_flight, in_flight)
+    await asyncio.sleep(0.01)
+    in_flight -= 1
+    return httpx.Response(200, json={})
+
+  client = _client(
+      types.HttpRateLimitOptions(max_concurrent_requests=2), handler
+  )
+
+  async def run():
+    await asyncio.gather(*[
+        client.async_request(
+            'post', 'models/gemini-2.0-flash:generateContent', {}
+        )
+        for _ in range(6)
+    ])
+
+  asyncio.run(run())
+
+  assert max_in_flight == 2
+
+
+def test_async_concurrency_is_limited_across_event_loops():
+  async def handler(request):
+    await asyncio.sleep(0.01)
+    return httpx.Response(200, json={})
+
+  client = _client(
+      types.HttpRateLimitOptions(max_concurrent_requests=1), handler
+  )
+
+  async def run():
+    await asyncio.gather(*[
+        client.async_request(
+            'post', 'models/gemini-2.0-flash:generateContent', {}
+        )
+        for _ in range(3)
+    ])
+
+  asyncio.run(run())
+  asyncio.run(run())
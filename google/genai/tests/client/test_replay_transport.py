@@ -0,0 +1,315 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the recording and replay transports."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ... import _replay_api_client
+from ... import _replay_transport
+from ... import Client
+from ... import types
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+  """Stand-in for the API, answering with the text of the request."""
+  text = json.loads(request.content)['contents'][0]['parts'][0]['text']
+  chunk = {'candidates': [{'content': {'parts': [{'text': text}]}}]}
+  if 'alt=sse' in str(request.url):
+    return httpx.Response(
+        200,
+        content=''.join(f'data: {json.dumps(chunk)}\n\n' for _ in range(3)),
+    )
+  return httpx.Response(200, json=chunk)
+
+
+_BASE_URL = 'https://generativelanguage.googleapis.com/'
+
+
+def _client(transport, base_url=_BASE_URL) -> Client:
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          base_url=base_url,
+          client_args={'transport': transport},
+          async_client_args={'transport': transport},
+      ),
+  )
+
+
+@pytest.fixture
+def recording(tmp_path):
+  path = str(tmp_path / 'recording.jsonl')
+  client = _client(
+      _replay_transport.RecordingTransport(
+          path, transport=httpx.MockTransport(_handler)
+      )
+  )
+  for text in ['a', 'b']:
+    assert (
+        client.models.generate_content(
+            model='gemini-2.0-flash', contents=text
+        ).text
+        == text
+    )
+  chunks = list(
+      client.models.generate_content_stream(
+          model='gemini-2.0-flash', contents='c'
+      )
+  )
+  assert [chunk.text for chunk in chunks] == ['c'] * 3
+  return path
+
+
+def test_recording_is_redacted(recording):
+  with open(recording) as f:
+    interactions = [
+        _replay_api_client.ReplayInteraction.model_validate_json(line)
+        for line in f
+    ]
+
+  assert len(interactions) == 3
+  request = interactions[0].request
+  assert request.url.startswith('{MLDEV_URL_PREFIX}/models/gemini-2.0-flash')
+  assert request.headers['x-goog-api-key'] == '{REDACTED}'
+  assert len(interactions[2].response.body_segments) == 3
+  assert len(interactions[2].response.timing.segment_offsets) == 3
+
+
+def test_replay_in_any_order(recording):
+  client = _client(
+      _replay_transport.ReplayTransport(
+          _replay_transport.ReplayIndex.load(recording)
+      )
+  )
+
+  chunks = list(
+      client.models.generate_content_stream(
+          model='gemini-2.0-flash', contents='c'
+      )
+  )
+  texts = [
+      client.models.generate_content(
+          model='gemini-2.0-flash', contents=text
+      ).text
+      for text in ['b', 'a', 'b']
+  ]
+
+  assert [chunk.text for chunk in chunks] == ['c'] * 3
+  assert texts == ['b', 'a', 'b']
+
+
+def test_custom_base_url_is_redacted(tmp_path):
+  path = str(tmp_path / 'recording.jsonl')
+  recording_client = _client(
+      _replay_transport.RecordingTransport(
+          path, transport=httpx.MockTransport(_handler)
+      ),
+      base_url='https://proxy.example.com/genai/',
+  )
+  recording_client.models.generate_content(
+      model='gemini-2.0-flash', contents='a'
+  )
+  with open(path) as f:
+    interaction = _replay_api_client.ReplayInteraction.model_validate_json(
+        f.read()
+    )
+
+  replay_client = _client(
+      _replay_transport.ReplayTransport(
+          _replay_transport.ReplayIndex.load(path)
+      )
+  )
+  response = replay_client.models.generate_content(
+      model='gemini-2.0-flash', contents='a'
+  )
+
+  assert interaction.request.url == (
+      '{MLDEV_URL_PREFIX}/models/gemini-2.0-flash:generateContent'
+  )
+  assert response.text == 'a'
+
+
+def test_unrecorded_request(recording):
+  client = _client(
+      _replay_transport.ReplayTransport(
+          _replay_transport.ReplayIndex.load(recording)
+      )
+  )
+
+  with pytest.raises(ValueError, match='No recorded response'):
+    client.models.generate_content(model='gemini-2.0-flash', contents='d')
+
+
+def test_async_replay(recording):
+  client = _client(
+      _replay_transport.ReplayTransport(
+          _replay_transport.ReplayIndex.load(recording)
+      )
+  )
+
+  async def run():
+    responses = await asyncio.gather(*[
+        client.aio.models.generate_content(
+            model='gemini-2.0-flash', contents=text
+        )
+        for text in ['a', 'b'] * 5
+    ])
+    chunks = [
+        chunk
+        async for chunk in await client.aio.models.generate_content_stream(
+            model='gemini-2.0-flash', contents='c'
+        )
+    ]
+    return responses, chunks
+
+  responses, chunks = asyncio.run(run())
+
+  assert [response.text for response in responses] == ['a', 'b'] * 5
+  assert [chunk.text for chunk in chunks] == ['c'] * 3
+
+
+def _interaction(url, body, response_segments, status_code=200, timing=None):
+  return _replay_api_client.ReplayInteraction(
+      request=_replay_api_client.ReplayRequest(
+          method='post', url=url, headers={}, body_segments=[body]
+      ),
+      response=_replay_api_client.ReplayResponse(
+          status_code=status_code,
+          headers={'Content-Encoding': 'gzip'},
+          body_segments=response_segments,
+          sdk_response_segments=[],
+          timing=timing,
+      ),
+  )
+
+
+_OPERATION_URL = '{MLDEV_URL_PREFIX}/operations/a'
+
+
+def test_repeated_requests_are_replayed_in_turn():
+  index = _replay_transport.ReplayIndex([
+      _interaction(_OPERATION_URL, {}, [{'name': 'operations/a'}]),
+      _interaction(
+          _OPERATION_URL, {}, [{'name': 'operations/a', 'done': True}]
+      ),
+  ])
+  transport = _replay_transport.ReplayTransport(index)
+
+  with httpx.Client(transport=transport) as client:
+    done = [
+        client.post(
+            'https://generativelanguage.googleapis.com/v1beta/operations/a'
+        ).json().get('done')
+        for _ in range(3)
+    ]
+
+  assert done == [None, True, None]
+
+
+def test_replay_file_and_key_case(tmp_path):
+  replay_file = _replay_api_client.ReplayFile(
+      replay_id='a/b/mldev',
+      interactions=[
+          _interaction(
+              '{MLDEV_URL_PREFIX}/models/m:countTokens',
+              {'generation_config': {'max_output_tokens': 1}},
+              [{'totalTokens': 7}],
+          )
+      ],
+  )
+  (tmp_path / 'a').mkdir()
+  (tmp_path / 'a' / 'b.json').write_text(replay_file.model_dump_json())
+
+  index = _replay_transport.ReplayIndex.load(str(tmp_path))
+  with httpx.Client(
+      transport=_replay_transport.ReplayTransport(index)
+  ) as client:
+    response = client.post(
+        'https://generativelanguage.googleapis.com/v1beta/models/m:countTokens',
+        json={'generationConfig': {'maxOutputTokens': 1}},
+    )
+
+  assert len(index) == 1
+  assert response.json() == {'totalTokens': 7}
+
+
+def test_simulated_timing(monkeypatch):
+  sleeps = []
+  monkeypatch.setattr(
+      _replay_transport.time, 'sleep', lambda seconds: sleeps.append(seconds)
+  )
+  timing = _replay_api_client.ReplayTiming(
+      ttfb=0.5, latency=2, segment_offsets=[1, 1.5, 2]
+  )
+  index = _replay_transport.ReplayIndex([
+      _interaction(
+          '{MLDEV_URL_PREFIX}/models/m:streamGenerateContent?alt=sse',
+          {'contents': []},
+          [{'a': 1}, {'b': 2}, {'c': 3}],
+          timing=timing,
+      ),
+      _interaction(
+          '{MLDEV_URL_PREFIX}/models/m:countTokens',
+          {},
+          [{'totalTokens': 1}],
+          timing=_replay_api_client.ReplayTiming(ttfb=0.25, latency=1),
+      ),
+  ])
+  transport = _replay_transport.ReplayTransport(
+      index, simulate_timing=True, time_scale=2
+  )
+
+  with httpx.Client(
+      transport=transport,
+      base_url='https://generativelanguage.googleapis.com/v1beta/models',
+  ) as client:
+    with client.stream(
+        'POST', '/m:streamGenerateContent?alt=sse', json={'contents': []}
+    ) as response:
+      lines = [line for line in response.iter_lines() if line]
+    count = client.post('/m:countTokens').json()
+
+  assert lines == ['data: {"a": 1}', 'data: {"b": 2}', 'data: {"c": 3}']
+  assert count == {'totalTokens': 1}
+  assert sleeps == [1, 1, 1, 1, 0.5, 1.5]
+
+
+def test_timing_is_not_simulated_by_default(monkeypatch):
+  monkeypatch.setattr(
+      _replay_transport.time, 'sleep', pytest.fail
+  )
+  index = _replay_transport.ReplayIndex([
+      _interaction(
+          _OPERATION_URL,
+          {},
+          [{'name': 'operations/a'}],
+          timing=_replay_api_client.ReplayTiming(ttfb=1, latency=2),
+      ),
+  ])
+
+  with httpx.Client(
+      transport=_replay_transport.ReplayTransport(index)
+  ) as client:
+    response = client.post(
+        'https://generativelanguage.googleapis.com/v1beta/operations/a'
+    )
+
+  assert response.json() == {'name': 'operations/a'}
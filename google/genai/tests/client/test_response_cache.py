@@ -0,0 +1,321 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the client-side response cache."""
+
+import asyncio
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from ... import _response_cache
+from ... import types
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache_options(request, tmp_path):
+  if request.param == 'sqlite':
+    return types.HttpCacheOptions(
+        backend='sqlite', path=str(tmp_path / 'responses.db')
+    )
+  return types.HttpCacheOptions(backend='memory')
+
+
+class _FakeModelServer:
+  """Stand-in for the model methods, counting the requests it receives."""
+
+  def __init__(self):
+    self.requests: list[str] = []
+
+  def _respond(self, request: httpx.Request) -> httpx.Response:
+    method = request.url.path.rsplit(':', 1)[1]
+    self.requests.append(method)
+    if method == 'countTokens':
+      return httpx.Response(200, json={'totalTokens': len(self.requests)})
+    if method == 'batchEmbedContents':
+      return httpx.Response(
+          200, json={'embeddings': [{'values': [len(self.requests)]}]}
+      )
+    return httpx.Response(
+        200,
+        json={
+            'candidates': [{
+                'content': {
+                    'role': 'model',
+                    'parts': [{'text': str(len(self.requests))}],
+                }
+            }]
+        },
+    )
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    return self._respond(request)
+
+  async def handle_async(self, request: httpx.Request) -> httpx.Response:
+    return self._respond(request)
+
+
+def test_deterministic_requests_are_cached(
+    mock_transport_client, cache_options
+):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  for _ in range(2):
+    tokens = client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+    embedding = client.models.embed_content(
+        model='text-embedding-004', contents='a'
+    )
+    response = client.models.generate_content(
+        model='gemini-2.0-flash', contents='a', config={'temperature': 0}
+    )
+
+  assert server.requests == [
+      'countTokens',
+      'batchEmbedContents',
+      'generateContent',
+  ]
+  assert tokens.total_tokens == 1
+  assert embedding.embeddings[0].values == [2]
+  assert response.text == '3'
+  assert response.sdk_http_response.headers is not None
+
+
+def test_sampled_requests_are_not_cached(mock_transport_client, cache_options):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  for temperature in [None, 0.5, 0.5]:
+    client.models.generate_content(
+        model='gemini-2.0-flash',
+        contents='a',
+        config={'temperature': temperature},
+    )
+
+  assert len(server.requests) == 3
+
+
+def test_requests_are_cached_by_model_and_body(
+    mock_transport_client, cache_options
+):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+  client.models.count_tokens(model='gemini-2.0-flash', contents='b')
+  client.models.count_tokens(model='gemini-1.5-flash', contents='a')
+  client.models.count_tokens(model='gemini-1.5-flash', contents='a')
+
+  assert len(server.requests) == 3
+
+
+def test_methods(mock_transport_client, cache_options):
+  server = _FakeModelServer()
+  cache_options.methods = ['embedContent', 'batchEmbedContents']
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  for _ in range(2):
+    client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+    client.models.embed_content(model='text-embedding-004', contents='a')
+
+  assert server.requests == [
+      'countTokens',
+      'batchEmbedContents',
+      'countTokens',
+  ]
+
+
+def test_ttl(mock_transport_client, cache_options, clock):
+  server = _FakeModelServer()
+  cache_options.ttl = 60
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+  clock.now += 59
+  client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+  clock.now += 1
+  client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+
+  assert len(server.requests) == 2
+
+
+def _response(body: str) -> types.HttpResponse:
+  return types.HttpResponse(headers={'a': 'b'}, body=body)
+
+
+def test_least_recently_used_are_evicted(cache_options, clock):
+  cache_options.max_entries = 2
+  cache = _response_cache.create_response_cache(cache_options)
+
+  cache.set('a', _response('1'))
+  clock.now += 1
+  cache.set('b', _response('2'))
+  clock.now += 1
+  cache.get('a')
+  clock.now += 1
+  cache.set('c', _response('3'))
+
+  assert cache.get('a') == _response('1')
+  assert cache.get('b') is None
+  assert cache.get('c') == _response('3')
+  assert len(cache) == 2
+
+
+def test_evicted_by_size(cache_options, clock):
+  cache_options.max_size_bytes = 10
+  cache = _response_cache.create_response_cache(cache_options)
+
+  cache.set('a', _response('1234'))
+  clock.now += 1
+  cache.set('b', _response('5678'))
+  clock.now += 1
+  cache.set('c', _response('90'))
+  cache.set('too large', _response('x' * 11))
+
+  assert len(cache) == 3
+  clock.now += 1
+  cache.set('d', _response('12'))
+
+  assert cache.get('a') is None
+  assert [cache.get(key) is None for key in 'bcd'] == [False] * 3
+  assert cache.get('too large') is None
+
+
+def test_cache_key_is_canonical():
+  url = 'https://example.com/v1beta/models/gemini-2.0-flash:countTokens'
+
+  key = _response_cache.cache_key('post', url, {'a': 1, 'b': {'c': 2, 'd': 3}})
+
+  assert key == _response_cache.cache_key(
+      'POST', url, json.loads('{"b": {"d": 3, "c": 2}, "a": 1}')
+  )
+  assert key != _response_cache.cache_key('post', url, {'a': 1})
+
+
+def test_sqlite_cache_is_persistent(tmp_path):
+  options = types.HttpCacheOptions(
+      backend='sqlite', path=str(tmp_path / 'responses.db')
+  )
+
+  _response_cache.create_response_cache(options).set('a', _response('1'))
+
+  cache = _response_cache.create_response_cache(options)
+  assert cache.get('a') == _response('1')
+
+
+def test_unsupported_backend():
+  with pytest.raises(ValueError, match='backend'):
+    _response_cache.create_response_cache(
+        types.HttpCacheOptions(backend='redis')
+    )
+
+
+def test_sqlite_backend_requires_path():
+  with pytest.raises(ValueError, match='path'):
+    _response_cache.create_response_cache(
+        types.HttpCacheOptions(backend='sqlite')
+    )
+
+
+def test_async_requests_are_cached(mock_transport_client, cache_options):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  async def run():
+    return [
+        await client.aio.models.generate_content(
+            model='gemini-2.0-flash', contents='a', config={'temperature': 0}
+        )
+        for _ in range(3)
+    ]
+
+  responses = asyncio.run(run())
+
+  assert server.requests == ['generateContent']
+  assert [response.text for response in responses] == ['1'] * 3
+
+
+def test_responses_are_not_shared_across_api_keys(
+    mock_transport_client, tmp_path
+):
+  server = _FakeModelServer()
+  options = types.HttpCacheOptions(
+      backend='sqlite', path=str(tmp_path / 'responses.db')
+  )
+  clients = [
+      mock_transport_client(server, cache_options=options),
+      mock_transport_client(server, cache_options=options),
+      mock_transport_client(
+          server, cache_options=options, api_key='other-api-key'
+      ),
+  ]
+
+  tokens = [
+      client.models.count_tokens(
+          model='gemini-2.0-flash', contents='a'
+      ).total_tokens
+      for client in clients
+  ]
+
+  assert tokens == [1, 1, 2]
+
+
+def test_requests_are_cached_by_headers(mock_transport_client, cache_options):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=cache_options)
+
+  for header in ['a', 'b', 'a']:
+    client.models.count_tokens(
+        model='gemini-2.0-flash',
+        contents='a',
+        config={'http_options': {'headers': {'x-test': header}}},
+    )
+
+  assert len(server.requests) == 2
+
+
+class _FailingCache(_response_cache.ResponseCache):
+
+  def get(self, key):
+    raise sqlite3.OperationalError('database is locked')
+
+  def set(self, key, response):
+    raise sqlite3.OperationalError('database is locked')
+
+
+def test_cache_failures_are_logged(mock_transport_client, caplog):
+  server = _FakeModelServer()
+  client = mock_transport_client(server, cache_options=types.HttpCacheOptions())
+  client._api_client._response_cache = _FailingCache(types.HttpCacheOptions())
+
+  tokens = client.models.count_tokens(model='gemini-2.0-flash', contents='a')
+
+  async def run():
+    return await client.aio.models.count_tokens(
+        model='gemini-2.0-flash', contents='a'
+    )
+
+  async_tokens = asyncio.run(run())
+
+  assert (tokens.total_tokens, async_tokens.total_tokens) == (1, 2)
+  assert 'database is locked' in caplog.text
+
+
+def test_response_cache_is_abstract():
+  with pytest.raises(TypeError):
+    _response_cache.ResponseCache(types.HttpCacheOptions())
@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for framing streamed responses."""
+
+import asyncio
+
+import httpx
+
+from ... import _api_client as api_client
+
+
+def _frame(*data: bytes) -> list[str]:
+  framer = api_client._ResponseStreamFramer()
+  frames = []
+  for d in data:
+    frames.extend(framer.feed(d))
+  frames.extend(framer.flush())
+  return frames
+
+
+def test_sse_data_lines():
+  assert _frame(b'data: {"a": 1}\r\n\r\ndata: {"b": 2}\r\n\r\n') == [
+      '{"a": 1}',
+      '{"b": 2}',
+  ]
+
+
+def test_sse_data_split_across_chunks():
+  body = b'data: {"text": "hello"}\n\ndata: {"text": "world"}\n\n'
+  for i in range(1, len(body)):
+    assert _frame(body[:i], body[i:]) == [
+        '{"text": "hello"}',
+        '{"text": "world"}',
+    ]
+
+
+def test_sse_multi_line_record():
+  assert _frame(b'data: {"a":\ndata: 1}\n\n') == ['{"a":\n1}']
+
+
+def test_sse_ignores_event_id_and_comment_fields():
+  body = b': keep-alive\nevent: message\nid: 1\nretry: 10\ndata:{"a": 1}\n\n'
+  assert _frame(body) == ['{"a": 1}']
+
+
+def test_sse_record_without_trailing_blank_line():
+  assert _frame(b'data: {"a": 1}') == ['{"a": 1}']
+
+
+def test_multi_line_json_error():
+  body = b'{\n  "error": {\n    "code": 400\n  }\n}\n'
+  assert _frame(body) == ['{  "error": {    "code": 400  }}']
+
+
+def test_utf8_split_across_chunks():
+  body = 'data: {"text": "héllo"}\n\n'.encode('utf-8')
+  split = body.index(b'\xc3') + 1
+  assert _frame(body[:split], body[split:]) == ['{"text": "héllo"}']
+
+
+def _stream_response(*chunks: bytes) -> httpx.Response:
+  return httpx.Response(200, stream=httpx.ByteStream(b''.join(chunks)))
+
+
+def test_http_response_segments():
+  response = api_client.HttpResponse(
+      headers={},
+      response_stream=_stream_response(
+          b'data: {"a": 1}\n\n', b'data: {"b": 2}\n\n'
+      ),
+  )
+  assert list(response.segments()) == [{'a': 1}, {'b': 2}]
+
+
+def test_http_response_async_segments():
+
+  class _AsyncByteStream(httpx.AsyncByteStream):
+
+    async def __aiter__(self):
+      yield b'data: {"a"'
+      yield b': 1}\n\ndata: {"b": 2}\n\n'
+
+  response = api_client.HttpResponse(
+      headers={},
+      response_stream=httpx.Response(200, stream=_AsyncByteStream()),
+  )
+
+  async def run():
+    return [segment async for segment in response.async_segments()]
+
+  assert asyncio.run(run()) == [{'a': 1}, {'b': 2}]
+
+
+def _streaming_client() -> api_client.BaseApiClient:
+  def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={'x-test': 'yes'},
+        content=b'data: {"a": 1}\n\ndata: {"b": 2}\n\n',
+    )
+
+  transport = httpx.MockTransport(handler)
+  return api_client.BaseApiClient(
+      api_key='test-api-key',
+      http_options={
+          'client_args': {'transport': transport},
+          'async_client_args': {'transport': transport},
+      },
+  )
+
+
+def test_request_streamed_json():
+  client = _streaming_client()
+
+  chunks = list(client.request_streamed_json('post', 'models/m:stream', {}))
+
+  assert [chunk for _, chunk in chunks] == [{'a': 1}, {'b': 2}]
+  assert chunks[0][0]['x-test'] == 'yes'
+
+
+def test_request_streamed_keeps_json_body():
+  client = _streaming_client()
+
+  responses = list(client.request_streamed('post', 'models/m:stream', {}))
+
+  assert [response.body for response in responses] == ['{"a": 1}', '{"b": 2}']
+
+
+def test_async_request_streamed_json():
+  client = _streaming_client()
+
+  async def run():
+    chunks = await client.async_request_streamed_json(
+        'post', 'models/m:stream', {}
+    )
+    return [chunk async for _, chunk in chunks]
+
+  assert asyncio.run(run()) == [{'a': 1}, {'b': 2}]
@@ -173,6 +173,117 @@ def test_retry_args_enabled_with_custom_values_are_not_overridden():
       assert not retry.predicate(e)
 
 
+def _retry_with_fake_clock(clock, options, responses):
+  responses = iter(responses)
+  calls = []
+
+  def fn():
+    calls.append(clock.now)
+    errors.APIError.raise_for_response(next(responses))
+
+  retrying = tenacity.Retrying(
+      sleep=clock.sleep, **api_client.retry_args(options)
+  )
+  with pytest.raises(errors.APIError):
+    retrying(fn)
+  return calls
+
+
+def _too_many_requests(headers=None, retry_delay=None):
+  details = []
+  if retry_delay is not None:
+    details.append({
+        '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+        'retryDelay': retry_delay,
+    })
+  return httpx.Response(
+      status_code=429,
+      headers=headers,
+      json={'error': {'code': 429, 'details': details}},
+  )
+
+
+def test_retry_wait_honors_retry_after_header(clock):
+  _retry_with_fake_clock(
+      clock,
+      types.HttpRetryOptions(attempts=3),
+      [_too_many_requests({'Retry-After': '7'})] * 3,
+  )
+
+  assert clock.sleeps == [7, 7]
+
+
+def test_retry_wait_honors_retry_info(clock):
+  _retry_with_fake_clock(
+      clock,
+      types.HttpRetryOptions(attempts=3),
+      [_too_many_requests(retry_delay='0.5s'), _httpx_response(503)] * 2,
+  )
+
+  assert clock.sleeps[0] == 0.5
+  assert 1 <= clock.sleeps[1] <= 3
+
+
+def test_retry_stops_when_server_delay_exceeds_total_timeout(clock):
+  calls = _retry_with_fake_clock(
+      clock,
+      types.HttpRetryOptions(attempts=5, total_timeout=10),
+      [_too_many_requests({'Retry-After': '30'})] * 5,
+  )
+
+  assert len(calls) == 1
+  assert not clock.sleeps
+
+
+def test_retry_wait_is_capped_by_total_timeout(clock):
+  calls = _retry_with_fake_clock(
+      clock,
+      types.HttpRetryOptions(
+          attempts=10, initial_delay=4, jitter=0.1, total_timeout=10
+      ),
+      [_httpx_response(503)] * 10,
+  )
+
+  assert sum(clock.sleeps) == pytest.approx(10)
+  assert calls[-1] == pytest.approx(10)
+  assert len(calls) == 3
+
+
+def test_retry_wait_caps_server_delay_at_max_delay(clock):
+  _retry_with_fake_clock(
+      clock,
+      types.HttpRetryOptions(attempts=3, max_delay=5),
+      [_too_many_requests({'Retry-After': '120'})] * 3,
+  )
+
+  assert clock.sleeps == [5, 5]
+
+
+def test_attempt_timeout_is_capped_by_total_timeout():
+  timeouts = []
+
+  def handler(request):
+    timeouts.append(request.extensions['timeout']['read'])
+    return _httpx_response(503 if len(timeouts) < 3 else 200)
+
+  client = api_client.BaseApiClient(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          timeout=30_000,
+          retry_options=types.HttpRetryOptions(
+              attempts=3, initial_delay=0.01, jitter=0.01, total_timeout=10
+          ),
+          client_args={'transport': httpx.MockTransport(handler)},
+      ),
+  )
+
+  client.request(http_method='GET', path='path', request_dict={})
+
+  assert len(timeouts) == 3
+  assert all(9 < timeout <= 10 for timeout in timeouts)
+  assert timeouts == sorted(timeouts, reverse=True)
+
+
 def _patch_auth_default():
   return mock.patch(
       'google.auth.default',
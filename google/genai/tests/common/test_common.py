@@ -16,6 +16,7 @@
 
 """Tests tools in the _common module."""
 
+import datetime
 from enum import Enum
 import inspect
 import logging
@@ -56,6 +57,211 @@ def test_warn_at_call_line():
   assert captured_warnings[0].lineno == call_line
 
 
+def test_response_kwargs_keeps_only_response_config_fields():
+  class Recipe(pydantic.BaseModel):
+    name: str
+
+  parameter_model = types._GenerateContentParameters(
+      model='gemini-2.0-flash',
+      contents=[types.Content(parts=[types.Part(text='x' * 1024)])],
+      config=types.GenerateContentConfig(
+          temperature=0.5,
+          response_mime_type='application/json',
+          response_schema=list[Recipe],
+      ),
+  )
+
+  assert _common.response_kwargs(parameter_model) == {
+      'config': {'response_schema': list[Recipe]}
+  }
+
+
+def test_response_kwargs_without_config():
+  assert _common.response_kwargs(types.LiveServerMessage()) == {}
+  assert _common.response_kwargs(
+      types._GenerateContentParameters(model='gemini-2.0-flash')
+  ) == {}
+
+
+def _reference_get_value_by_path(data, keys):
+  """get_value_by_path before its fast paths, to check they are equivalent."""
+  if keys == ['_self']:
+    return data
+  for i, key in enumerate(keys):
+    if not data:
+      return None
+    if key.endswith('[]'):
+      key_name = key[:-2]
+      if key_name in data:
+        return [
+            _reference_get_value_by_path(d, keys[i + 1 :])
+            for d in data[key_name]
+        ]
+      else:
+        return None
+    elif key.endswith('[0]'):
+      key_name = key[:-3]
+      if key_name in data and data[key_name]:
+        return _reference_get_value_by_path(data[key_name][0], keys[i + 1 :])
+      else:
+        return None
+    else:
+      if key in data:
+        data = data[key]
+      elif isinstance(data, _common.BaseModel) and hasattr(data, key):
+        data = getattr(data, key)
+      else:
+        return None
+  return data
+
+
+_GET_VALUE_DATA = [
+    None,
+    {},
+    [],
+    '',
+    {'a': None},
+    {'a': 0},
+    {'a': {'b': 'v'}},
+    {'a': {'b': []}},
+    {'a': {'b': [{'c': 1}, {'c': 2}, {}]}},
+    {'a': [{'b': 1}]},
+    {'parts': [types.Part(text='x'), {'text': 'y'}]},
+    types.Content(role='user', parts=[types.Part(text='x')]),
+    types.Content(parts=[]),
+    types.GenerateContentConfig(temperature=0.0, stop_sequences=['a']),
+]
+_GET_VALUE_PATHS = [
+    ['_self'],
+    ['a'],
+    ['a', 'b'],
+    ['a', 'b[]', 'c'],
+    ['a[0]', 'b'],
+    ['a', 'missing'],
+    ['role'],
+    ['parts'],
+    ['parts[]', 'text'],
+    ['parts[0]', 'text'],
+    ['temperature'],
+    ['stop_sequences'],
+    ['model_fields'],
+]
+
+
+@pytest.mark.parametrize('data', _GET_VALUE_DATA)
+@pytest.mark.parametrize('keys', _GET_VALUE_PATHS)
+def test_get_value_by_path_matches_reference(data, keys):
+  def outcome(get_value_by_path):
+    try:
+      return get_value_by_path(data, keys)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      return type(e)
+
+  assert outcome(_common.get_value_by_path) == outcome(
+      _reference_get_value_by_path
+  )
+
+
+def test_set_value_by_path_single_key():
+  data = {'a': 1, 'b': {'c': 1}, 'e': 'x'}
+
+  _common.set_value_by_path(data, ['a'], 1)
+  _common.set_value_by_path(data, ['b'], {'d': 2})
+  _common.set_value_by_path(data, ['e'], '')
+  _common.set_value_by_path(data, ['f'], 0)
+  _common.set_value_by_path(data, ['g'], None)
+
+  assert data == {'a': 1, 'b': {'c': 1, 'd': 2}, 'e': 'x', 'f': 0}
+  with pytest.raises(ValueError):
+    _common.set_value_by_path(data, ['a'], 2)
+
+
+def test_remove_extra_fields_nested():
+  response = {
+      'candidates': [{
+          'content': {
+              'parts': [{
+                  'text': 'hello',
+                  'functionCall': {'name': 'f', 'args': {'unknown': 1}},
+                  'unknownPartField': 1,
+              }],
+              'role': 'model',
+          },
+          'unknownCandidateField': {'a': 1},
+      }],
+      'usageMetadata': {'totalTokenCount': 1, 'unknownUsageField': 1},
+      'unknownField': 'value',
+  }
+
+  _common._remove_extra_fields(types.GenerateContentResponse, response)
+
+  assert response == {
+      'candidates': [{
+          'content': {
+              'parts': [{
+                  'text': 'hello',
+                  'functionCall': {'name': 'f', 'args': {'unknown': 1}},
+              }],
+              'role': 'model',
+          },
+      }],
+      'usageMetadata': {'totalTokenCount': 1},
+  }
+
+
+def test_remove_extra_fields_recursive_model():
+  response = {
+      'type': 'ARRAY',
+      'items': {'type': 'OBJECT', 'unknown': 1},
+      'anyOf': [{'type': 'STRING', 'unknown': 1}],
+      'unknown': 1,
+  }
+
+  _common._remove_extra_fields(types.Schema, response)
+
+  assert response == {
+      'type': 'ARRAY',
+      'items': {'type': 'OBJECT'},
+      'anyOf': [{'type': 'STRING'}],
+  }
+
+
+def test_remove_extra_fields_reuses_pruning_plan():
+  _common._remove_extra_fields(types.ListModelsResponse, {'models': [{}]})
+  plan = _common._pruning_plans[types.ListModelsResponse]
+
+  _common._remove_extra_fields(types.ListModelsResponse, {'models': [{}]})
+
+  assert _common._pruning_plans[types.ListModelsResponse] is plan
+  assert plan['models'] == (None, types.Model)
+
+
+def test_encode_unserializable_types():
+  timestamp = datetime.datetime(2025, 1, 2, 3, 4, 5)
+  data = {
+      'blob': types.Blob(data=b'\xff\x00', mime_type='image/png'),
+      'parts': [{'data': b'abc'}, types.Part(text='hi'), 'text'],
+      'timestamps': [timestamp],
+      'values': [b'a', b'b'],
+      'nested': {'data': b'\x01', 'time': timestamp, 'none': None},
+  }
+
+  assert _common.encode_unserializable_types(data) == {
+      'blob': {'data': '_wA=', 'mime_type': 'image/png'},
+      'parts': [{'data': 'YWJj'}, {'text': 'hi'}, 'text'],
+      'timestamps': ['2025-01-02T03:04:05'],
+      'values': ['YQ==', 'Yg=='],
+      'nested': {'data': 'AQ==', 'time': '2025-01-02T03:04:05', 'none': None},
+  }
+
+
+def test_encode_unserializable_types_mixed_list():
+  # Encodes each item of a list holding bytes and other values.
+  assert _common.encode_unserializable_types({'list': [b'a', 1, [b'b']]}) == {
+      'list': ['YQ==', 1, ['Yg==']]
+  }
+
+
 def test_is_struct_type():
   assert _common._is_struct_type(list[dict[str, typing.Any]])
   assert _common._is_struct_type(typing.List[typing.Dict[str, typing.Any]])
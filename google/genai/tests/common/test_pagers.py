@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the pagers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from ... import pagers
+from ... import types
+
+
+_PAGES = [['a', 'b'], ['c', 'd'], ['e']]
+
+
+def _response(page_token):
+  index = int(page_token or 0)
+  next_page_token = str(index + 1) if index + 1 < len(_PAGES) else None
+  return types.ListFilesResponse(
+      files=[types.File(name=name) for name in _PAGES[index]],
+      next_page_token=next_page_token,
+  )
+
+
+class _FakeList:
+  """Stand-in for files._list, recording the page tokens requested."""
+
+  def __init__(self, fail_at=None):
+    self.page_tokens = []
+    self.fail_at = fail_at
+
+  def __call__(self, config):
+    page_token = config.get('page_token')
+    self.page_tokens.append(page_token)
+    if self.fail_at is not None and page_token == self.fail_at:
+      raise ValueError('failed')
+    return _response(page_token)
+
+  async def async_call(self, config):
+    await asyncio.sleep(0)
+    return self(config)
+
+
+def _names(pages):
+  return [[file.name for file in page] for page in pages]
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iter_pages(prefetch):
+  request = _FakeList()
+  pager = pagers.Pager('files', request, request({}), {'page_size': 2})
+
+  pages = list(pager.iter_pages(prefetch=prefetch))
+
+  assert _names(pages) == _PAGES
+  assert request.page_tokens == [None, '1', '2']
+  assert pager.page == pages[-1]
+  assert pager.config == {'page_size': 2, 'page_token': None}
+
+
+def test_iter_pages_prefetches_next_page():
+  fetched = threading.Event()
+
+  def request(config):
+    response = _response(config.get('page_token'))
+    if config.get('page_token'):
+      fetched.set()
+    return response
+
+  pager = pagers.Pager('files', request, request({}), None)
+  pages = pager.iter_pages(prefetch=1)
+
+  next(pages)
+  next(pages)
+
+  # The third page is fetched while the second one is processed.
+  assert fetched.wait(timeout=5)
+  assert _names(pages) == _PAGES[2:]
+
+
+def test_iter_pages_raises_request_error():
+  request = _FakeList(fail_at='2')
+  pager = pagers.Pager('files', request, request({}), None)
+
+  pages = pager.iter_pages(prefetch=1)
+
+  with pytest.raises(ValueError, match='failed'):
+    list(pages)
+
+
+def test_config_is_not_modified():
+  config = {'page_size': 2, 'http_options': {'headers': {'a': 'b'}}}
+  request = _FakeList()
+
+  pager = pagers.Pager('files', request, request(config), config)
+  list(pager)
+
+  assert config == {'page_size': 2, 'http_options': {'headers': {'a': 'b'}}}
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_async_iter_pages(prefetch):
+  request = _FakeList()
+
+  async def run():
+    pager = pagers.AsyncPager(
+        'files', request.async_call, await request.async_call({}), None
+    )
+    return [page async for page in pager.iter_pages(prefetch=prefetch)]
+
+  pages = asyncio.run(run())
+
+  assert _names(pages) == _PAGES
+  assert request.page_tokens == [None, '1', '2']
+
+
+def test_async_iter_pages_stops_prefetching_on_close():
+  request = _FakeList()
+
+  async def run():
+    pager = pagers.AsyncPager(
+        'files', request.async_call, await request.async_call({}), None
+    )
+    async for _ in pager.iter_pages(prefetch=1):
+      break
+    await asyncio.sleep(0.01)
+
+  asyncio.run(run())
+
+  assert len(request.page_tokens) <= 2
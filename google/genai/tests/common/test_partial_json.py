@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for PartialJsonParser."""
+
+import json
+
+import pytest
+
+from ... import _partial_json
+
+
+_DOCUMENT = {
+    'name': 'Jo "the" \\ Doe\né',
+    'age': 42,
+    'scores': [1.5, -2e3, True, False, None],
+    'address': {'city': 'Paris', 'tags': [[], {}]},
+    'empty': '',
+}
+
+
+def _feed(text: str, piece_size: int) -> _partial_json.PartialJsonParser:
+  parser = _partial_json.PartialJsonParser()
+  for i in range(0, len(text), piece_size):
+    parser.feed(text[i : i + piece_size])
+    parser.value
+  return parser
+
+
+@pytest.mark.parametrize('piece_size', [1, 2, 3, 7, 1000])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_complete_document(piece_size, indent):
+  text = json.dumps(_DOCUMENT, indent=indent)
+
+  parser = _feed(text, piece_size)
+
+  assert parser.value == _DOCUMENT
+  assert parser.text == text
+
+
+def test_every_prefix_parses():
+  text = json.dumps(_DOCUMENT)
+  for end in range(len(text) + 1):
+    parser = _partial_json.PartialJsonParser()
+    parser.feed(text[:end])
+    value = parser.value
+    if end > 0:
+      assert isinstance(value, dict)
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected'),
+    [
+        ('', None),
+        ('{', {}),
+        ('{"na', {}),
+        ('{"name"', {}),
+        ('{"name": ', {}),
+        ('{"name": "Jo', {'name': 'Jo'}),
+        ('{"name": "Jo\\', {'name': 'Jo'}),
+        ('{"name": "Jo\\u00', {'name': 'Jo'}),
+        ('{"name": "Jo\\u00e9', {'name': 'Joé'}),
+        ('{"name": "Jo", "age": 4', {'name': 'Jo'}),
+        ('{"name": "Jo", "age": 42,', {'name': 'Jo', 'age': 42}),
+        ('{"ok": tru', {}),
+        ('[1, [2, 3', [1, [2]]),
+        ('[1, [2, 3]', [1, [2, 3]]),
+        ('"partial', 'partial'),
+        ('42', None),
+    ],
+)
+def test_partial_document(text, expected):
+  parser = _partial_json.PartialJsonParser()
+  parser.feed(text)
+
+  assert parser.value == expected
+
+
+def test_invalid_document_keeps_last_value():
+  parser = _partial_json.PartialJsonParser()
+  parser.feed('{"a": 1, "b": 2')
+  assert parser.value == {'a': 1}
+
+  parser.feed('x}')
+
+  assert parser.value == {'a': 1}
+
+
+def test_surrogate_pair_split_across_pieces():
+  text = json.dumps({'emoji': '😀'})
+
+  parser = _feed(text, 1)
+
+  assert parser.value == {'emoji': '😀'}
+
+
+def test_earlier_values_are_not_changed_by_later_pieces():
+  parser = _partial_json.PartialJsonParser()
+  parser.feed('{"a": [1, {"b": "x')
+  first = parser.value
+
+  parser.feed('y"}, 2]}')
+
+  assert first == {'a': [1, {'b': 'x'}]}
+  assert parser.value == {'a': [1, {'b': 'xy'}, 2]}
+
+
+def test_text_is_not_parsed_again(monkeypatch):
+  loads = json.loads
+  parsed_lengths = []
+
+  def recording_loads(s, **kwargs):
+    parsed_lengths.append(len(s))
+    return loads(s, **kwargs)
+
+  monkeypatch.setattr(_partial_json.json, 'loads', recording_loads)
+  text = json.dumps([_DOCUMENT] * 50)
+
+  parser = _feed(text, 5)
+
+  assert parser.value == [_DOCUMENT] * 50
+  assert max(parsed_lengths) <= 10
+
+
+def test_invalid_escape_keeps_last_value():
+  parser = _partial_json.PartialJsonParser()
+  parser.feed('{"a": 1, "b": "c')
+  assert parser.value == {'a': 1, 'b': 'c'}
+
+  parser.feed('\\x"}')
+
+  assert parser.value == {'a': 1, 'b': 'c'}
@@ -0,0 +1,200 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for batches.wait and operations.wait."""
+
+import asyncio
+import collections
+import threading
+
+import httpx
+import pytest
+
+from ... import Client
+from ... import types
+
+
+class _FakeJobServer:
+  """Stand-in for batches.get, finishing each job after a number of polls."""
+
+  def __init__(self, polls_until_done: dict[str, int]):
+    self.polls_until_done = polls_until_done
+    self.polls: collections.Counter[str] = collections.Counter()
+    self._lock = threading.Lock()
+
+  def _respond(self, request: httpx.Request) -> httpx.Response:
+    name = request.url.path.split('/', 2)[2]
+    with self._lock:
+      self.polls[name] += 1
+      done = self.polls[name] >= self.polls_until_done[name]
+    if name.startswith('operations/'):
+      return httpx.Response(200, json={'name': name, 'done': done})
+    state = 'BATCH_STATE_SUCCEEDED' if done else 'BATCH_STATE_RUNNING'
+    return httpx.Response(
+        200, json={'name': name, 'metadata': {'state': state}}
+    )
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    return self._respond(request)
+
+  async def handle_async(self, request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0)
+    return self._respond(request)
+
+
+def test_batch_jobs_are_yielded_as_they_are_done(mock_transport_client, clock):
+  server = _FakeJobServer({'batches/a': 3, 'batches/b': 1, 'batches/c': 2})
+
+  jobs = list(
+      mock_transport_client(server).batches.wait(
+          names=['batches/a', 'batches/b', 'batches/c'],
+          config={'initial_interval': 1, 'multiplier': 2},
+      )
+  )
+
+  assert [job.name for job in jobs] == ['batches/b', 'batches/c', 'batches/a']
+  assert all(
+      job.state == types.JobState.JOB_STATE_SUCCEEDED for job in jobs
+  )
+  # Polls at 0, 1 and 3 seconds.
+  assert clock.sleeps == [1.0, 2.0]
+  assert server.polls == {'batches/a': 3, 'batches/b': 1, 'batches/c': 2}
+
+
+def test_poll_interval_is_capped(mock_transport_client, clock):
+  server = _FakeJobServer({'batches/a': 5})
+
+  list(
+      mock_transport_client(server).batches.wait(
+          names=['batches/a'],
+          config=types.WaitConfig(
+              initial_interval=10, max_interval=30, multiplier=2
+          ),
+      )
+  )
+
+  assert clock.sleeps == [10.0, 20.0, 30.0, 30.0]
+
+
+def test_timeout(mock_transport_client, clock):
+  server = _FakeJobServer({'batches/a': 100, 'batches/b': 1})
+  jobs = mock_transport_client(server).batches.wait(
+      names=['batches/a', 'batches/b'],
+      config={'initial_interval': 10, 'multiplier': 1, 'timeout': 25},
+  )
+
+  assert next(jobs).name == 'batches/b'
+  with pytest.raises(TimeoutError):
+    next(jobs)
+  # Polls at 0, 10, 20 and, one last time, at the deadline.
+  assert server.polls['batches/a'] == 4
+
+
+def test_polls_are_concurrent():
+  in_flight = 0
+  max_in_flight = 0
+  lock = threading.Lock()
+  released = threading.Event()
+
+  def handler(request):
+    nonlocal in_flight, max_in_flight
+    with lock:
+      in_flight += 1
+      max_in_flight = max(max_in_flight, in_flight)
+      if max_in_flight == 3:
+        released.set()
+    released.wait(timeout=5)
+    with lock:
+      in_flight -= 1
+    return httpx.Response(
+        200,
+        json={'name': 'batches/a', 'metadata': {'state': 'BATCH_STATE_FAILED'}},
+    )
+
+  client = Client(
+      api_key='test-api-key',
+      http_options={
+          'client_args': {'transport': httpx.MockTransport(handler)},
+          'async_client_args': {'transport': httpx.MockTransport(handler)},
+      },
+  )
+
+  jobs = list(
+      client.batches.wait(
+          names=['batches/a', 'batches/b', 'batches/c', 'batches/d'],
+          config={'max_concurrent_requests': 3},
+      )
+  )
+
+  assert len(jobs) == 4
+  assert max_in_flight == 3
+
+
+def test_operations_are_yielded_as_they_are_done(mock_transport_client, clock):
+  server = _FakeJobServer({'operations/a': 2, 'operations/b': 1})
+
+  operations = list(
+      mock_transport_client(server).operations.wait(
+          [
+              types.GenerateVideosOperation(name='operations/a'),
+              types.GenerateVideosOperation(name='operations/b'),
+          ],
+          config={'initial_interval': 1},
+      )
+  )
+
+  assert [operation.name for operation in operations] == [
+      'operations/b',
+      'operations/a',
+  ]
+  assert all(operation.done for operation in operations)
+  assert isinstance(operations[0], types.GenerateVideosOperation)
+
+
+def test_async_batch_jobs_are_yielded_as_they_are_done(mock_transport_client):
+  server = _FakeJobServer({'batches/a': 2, 'batches/b': 1})
+
+  async def run():
+    return [
+        job
+        async for job in mock_transport_client(server).aio.batches.wait(
+            names=['batches/a', 'batches/b'],
+            config={'initial_interval': 0.01},
+        )
+    ]
+
+  jobs = asyncio.run(run())
+
+  assert [job.name for job in jobs] == ['batches/b', 'batches/a']
+
+
+def test_async_operations_are_yielded_as_they_are_done(mock_transport_client):
+  server = _FakeJobServer({'operations/a': 3})
+  client = mock_transport_client(server)
+
+  async def run():
+    return [
+        operation
+        async for operation in client.aio.operations.wait(
+            [types.GenerateVideosOperation(name='operations/a')],
+            config={'initial_interval': 0.01, 'timeout': 5},
+        )
+    ]
+
+  operations = asyncio.run(run())
+
+  assert [operation.done for operation in operations] == [True]
+  assert server.polls['operations/a'] == 3
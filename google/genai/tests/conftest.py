@@ -18,13 +18,16 @@
 
 import datetime
 import os
+import time
 from unittest import mock
 import uuid
+import httpx
 import pytest
 
 from .. import _common
 from .. import _replay_api_client
 from .. import client as google_genai_client_module
+from .. import types
 
 
 def pytest_addoption(parser):
@@ -144,6 +147,66 @@ def mock_timestamped_unique_name():
     yield unique_name_mock
 
 
+class FakeClock:
+  """Stands in for time.monotonic, time.time and time.sleep.
+
+  The sleeps are recorded, and advance the clock instead of waiting.
+  """
+
+  def __init__(self):
+    self.now = 0.0
+    self.sleeps: list[float] = []
+
+  def monotonic(self) -> float:
+    return self.now
+
+  def time(self) -> float:
+    return self.now
+
+  def sleep(self, seconds: float) -> None:
+    self.sleeps.append(round(seconds, 3))
+    self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+  fake_clock = FakeClock()
+  monkeypatch.setattr(time, 'monotonic', fake_clock.monotonic)
+  monkeypatch.setattr(time, 'time', fake_clock.time)
+  monkeypatch.setattr(time, 'sleep', fake_clock.sleep)
+  return fake_clock
+
+
+@pytest.fixture
+def mock_transport_client():
+  """Returns a factory of clients whose requests are handled by a fake server.
+
+  The server handles the requests of the sync client with its `handle` method,
+  and those of the async client with its `handle_async` method if it has one.
+  Other keyword arguments are passed on as `HttpOptions`.
+  """
+
+  def make_client(
+      server, api_key: str = 'test-api-key', **http_options
+  ) -> google_genai_client_module.Client:
+    transport = httpx.MockTransport(server.handle)
+    async_transport = (
+        httpx.MockTransport(server.handle_async)
+        if hasattr(server, 'handle_async')
+        else transport
+    )
+    return google_genai_client_module.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={'transport': transport},
+            async_client_args={'transport': async_transport},
+            **http_options,
+        ),
+    )
+
+  return make_client
+
+
 @pytest.fixture
 def image_jpeg():
   import PIL.Image
@@ -0,0 +1,152 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests streaming file downloads into a destination."""
+
+import asyncio
+import io
+import os
+
+import httpx
+import pytest
+
+from ... import errors
+from ... import types
+
+
+_DATA = os.urandom(3 * 1024 * 1024 + 17)
+
+
+class _FakeDownloadServer:
+  """Stand-in for the file service, honoring Range requests."""
+
+  def __init__(self):
+    self.ranges: list[str] = []
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith('files/missing:download'):
+      return httpx.Response(404, json={'error': {'code': 404}})
+    assert request.url.path.endswith('files/video:download')
+    range_header = request.headers.get('range')
+    if range_header is None:
+      return httpx.Response(200, content=_DATA)
+    self.ranges.append(range_header)
+    start = int(range_header[len('bytes='):].rstrip('-'))
+    if start >= len(_DATA):
+      return httpx.Response(416)
+    return httpx.Response(206, content=_DATA[start:])
+
+
+def test_download_to_path(mock_transport_client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  video = types.Video(uri='files/video')
+
+  result = mock_transport_client(_FakeDownloadServer()).files.download(
+      file=video, destination=destination
+  )
+
+  assert result is None
+  assert destination.read_bytes() == _DATA
+  assert video.video_bytes is None
+
+
+def test_download_to_file_object(mock_transport_client):
+  destination = io.BytesIO()
+
+  mock_transport_client(_FakeDownloadServer()).files.download(
+      file='files/video', destination=destination
+  )
+
+  assert destination.getvalue() == _DATA
+
+
+def test_download_resumes_partial_file(mock_transport_client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_DATA[:1000])
+  server = _FakeDownloadServer()
+
+  mock_transport_client(server).files.download(
+      file='files/video',
+      destination=str(destination),
+      config=types.DownloadFileConfig(resume=True),
+  )
+
+  assert server.ranges == ['bytes=1000-']
+  assert destination.read_bytes() == _DATA
+
+
+def test_download_resume_of_complete_file(mock_transport_client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_DATA)
+
+  mock_transport_client(_FakeDownloadServer()).files.download(
+      file='files/video',
+      destination=destination,
+      config={'resume': True},
+  )
+
+  assert destination.read_bytes() == _DATA
+
+
+def test_download_without_resume_overwrites(mock_transport_client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(b'stale data')
+  server = _FakeDownloadServer()
+
+  mock_transport_client(server).files.download(
+      file='files/video', destination=destination
+  )
+
+  assert not server.ranges
+  assert destination.read_bytes() == _DATA
+
+
+def test_download_error(mock_transport_client):
+  with pytest.raises(errors.ClientError):
+    mock_transport_client(_FakeDownloadServer()).files.download(
+        file='files/missing', destination=io.BytesIO()
+    )
+
+
+def test_async_download_to_path(mock_transport_client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_DATA[:5])
+  server = _FakeDownloadServer()
+
+  async def run():
+    await mock_transport_client(server).aio.files.download(
+        file='files/video',
+        destination=destination,
+        config=types.DownloadFileConfig(resume=True),
+    )
+
+  asyncio.run(run())
+
+  assert server.ranges == ['bytes=5-']
+  assert destination.read_bytes() == _DATA
+
+
+def test_async_download_to_file_object(mock_transport_client):
+  destination = io.BytesIO()
+
+  async def run():
+    await mock_transport_client(_FakeDownloadServer()).aio.files.download(
+        file='files/video', destination=destination
+    )
+
+  asyncio.run(run())
+
+  assert destination.getvalue() == _DATA
@@ -0,0 +1,312 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests the resumable upload protocol against a stand-in upload server."""
+
+import asyncio
+import io
+import json
+import os
+from typing import Optional
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import files
+from ... import types
+
+
+_UPLOAD_URL = 'https://upload.test/session/1'
+_KIB = 1024
+_DATA = os.urandom(600 * _KIB)
+
+
+class _FakeUploadServer:
+  """Stand-in for the resumable upload service."""
+
+  def __init__(self, fail_after: Optional[int] = None, failures: int = 1):
+    # Number of bytes after which the connection breaks mid-chunk.
+    self.fail_after = fail_after
+    self.failures = failures
+    self.received = bytearray()
+    self.finalized = False
+    self.commands: list[str] = []
+    self.sessions = 0
+    # Upload URLs that the server rejects.
+    self.expired: set[str] = set()
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    command = request.headers['x-goog-upload-command']
+    self.commands.append(command)
+    if command == 'start':
+      self.sessions += 1
+      self.received = bytearray()
+      self.finalized = False
+      upload_url = f'https://upload.test/session/{self.sessions}'
+      return httpx.Response(
+          200, headers={'x-goog-upload-url': upload_url}, json={}
+      )
+    if str(request.url) in self.expired:
+      return httpx.Response(404, json={'error': {'code': 404}})
+    if command == 'query':
+      return self._status_response()
+
+    assert int(request.headers['x-goog-upload-offset']) == len(self.received)
+    content = request.read()
+    if (
+        self.failures
+        and self.fail_after is not None
+        and len(self.received) + len(content) > self.fail_after
+    ):
+      # Persist the beginning of the chunk, then drop the connection.
+      self.failures -= 1
+      self.received += content[: self.fail_after - len(self.received)]
+      raise httpx.ReadError('Connection reset.', request=request)
+
+    self.received += content
+    if 'finalize' in command:
+      self.finalized = True
+    return self._status_response()
+
+  def _status_response(self) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={
+            'x-goog-upload-status': 'final' if self.finalized else 'active',
+            'x-goog-upload-size-received': str(len(self.received)),
+        },
+        json={
+            'file': {
+                'name': 'files/test',
+                'sizeBytes': str(len(self.received)),
+            }
+        },
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+  monkeypatch.setattr(api_client, 'INITIAL_RETRY_DELAY', 0)
+
+
+def _config(**kwargs) -> types.UploadFileConfig:
+  return types.UploadFileConfig(
+      mime_type='application/octet-stream', chunk_size=256 * _KIB, **kwargs
+  )
+
+
+@pytest.mark.parametrize('read_ahead', [False, True])
+def test_upload_in_chunks(mock_transport_client, read_ahead):
+  server = _FakeUploadServer()
+
+  file = mock_transport_client(server).files.upload(
+      file=io.BytesIO(_DATA), config=_config(read_ahead=read_ahead)
+  )
+
+  assert file.name == 'files/test'
+  assert bytes(server.received) == _DATA
+  assert server.commands == ['start', 'upload', 'upload', 'upload, finalize']
+
+
+def test_upload_rejects_unaligned_chunk_size(mock_transport_client):
+  server = _FakeUploadServer()
+
+  with pytest.raises(ValueError):
+    mock_transport_client(server).files.upload(
+        file=io.BytesIO(_DATA),
+        config=types.UploadFileConfig(
+            mime_type='application/octet-stream', chunk_size=1000
+        ),
+    )
+
+
+def test_upload_resumes_interrupted_chunk_from_server_offset(
+    mock_transport_client,
+):
+  server = _FakeUploadServer(fail_after=300 * _KIB)
+
+  mock_transport_client(server).files.upload(
+      file=io.BytesIO(_DATA), config=_config()
+  )
+
+  assert bytes(server.received) == _DATA
+  assert server.commands == [
+      'start',
+      'upload',
+      'upload',
+      'query',
+      'upload',
+      'upload, finalize',
+  ]
+
+
+def test_upload_resumes_from_persisted_state(mock_transport_client, tmp_path):
+  state_path = str(tmp_path / 'upload_state.json')
+  server = _FakeUploadServer(fail_after=300 * _KIB, failures=3)
+  client = mock_transport_client(server)
+
+  with pytest.raises(httpx.ReadError):
+    client.files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+  with open(state_path) as f:
+    assert json.load(f)['upload_url'] == _UPLOAD_URL
+
+  server.commands.clear()
+  client.files.upload(
+      file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+  )
+
+  assert bytes(server.received) == _DATA
+  assert server.commands == ['query', 'upload', 'upload, finalize']
+  assert not os.path.exists(state_path)
+
+
+@pytest.mark.parametrize('read_ahead', [False, True])
+def test_async_upload_resumes_interrupted_chunk(
+    mock_transport_client, read_ahead
+):
+  server = _FakeUploadServer(fail_after=300 * _KIB)
+
+  async def run():
+    return await mock_transport_client(server).aio.files.upload(
+        file=io.BytesIO(_DATA), config=_config(read_ahead=read_ahead)
+    )
+
+  file = asyncio.run(run())
+
+  assert file.name == 'files/test'
+  assert bytes(server.received) == _DATA
+  assert server.commands == [
+      'start',
+      'upload',
+      'upload',
+      'query',
+      'upload',
+      'upload, finalize',
+  ]
+
+
+def test_async_upload_from_path(mock_transport_client, tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  server = _FakeUploadServer()
+
+  async def run():
+    return await mock_transport_client(server).aio.files.upload(
+        file=str(path), config=_config(read_ahead=True)
+    )
+
+  asyncio.run(run())
+
+  assert bytes(server.received) == _DATA
+
+
+def test_upload_does_not_resume_different_content(
+    mock_transport_client, tmp_path
+):
+  state_path = str(tmp_path / 'upload_state.json')
+  server = _FakeUploadServer(fail_after=300 * _KIB, failures=3)
+  client = mock_transport_client(server)
+  with pytest.raises(httpx.ReadError):
+    client.files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+
+  other_data = bytes(reversed(_DATA))
+  server.commands.clear()
+  client.files.upload(
+      file=io.BytesIO(other_data), config=_config(resume_state_path=state_path)
+  )
+
+  assert bytes(server.received) == other_data
+  assert server.commands[0] == 'start'
+
+
+def test_upload_fingerprint_of_path(tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  fingerprint = files._upload_fingerprint(str(path), len(_DATA))
+
+  assert fingerprint['path'] == str(path)
+  assert files._upload_fingerprint(io.BytesIO(_DATA), len(_DATA))[
+      'sha256'
+  ] == fingerprint['sha256']
+
+  path.write_bytes(_DATA[:-1] + b'x')
+  assert files._upload_fingerprint(str(path), len(_DATA)) != fingerprint
+
+
+def test_expired_session_is_replaced(mock_transport_client, tmp_path):
+  state_path = str(tmp_path / 'upload_state.json')
+  server = _FakeUploadServer(fail_after=300 * _KIB, failures=3)
+  client = mock_transport_client(server)
+  with pytest.raises(httpx.ReadError):
+    client.files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+
+  server.expired.add(_UPLOAD_URL)
+  server.commands.clear()
+  client.files.upload(
+      file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+  )
+
+  assert bytes(server.received) == _DATA
+  assert server.commands == [
+      'query',
+      'start',
+      'upload',
+      'upload',
+      'upload, finalize',
+  ]
+  assert not os.path.exists(state_path)
+
+
+def test_rejected_session_removes_state(mock_transport_client, tmp_path):
+  state_path = str(tmp_path / 'upload_state.json')
+  server = _FakeUploadServer()
+  server.expired.add(_UPLOAD_URL)
+
+  with pytest.raises(api_client.UploadSessionExpiredError):
+    mock_transport_client(server).files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+
+  assert server.commands == ['start', 'upload']
+  assert not os.path.exists(state_path)
+
+
+def test_async_expired_session_is_replaced(mock_transport_client, tmp_path):
+  state_path = str(tmp_path / 'upload_state.json')
+  server = _FakeUploadServer(fail_after=300 * _KIB, failures=3)
+  client = mock_transport_client(server)
+  with pytest.raises(httpx.ReadError):
+    client.files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+  server.expired.add(_UPLOAD_URL)
+
+  async def run():
+    return await client.aio.files.upload(
+        file=io.BytesIO(_DATA), config=_config(resume_state_path=state_path)
+    )
+
+  asyncio.run(run())
+
+  assert bytes(server.received) == _DATA
+  assert not os.path.exists(state_path)
@@ -0,0 +1,325 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for embed_content_bulk."""
+
+import asyncio
+import json
+import sys
+import threading
+
+import httpx
+import pytest
+
+from ... import _extra_utils
+from ... import errors
+from ... import types
+
+
+_FAST_RETRIES = types.HttpRetryOptions(initial_delay=0.01, jitter=0.01)
+
+
+class _FakeEmbeddingServer:
+  """Stand-in for batchEmbedContents, embedding each text as its number."""
+
+  def __init__(self, failures: int = 0):
+    self.batches: list[list[str]] = []
+    self.failures = failures
+    self._lock = threading.Lock()
+
+  def _texts(self, request: httpx.Request) -> list[str]:
+    body = json.loads(request.read())
+    return [r['content']['parts'][0]['text'] for r in body['requests']]
+
+  def _respond(self, texts: list[str]) -> httpx.Response:
+    with self._lock:
+      if self.failures:
+        self.failures -= 1
+        return httpx.Response(503, json={'error': {'code': 503}})
+      self.batches.append(texts)
+    return httpx.Response(
+        200,
+        json={'embeddings': [{'values': [float(text)]} for text in texts]},
+    )
+
+  def handle(self, request: httpx.Request) -> httpx.Response:
+    return self._respond(self._texts(request))
+
+  async def handle_async(self, request: httpx.Request) -> httpx.Response:
+    texts = self._texts(request)
+    # Finish the batches out of order.
+    await asyncio.sleep(0.01 * (len(self.batches) % 3))
+    return self._respond(texts)
+
+
+def _texts(count: int) -> list[str]:
+  return [str(i) for i in range(count)]
+
+
+def test_embeddings_are_yielded_in_order(mock_transport_client):
+  server = _FakeEmbeddingServer()
+
+  embeddings = list(
+      mock_transport_client(server).models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=iter(_texts(250)),
+          config={'max_concurrent_requests': 3},
+      )
+  )
+
+  assert [e.values[0] for e in embeddings] == list(range(250))
+  assert sorted(len(batch) for batch in server.batches) == [50, 100, 100]
+
+
+def test_batches_are_limited_by_size_and_characters(mock_transport_client):
+  server = _FakeEmbeddingServer()
+  texts = ['1' * 5, '2' * 5, '3' * 20, '4', '5', '6']
+
+  embeddings = list(
+      mock_transport_client(server).models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=texts,
+          config=types.EmbedContentBulkConfig(
+              batch_size=2, max_batch_characters=12, max_concurrent_requests=1
+          ),
+      )
+  )
+
+  assert len(embeddings) == len(texts)
+  assert server.batches == [
+      ['11111', '22222'],
+      ['3' * 20],
+      ['4', '5'],
+      ['6'],
+  ]
+
+
+def test_failed_batch_is_retried_alone(mock_transport_client):
+  server = _FakeEmbeddingServer(failures=1)
+
+  embeddings = list(
+      mock_transport_client(server).models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=_texts(30),
+          config={
+              'batch_size': 10,
+              'max_concurrent_requests': 1,
+              'retry_options': _FAST_RETRIES,
+          },
+      )
+  )
+
+  assert [e.values[0] for e in embeddings] == list(range(30))
+  assert server.batches == [_texts(30)[:10], _texts(30)[10:20], _texts(30)[20:]]
+
+
+def test_failed_batch_raises_after_retries(mock_transport_client):
+  server = _FakeEmbeddingServer(failures=100)
+
+  with pytest.raises(errors.ServerError):
+    list(
+        mock_transport_client(server).models.embed_content_bulk(
+            model='text-embedding-004',
+            contents=_texts(3),
+            config={'retry_options': _FAST_RETRIES},
+        )
+    )
+
+
+def test_default_options(mock_transport_client):
+  client = mock_transport_client(_FakeEmbeddingServer())
+
+  options = _extra_utils.get_embed_content_bulk_options(
+      client._api_client, None
+  )
+
+  assert options.request_config.http_options is None
+  assert options.batch_size == 100
+  assert options.max_batch_characters is None
+
+
+def test_client_retry_options_are_used_by_default(mock_transport_client):
+  server = _FakeEmbeddingServer(failures=1)
+
+  with pytest.raises(errors.ServerError):
+    list(
+        mock_transport_client(server).models.embed_content_bulk(
+            model='text-embedding-004', contents=_texts(3)
+        )
+    )
+
+  server.failures = 1
+  embeddings = list(
+      mock_transport_client(
+          server, retry_options=_FAST_RETRIES
+      ).models.embed_content_bulk(
+          model='text-embedding-004', contents=_texts(3)
+      )
+  )
+
+  assert [e.values[0] for e in embeddings] == list(range(3))
+
+
+def test_async_embeddings_are_yielded_in_order(mock_transport_client):
+  server = _FakeEmbeddingServer()
+
+  async def texts():
+    for text in _texts(95):
+      yield text
+
+  async def run():
+    client = mock_transport_client(server)
+    embeddings = await client.aio.models.embed_content_bulk(
+        model='text-embedding-004',
+        contents=texts(),
+        config={'batch_size': 10, 'max_concurrent_requests': 4},
+    )
+    return [embedding async for embedding in embeddings]
+
+  embeddings = asyncio.run(run())
+
+  assert [e.values[0] for e in embeddings] == list(range(95))
+  assert len(server.batches) == 10
+
+
+def test_async_accepts_iterable(mock_transport_client):
+  server = _FakeEmbeddingServer()
+
+  async def run():
+    client = mock_transport_client(server)
+    embeddings = await client.aio.models.embed_content_bulk(
+        model='text-embedding-004', contents=_texts(5)
+    )
+    return [embedding async for embedding in embeddings]
+
+  embeddings = asyncio.run(run())
+
+  assert [e.values[0] for e in embeddings] == list(range(5))
+
+
+def test_embed_content_numpy_output(mock_transport_client):
+  numpy = pytest.importorskip('numpy')
+  server = _FakeEmbeddingServer()
+
+  response = mock_transport_client(server).models.embed_content(
+      model='text-embedding-004',
+      contents=['1', '2'],
+      config={'output_format': 'numpy'},
+  )
+
+  first, second = response.embeddings
+  assert first.values is None
+  assert first.values_array.dtype == numpy.float32
+  assert first.values_array.tolist() == [1.0]
+  assert second.values_array.tolist() == [2.0]
+  # The embeddings share one contiguous buffer.
+  assert first.values_array.base is second.values_array.base
+
+
+def test_embed_content_array_output(mock_transport_client):
+  server = _FakeEmbeddingServer()
+
+  response = mock_transport_client(server).models.embed_content(
+      model='text-embedding-004',
+      contents=['3'],
+      config=types.EmbedContentConfig(output_format='array'),
+  )
+
+  values_array = response.embeddings[0].values_array
+  assert response.embeddings[0].values is None
+  assert values_array.typecode == 'f'
+  assert values_array.tolist() == [3.0]
+
+
+def test_embed_content_unsupported_output_format(mock_transport_client):
+  server = _FakeEmbeddingServer()
+
+  with pytest.raises(ValueError, match='output_format'):
+    mock_transport_client(server).models.embed_content(
+        model='text-embedding-004',
+        contents=['3'],
+        config={'output_format': 'tensor'},
+    )
+  assert not server.batches
+
+
+def test_embed_content_numpy_output_without_numpy(
+    mock_transport_client, monkeypatch
+):
+  server = _FakeEmbeddingServer()
+  monkeypatch.setitem(sys.modules, 'numpy', None)
+
+  with pytest.raises(ImportError, match='numpy'):
+    mock_transport_client(server).models.embed_content(
+        model='text-embedding-004',
+        contents=['3'],
+        config={'output_format': 'numpy'},
+    )
+  assert not server.batches
+
+
+def test_bulk_numpy_output(mock_transport_client):
+  numpy = pytest.importorskip('numpy')
+  server = _FakeEmbeddingServer()
+
+  embeddings = list(
+      mock_transport_client(server).models.embed_content_bulk(
+          model='text-embedding-004',
+          contents=_texts(25),
+          config={'batch_size': 10, 'output_format': 'numpy'},
+      )
+  )
+
+  assert numpy.concatenate([e.values_array for e in embeddings]).tolist() == (
+      list(range(25))
+  )
+
+
+def test_async_embed_content_numpy_output(mock_transport_client):
+  pytest.importorskip('numpy')
+  server = _FakeEmbeddingServer()
+
+  response = asyncio.run(
+      mock_transport_client(server).aio.models.embed_content(
+          model='text-embedding-004',
+          contents=['4'],
+          config={'output_format': 'numpy'},
+      )
+  )
+
+  assert response.embeddings[0].values_array.tolist() == [4.0]
+
+
+@pytest.mark.parametrize('output_format', ['numpy', 'array'])
+def test_array_output_is_json_serializable(
+    mock_transport_client, output_format
+):
+  if output_format == 'numpy':
+    pytest.importorskip('numpy')
+  server = _FakeEmbeddingServer()
+
+  response = mock_transport_client(server).models.embed_content(
+      model='text-embedding-004',
+      contents=['1', '2'],
+      config={'output_format': output_format},
+  )
+
+  json_dict = response.to_json_dict()
+  assert [e['values_array'] for e in json_dict['embeddings']] == [[1.0], [2.0]]
+  dumped = json.loads(response.model_dump_json())
+  assert dumped['embeddings'][1]['values_array'] == [2.0]
+  restored = types.EmbedContentResponse.model_validate(json_dict)
+  assert [list(e.values_array) for e in restored.embeddings] == [[1.0], [2.0]]
@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests parsing structured output across the chunks of a stream."""
+
+import asyncio
+import json
+
+import httpx
+import pydantic
+
+from ... import Client
+from ... import types
+
+
+class Recipe(pydantic.BaseModel):
+  name: str
+  ingredients: list[str]
+
+
+_PIECES = [
+    '{"name": "Pan',
+    'cakes", "ingredients": ["flour", "mi',
+    'lk"',
+    ']}',
+]
+
+
+def _sse_body(pieces: list[str]) -> bytes:
+  events = []
+  for i, piece in enumerate(pieces):
+    candidate = {'content': {'role': 'model', 'parts': [{'text': piece}]}}
+    if i == len(pieces) - 1:
+      candidate['finishReason'] = 'STOP'
+    events.append(f'data: {json.dumps({"candidates": [candidate]})}\n\n')
+  return ''.join(events).encode()
+
+
+def _client(pieces: list[str]) -> Client:
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(200, content=_sse_body(pieces))
+  )
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          client_args={'transport': transport},
+          async_client_args={'transport': transport},
+      ),
+  )
+
+
+def test_stream_parses_pydantic_schema():
+  chunks = list(
+      _client(_PIECES).models.generate_content_stream(
+          model='gemini-2.0-flash',
+          contents='A recipe please',
+          config=types.GenerateContentConfig(
+              response_mime_type='application/json', response_schema=Recipe
+          ),
+      )
+  )
+
+  assert [chunk.parsed_partial for chunk in chunks] == [
+      {'name': 'Pan'},
+      {'name': 'Pancakes', 'ingredients': ['flour', 'mi']},
+      {'name': 'Pancakes', 'ingredients': ['flour', 'milk']},
+      {'name': 'Pancakes', 'ingredients': ['flour', 'milk']},
+  ]
+  assert [chunk.parsed for chunk in chunks] == [
+      None,
+      None,
+      None,
+      Recipe(name='Pancakes', ingredients=['flour', 'milk']),
+  ]
+
+
+def test_stream_parses_json_schema():
+  chunks = list(
+      _client(_PIECES).models.generate_content_stream(
+          model='gemini-2.0-flash',
+          contents='A recipe please',
+          config={
+              'response_mime_type': 'application/json',
+              'response_json_schema': Recipe.model_json_schema(),
+          },
+      )
+  )
+
+  assert chunks[-1].parsed == {
+      'name': 'Pancakes',
+      'ingredients': ['flour', 'milk'],
+  }
+  assert all(chunk.parsed is None for chunk in chunks[:-1])
+
+
+def test_stream_without_schema():
+  chunks = list(
+      _client(['Hello', ' world']).models.generate_content_stream(
+          model='gemini-2.0-flash', contents='Hi'
+      )
+  )
+
+  assert all(chunk.parsed is None for chunk in chunks)
+  assert all(chunk.parsed_partial is None for chunk in chunks)
+
+
+def test_async_stream_parses_pydantic_schema():
+  async def run():
+    chunks = []
+    async for chunk in await _client(
+        _PIECES
+    ).aio.models.generate_content_stream(
+        model='gemini-2.0-flash',
+        contents='A recipe please',
+        config=types.GenerateContentConfig(
+            response_mime_type='application/json', response_schema=Recipe
+        ),
+    ):
+      chunks.append(chunk)
+    return chunks
+
+  chunks = asyncio.run(run())
+
+  assert chunks[0].parsed_partial == {'name': 'Pan'}
+  assert chunks[-1].parsed == Recipe(
+      name='Pancakes', ingredients=['flour', 'milk']
+  )
+  assert all(chunk.parsed is None for chunk in chunks[:-1])
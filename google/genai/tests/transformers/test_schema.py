@@ -651,3 +651,48 @@ def test_t_schema_sets_property_ordering_for_schema_type(client):
 
   transformed_schema = _transformers.t_schema(client, schema)
   assert transformed_schema.property_ordering == ['name', 'population']
+
+
+def test_t_schema_caches_schema_for_pydantic_model(client):
+  """Tests t_schema reuses the schema built for a pydantic model."""
+
+  first = _transformers.t_schema(client, CountryInfo)
+  second = _transformers.t_schema(client, CountryInfo)
+
+  assert first is second
+  assert first.property_ordering == list(country_info_fields)
+
+
+def test_t_schema_caches_schema_per_api():
+  """Tests t_schema keeps separate schemas for MLDev and Vertex."""
+
+  mldev_client = google_genai_client_module.Client(
+      vertexai=False, api_key='test-api-key'
+  )
+  vertex_client = google_genai_client_module.Client(
+      vertexai=True, project='test-project', location='test-location'
+  )
+
+  mldev_schema = _transformers.t_schema(mldev_client, list[CurrencyInfo])
+  vertex_schema = _transformers.t_schema(vertex_client, list[CurrencyInfo])
+
+  assert mldev_schema is not vertex_schema
+  assert _transformers.t_schema(vertex_client, list[CurrencyInfo]) is (
+      vertex_schema
+  )
+
+
+def test_t_schema_does_not_modify_dict(client):
+  """Tests t_schema leaves a json schema passed as a dict untouched."""
+
+  schema = CountryInfoWithCurrency.model_json_schema()
+  original = copy.deepcopy(schema)
+
+  transformed_schema = _transformers.t_schema(client, schema)
+
+  assert schema == original
+  assert transformed_schema.properties['currency'].property_ordering == [
+      'name',
+      'code',
+      'symbol',
+  ]
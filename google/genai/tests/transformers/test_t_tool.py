@@ -155,3 +155,59 @@ def test_tool(client):
       ]
   )
   assert t.t_tool(client, tool) == tool
+
+
+@pytest.mark.usefixtures('client')
+def test_function_declaration_is_cached(client, monkeypatch):
+  def test_func(arg1: str):
+    pass
+
+  first = t.t_tool(client, test_func)
+  monkeypatch.setattr(types.FunctionDeclaration, 'from_callable', pytest.fail)
+  second = t.t_tool(client, test_func)
+
+  assert (
+      first.function_declarations[0] is second.function_declarations[0]
+  )
+
+
+@pytest.mark.usefixtures('client')
+def test_method_declaration_is_cached(client):
+  class Tools:
+
+    def test_method(self, arg1: str):
+      pass
+
+  first = t.t_tool(client, Tools().test_method)
+  second = t.t_tool(client, Tools().test_method)
+
+  assert (
+      first.function_declarations[0] is second.function_declarations[0]
+  )
+  assert list(first.function_declarations[0].parameters.properties) == [
+      'arg1'
+  ]
+
+
+def test_function_declaration_cache_is_per_api():
+  def test_func(arg1: str):
+    pass
+
+  mldev_client = google_genai_client_module.Client(
+      vertexai=False, api_key='test-api-key'
+  )
+  vertex_client = google_genai_client_module.Client(
+      vertexai=True, project='test-project', location='test-location'
+  )
+
+  mldev_tool = t.t_tool(mldev_client, test_func)
+  vertex_tool = t.t_tool(vertex_client, test_func)
+
+  assert (
+      mldev_tool.function_declarations[0]
+      is not vertex_tool.function_declarations[0]
+  )
+  assert (
+      t.t_tool(vertex_client, test_func).function_declarations[0]
+      is vertex_tool.function_declarations[0]
+  )
@@ -2774,3 +2774,54 @@ def test_user_content_unsupported_type_in_list():
 def test_user_content_unsupported_role():
   with pytest.raises(TypeError):
     types.UserContent(role='model', parts=['hi'])
+
+
+class _Recipe(pydantic.BaseModel):
+  name: str
+  minutes: int
+
+
+def _structured_response(text: str) -> dict[str, object]:
+  return {
+      'candidates': [
+          {'content': {'role': 'model', 'parts': [{'text': text}]}}
+      ]
+  }
+
+
+def test_parsed_generic_response_schema_reuses_validator():
+  kwargs = {'config': {'response_schema': list[_Recipe]}}
+
+  first = types.GenerateContentResponse._from_response(
+      response=_structured_response('[{"name": "tea", "minutes": 5}]'),
+      kwargs=kwargs,
+  )
+  adapter = types._response_schema_adapters[list[_Recipe]]
+  second = types.GenerateContentResponse._from_response(
+      response=_structured_response('[{"name": "rice", "minutes": 20}]'),
+      kwargs={'config': {'response_schema': list[_Recipe]}},
+  )
+
+  assert first.parsed == [_Recipe(name='tea', minutes=5)]
+  assert second.parsed == [_Recipe(name='rice', minutes=20)]
+  assert types._response_schema_adapters[list[_Recipe]] is adapter
+
+
+def test_parsed_union_response_schema():
+  response_schema = typing.Union[_Recipe, types.Part]
+
+  response = types.GenerateContentResponse._from_response(
+      response=_structured_response('{"name": "tea", "minutes": 5}'),
+      kwargs={'config': {'response_schema': response_schema}},
+  )
+
+  assert response.parsed == _Recipe(name='tea', minutes=5)
+
+
+def test_parsed_generic_response_schema_invalid_json():
+  response = types.GenerateContentResponse._from_response(
+      response=_structured_response('[{"name": "tea",'),
+      kwargs={'config': {'response_schema': list[_Recipe]}},
+  )
+
+  assert response.parsed is None
@@ -251,7 +251,6 @@ class Tokens(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -265,7 +264,7 @@ class Tokens(_api_module.BaseModule):
       )
 
     return_value = types.AuthToken._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     self._api_client._verify_response(return_value)
     return return_value
@@ -349,7 +348,6 @@ class AsyncTokens(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -366,7 +364,7 @@ class AsyncTokens(_api_module.BaseModule):
       )
 
     return_value = types.AuthToken._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     self._api_client._verify_response(return_value)
     return return_value
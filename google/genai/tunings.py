@@ -971,7 +971,6 @@ class Tunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -985,7 +984,7 @@ class Tunings(_api_module.BaseModule):
       response_dict = _TuningJob_from_mldev(response_dict)
 
     return_value = types.TuningJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1038,7 +1037,6 @@ class Tunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
@@ -1052,7 +1050,7 @@ class Tunings(_api_module.BaseModule):
       response_dict = _ListTuningJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListTuningJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1112,7 +1110,6 @@ class Tunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1125,7 +1122,7 @@ class Tunings(_api_module.BaseModule):
       response_dict = _TuningJob_from_vertex(response_dict)
 
     return_value = types.TuningJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1185,7 +1182,6 @@ class Tunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = self._api_client.request(
@@ -1198,7 +1194,7 @@ class Tunings(_api_module.BaseModule):
       response_dict = _TuningOperation_from_mldev(response_dict)
 
     return_value = types.TuningOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1364,7 +1360,6 @@ class AsyncTunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1380,7 +1375,7 @@ class AsyncTunings(_api_module.BaseModule):
       response_dict = _TuningJob_from_mldev(response_dict)
 
     return_value = types.TuningJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1433,7 +1428,6 @@ class AsyncTunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1449,7 +1443,7 @@ class AsyncTunings(_api_module.BaseModule):
       response_dict = _ListTuningJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListTuningJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1509,7 +1503,6 @@ class AsyncTunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1522,7 +1515,7 @@ class AsyncTunings(_api_module.BaseModule):
       response_dict = _TuningJob_from_vertex(response_dict)
 
     return_value = types.TuningJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1582,7 +1575,6 @@ class AsyncTunings(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
     request_dict = _common.encode_unserializable_types(request_dict)
 
     response = await self._api_client.async_request(
@@ -1595,7 +1587,7 @@ class AsyncTunings(_api_module.BaseModule):
       response_dict = _TuningOperation_from_mldev(response_dict)
 
     return_value = types.TuningOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs=_common.response_kwargs(parameter_model)
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -90,6 +90,28 @@ T = typing.TypeVar('T', bound='GenerateContentResponse')
 
 MetricSubclass = typing.TypeVar('MetricSubclass', bound='Metric')
 
+# Validators of the generic and union response schemas, keyed on the schema,
+# built once instead of for every response and streamed chunk.
+_response_schema_adapters: dict[Any, pydantic.TypeAdapter[Any]] = {}
+_MAX_CACHED_RESPONSE_SCHEMAS = 256
+
+
+def _get_response_schema_adapter(
+    response_schema: Any,
+) -> pydantic.TypeAdapter[Any]:
+  """Returns the cached validator of the response schema."""
+  try:
+    adapter = _response_schema_adapters.get(response_schema)
+  except TypeError:
+    # Unhashable schema, for example a Literal of unhashable values.
+    return pydantic.TypeAdapter(response_schema)
+  if adapter is None:
+    adapter = pydantic.TypeAdapter(response_schema)
+    if len(_response_schema_adapters) >= _MAX_CACHED_RESPONSE_SCHEMAS:
+      _response_schema_adapters.clear()
+    _response_schema_adapters[response_schema] = adapter
+  return adapter
+
 
 class Outcome(_common.CaseInSensitiveEnum):
   """Required. Outcome of the code execution."""
@@ -1253,7 +1275,8 @@ class HttpRetryOptions(_common.BaseModel):
   )
   max_delay: Optional[float] = Field(
       default=None,
-      description="""Maximum delay between retries, in fractions of a second.""",
+      description="""Maximum delay between retries, in fractions of a second. It also
+      caps the delay the server asks for.""",
   )
   exp_base: Optional[float] = Field(
       default=None,
@@ -1267,6 +1290,13 @@ class HttpRetryOptions(_common.BaseModel):
       description="""List of HTTP status codes that should trigger a retry.
       If not specified, a default set of retryable codes may be used.""",
   )
+  total_timeout: Optional[float] = Field(
+      default=None,
+      description="""Maximum time spent on a request, including all attempts and the
+      delays between them, in fractions of a second. The timeout of each attempt
+      is cut to the time left, and no retry is made once it is exceeded, or
+      when the server asks to wait beyond it.""",
+  )
 
 
 class HttpRetryOptionsDict(TypedDict, total=False):
@@ -1280,7 +1310,8 @@ class HttpRetryOptionsDict(TypedDict, total=False):
   """Initial delay before the first retry, in fractions of a second."""
 
   max_delay: Optional[float]
-  """Maximum delay between retries, in fractions of a second."""
+  """Maximum delay between retries, in fractions of a second. It also
+      caps the delay the server asks for."""
 
   exp_base: Optional[float]
   """Multiplier by which the delay increases after each attempt."""
@@ -1292,10 +1323,214 @@ class HttpRetryOptionsDict(TypedDict, total=False):
   """List of HTTP status codes that should trigger a retry.
       If not specified, a default set of retryable codes may be used."""
 
+  total_timeout: Optional[float]
+  """Maximum time spent on a request, including all attempts and the
+      delays between them, in fractions of a second. The timeout of each attempt
+      is cut to the time left, and no retry is made once it is exceeded, or
+      when the server asks to wait beyond it."""
+
 
 HttpRetryOptionsOrDict = Union[HttpRetryOptions, HttpRetryOptionsDict]
 
 
+class HttpConnectionOptions(_common.BaseModel):
+  """Connection pool options for the HTTP clients."""
+
+  max_connections: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of concurrent connections in the pool.""",
+  )
+  max_keepalive_connections: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of idle connections kept open in the pool.""",
+  )
+  keepalive_expiry: Optional[float] = Field(
+      default=None,
+      description="""Time after which an idle connection is closed, in fractions of a second.""",
+  )
+  http2: Optional[bool] = Field(
+      default=None,
+      description="""Whether to enable HTTP/2, which multiplexes concurrent requests
+      over a single connection. Requires the `h2` package, installed with
+      `pip install google-genai[http2]`. Not supported by the aiohttp client,
+      so the async client uses httpx when it is enabled.""",
+  )
+  share_transport: Optional[bool] = Field(
+      default=None,
+      description="""Whether to share the connection pool with the other clients in the
+      process that use the same connection options. Closing a client leaves
+      the shared pool open. The async pool must only be used from one event
+      loop.""",
+  )
+
+
+class HttpConnectionOptionsDict(TypedDict, total=False):
+  """Connection pool options for the HTTP clients."""
+
+  max_connections: Optional[int]
+  """Maximum number of concurrent connections in the pool."""
+
+  max_keepalive_connections: Optional[int]
+  """Maximum number of idle connections kept open in the pool."""
+
+  keepalive_expiry: Optional[float]
+  """Time after which an idle connection is closed, in fractions of a second."""
+
+  http2: Optional[bool]
+  """Whether to enable HTTP/2, which multiplexes concurrent requests
+      over a single connection. Requires the `h2` package, installed with
+      `pip install google-genai[http2]`. Not supported by the aiohttp client,
+      so the async client uses httpx when it is enabled."""
+
+  share_transport: Optional[bool]
+  """Whether to share the connection pool with the other clients in the
+      process that use the same connection options. Closing a client leaves
+      the shared pool open. The async pool must only be used from one event
+      loop."""
+
+
+HttpConnectionOptionsOrDict = Union[
+    HttpConnectionOptions, HttpConnectionOptionsDict
+]
+
+
+class HttpRateLimitOptions(_common.BaseModel):
+  """Client-side rate limiting of the requests sent to models.
+
+  Requests are limited separately for each model and method, for example
+  `generateContent` on `gemini-2.0-flash`.
+  """
+
+  requests_per_minute: Optional[float] = Field(
+      default=None,
+      description="""Maximum number of requests per minute sent to each model and method.""",
+  )
+  burst: Optional[int] = Field(
+      default=None,
+      description="""Number of requests that can be sent at once before
+      requests_per_minute applies. Defaults to one second of requests.""",
+  )
+  max_concurrent_requests: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of requests in flight to each model and method.""",
+  )
+  methods: Optional[list[str]] = Field(
+      default=None,
+      description="""The methods to limit, such as `generateContent`, `embedContent` or
+      `countTokens`. If not specified, all model methods are limited.""",
+  )
+  adaptive: Optional[bool] = Field(
+      default=None,
+      description="""Whether to halve the rate when the API returns 429 and raise it back
+      as requests succeed. Defaults to True. Requests are paused for the delay
+      the API asks for either way.""",
+  )
+
+
+class HttpRateLimitOptionsDict(TypedDict, total=False):
+  """Client-side rate limiting of the requests sent to models.
+
+  Requests are limited separately for each model and method, for example
+  `generateContent` on `gemini-2.0-flash`.
+  """
+
+  requests_per_minute: Optional[float]
+  """Maximum number of requests per minute sent to each model and method."""
+
+  burst: Optional[int]
+  """Number of requests that can be sent at once before
+      requests_per_minute applies. Defaults to one second of requests."""
+
+  max_concurrent_requests: Optional[int]
+  """Maximum number of requests in flight to each model and method."""
+
+  methods: Optional[list[str]]
+  """The methods to limit, such as `generateContent`, `embedContent` or
+      `countTokens`. If not specified, all model methods are limited."""
+
+  adaptive: Optional[bool]
+  """Whether to halve the rate when the API returns 429 and raise it back
+      as requests succeed. Defaults to True. Requests are paused for the delay
+      the API asks for either way."""
+
+
+HttpRateLimitOptionsOrDict = Union[
+    HttpRateLimitOptions, HttpRateLimitOptionsDict
+]
+
+
+class HttpCacheOptions(_common.BaseModel):
+  """Client-side cache of the responses to deterministic model requests.
+
+  Responses are cached by the request URL, which includes the model, and
+  the request body. `generateContent` responses are only cached when the
+  request sets `temperature` to 0.
+  """
+
+  backend: Optional[str] = Field(
+      default=None,
+      description="""Where to store the responses: `memory` or `sqlite`. Defaults to
+      `memory`.""",
+  )
+  path: Optional[str] = Field(
+      default=None,
+      description="""Path of the database file of the `sqlite` backend.""",
+  )
+  ttl: Optional[float] = Field(
+      default=None,
+      description="""Time in seconds after which a cached response expires. If not
+      specified, responses do not expire.""",
+  )
+  max_entries: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of cached responses. The least recently used
+      responses are evicted first. Defaults to 1000.""",
+  )
+  max_size_bytes: Optional[int] = Field(
+      default=None,
+      description="""Maximum total size of the cached response bodies, in bytes.""",
+  )
+  methods: Optional[list[str]] = Field(
+      default=None,
+      description="""The methods to cache. Defaults to `generateContent`,
+      `embedContent`, `batchEmbedContents` and `countTokens`.""",
+  )
+
+
+class HttpCacheOptionsDict(TypedDict, total=False):
+  """Client-side cache of the responses to deterministic model requests.
+
+  Responses are cached by the request URL, which includes the model, and
+  the request body. `generateContent` responses are only cached when the
+  request sets `temperature` to 0.
+  """
+
+  backend: Optional[str]
+  """Where to store the responses: `memory` or `sqlite`. Defaults to
+      `memory`."""
+
+  path: Optional[str]
+  """Path of the database file of the `sqlite` backend."""
+
+  ttl: Optional[float]
+  """Time in seconds after which a cached response expires. If not
+      specified, responses do not expire."""
+
+  max_entries: Optional[int]
+  """Maximum number of cached responses. The least recently used
+      responses are evicted first. Defaults to 1000."""
+
+  max_size_bytes: Optional[int]
+  """Maximum total size of the cached response bodies, in bytes."""
+
+  methods: Optional[list[str]]
+  """The methods to cache. Defaults to `generateContent`,
+      `embedContent`, `batchEmbedContents` and `countTokens`."""
+
+
+HttpCacheOptionsOrDict = Union[HttpCacheOptions, HttpCacheOptionsDict]
+
+
 class HttpOptions(_common.BaseModel):
   """HTTP options to be used in each of the requests."""
 
@@ -1329,6 +1564,18 @@ class HttpOptions(_common.BaseModel):
   retry_options: Optional[HttpRetryOptions] = Field(
       default=None, description="""HTTP retry options for the request."""
   )
+  connection_options: Optional[HttpConnectionOptions] = Field(
+      default=None,
+      description="""Connection pool options for the HTTP clients.""",
+  )
+  rate_limit_options: Optional[HttpRateLimitOptions] = Field(
+      default=None,
+      description="""Client-side rate limiting of the requests sent to models.""",
+  )
+  cache_options: Optional[HttpCacheOptions] = Field(
+      default=None,
+      description="""Client-side cache of the responses to deterministic model requests.""",
+  )
 
 
 class HttpOptionsDict(TypedDict, total=False):
@@ -1361,6 +1608,15 @@ class HttpOptionsDict(TypedDict, total=False):
   retry_options: Optional[HttpRetryOptionsDict]
   """HTTP retry options for the request."""
 
+  connection_options: Optional[HttpConnectionOptionsDict]
+  """Connection pool options for the HTTP clients."""
+
+  rate_limit_options: Optional[HttpRateLimitOptionsDict]
+  """Client-side rate limiting of the requests sent to models."""
+
+  cache_options: Optional[HttpCacheOptionsDict]
+  """Client-side cache of the responses to deterministic model requests."""
+
 
 HttpOptionsOrDict = Union[HttpOptions, HttpOptionsDict]
 
@@ -3614,6 +3870,26 @@ class AutomaticFunctionCallingConfig(_common.BaseModel):
       GenerateContentResponse.automatic_function_calling_history.
       """,
   )
+  maximum_parallel_calls: Optional[int] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      maximum number of function calls from one model turn to run concurrently.
+      If not set, function calls run one by one. In asynchronous methods, if
+      set, sync functions run in threads. In synchronous methods, if set to
+      more than 1, function calls run in a thread pool of this size.
+      """,
+  )
+  function_call_timeout: Optional[float] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      timeout in seconds for each function call. A function call that times
+      out gets an error function response. Only applies to sync functions
+      when they run in threads, see `maximum_parallel_calls`.
+      In synchronous methods, the timeout runs from the start of the model
+      turn: the calls still queued then are not run, and the calls still
+      running are left to finish in the background.
+      """,
+  )
 
 
 class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
@@ -3640,6 +3916,24 @@ class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
       GenerateContentResponse.automatic_function_calling_history.
       """
 
+  maximum_parallel_calls: Optional[int]
+  """If automatic function calling is enabled,
+      maximum number of function calls from one model turn to run concurrently.
+      If not set, function calls run one by one. In asynchronous methods, if
+      set, sync functions run in threads. In synchronous methods, if set to
+      more than 1, function calls run in a thread pool of this size.
+      """
+
+  function_call_timeout: Optional[float]
+  """If automatic function calling is enabled,
+      timeout in seconds for each function call. A function call that times
+      out gets an error function response. Only applies to sync functions
+      when they run in threads, see `maximum_parallel_calls`.
+      In synchronous methods, the timeout runs from the start of the model
+      turn: the calls still queued then are not run, and the calls still
+      running are left to finish in the background.
+      """
+
 
 AutomaticFunctionCallingConfigOrDict = Union[
     AutomaticFunctionCallingConfig, AutomaticFunctionCallingConfigDict
@@ -5462,7 +5756,11 @@ class GenerateContentResponse(_common.BaseModel):
   automatic_function_calling_history: Optional[list[Content]] = None
   parsed: Optional[Union[pydantic.BaseModel, dict[Any, Any], Enum]] = Field(
       default=None,
-      description="""First candidate from the parsed response if response_schema is provided. Not available for streaming.""",
+      description="""First candidate from the parsed response if response_schema is provided. When streaming, set only on the chunk that finishes the first candidate, parsed from the text of all chunks; it is None on the other chunks, which carry the document parsed so far in parsed_partial.""",
+  )
+  parsed_partial: Optional[Any] = Field(
+      default=None,
+      description="""When streaming with a response_schema, the JSON parsed so far from the text of the first candidate across all chunks. Open strings, arrays and objects are closed, and incomplete trailing values are left out.""",
   )
 
   def _get_text(self, warn_property: str = 'text') -> Optional[str]:
@@ -5591,6 +5889,16 @@ class GenerateContentResponse(_common.BaseModel):
       response_schema = _common.get_value_by_path(
           kwargs, ['config', 'response_json_schema']
       )
+    if response_schema is not None:
+      result._set_parsed(
+          response_schema, result._get_text(warn_property='parsed')
+      )
+    return result
+
+  def _set_parsed(
+      self, response_schema: Any, result_text: Optional[str]
+  ) -> None:
+    """Sets `parsed` from the response text according to response_schema."""
     if (
         inspect.isclass(response_schema)
         and not (
@@ -5600,47 +5908,35 @@ class GenerateContentResponse(_common.BaseModel):
     ):
       # Pydantic schema.
       try:
-        result_text = result._get_text(warn_property='parsed')
         if result_text is not None:
-          result.parsed = response_schema.model_validate_json(result_text)
+          self.parsed = response_schema.model_validate_json(result_text)
       # may not be a valid json per stream response
       except pydantic.ValidationError:
         pass
       except json.decoder.JSONDecodeError:
         pass
-    elif (
-        isinstance(response_schema, EnumMeta)
-        and result._get_text(warn_property='parsed') is not None
-    ):
+    elif isinstance(response_schema, EnumMeta) and result_text is not None:
       # Enum with "application/json" returns response in double quotes.
-      result_text = result._get_text(warn_property='parsed')
       if result_text is None:
         raise ValueError('Response is empty.')
       enum_value = result_text.replace('"', '')
       try:
-        result.parsed = response_schema(enum_value)
+        self.parsed = response_schema(enum_value)
         if (
             hasattr(response_schema, '__name__')
             and response_schema.__name__ == 'PlaceholderLiteralEnum'
         ):
-          result.parsed = str(response_schema(enum_value).name)  # type: ignore
+          self.parsed = str(response_schema(enum_value).name)  # type: ignore
       except ValueError:
         pass
     elif isinstance(response_schema, builtin_types.GenericAlias) or isinstance(
         response_schema, type
     ):
-
-      class Placeholder(pydantic.BaseModel):
-        placeholder: response_schema  # type: ignore[valid-type]
-
       try:
-        result_text = result._get_text(warn_property='parsed')
         if result_text is not None:
-          parsed = {'placeholder': json.loads(result_text)}
-          placeholder = Placeholder.model_validate(parsed)
-          result.parsed = placeholder.placeholder
-      except json.decoder.JSONDecodeError:
-        pass
+          self.parsed = _get_response_schema_adapter(
+              response_schema
+          ).validate_json(result_text)
       except pydantic.ValidationError:
         pass
 
@@ -5651,9 +5947,8 @@ class GenerateContentResponse(_common.BaseModel):
       # want the result converted to. So just return json.
       # JSON schema.
       try:
-        result_text = result._get_text(warn_property='parsed')
         if result_text is not None:
-          result.parsed = json.loads(result_text)
+          self.parsed = json.loads(result_text)
       # may not be a valid json per stream response
       except json.decoder.JSONDecodeError:
         pass
@@ -5663,30 +5958,20 @@ class GenerateContentResponse(_common.BaseModel):
       for union_type in union_types:
         if issubclass(union_type, pydantic.BaseModel):
           try:
-            result_text = result._get_text(warn_property='parsed')
             if result_text is not None:
-
-              class Placeholder(pydantic.BaseModel):  # type: ignore[no-redef]
-                placeholder: response_schema  # type: ignore[valid-type]
-
-              parsed = {'placeholder': json.loads(result_text)}
-              placeholder = Placeholder.model_validate(parsed)
-              result.parsed = placeholder.placeholder
-          except json.decoder.JSONDecodeError:
-            pass
+              self.parsed = _get_response_schema_adapter(
+                  response_schema
+              ).validate_json(result_text)
           except pydantic.ValidationError:
             pass
         else:
           try:
-            result_text = result._get_text(warn_property='parsed')
             if result_text is not None:
-              result.parsed = json.loads(result_text)
+              self.parsed = json.loads(result_text)
           # may not be a valid json per stream response
           except json.decoder.JSONDecodeError:
             pass
 
-    return result
-
 
 class GenerateContentResponseDict(TypedDict, total=False):
   """Response message for PredictionService.GenerateContent."""
@@ -5757,6 +6042,14 @@ class EmbedContentConfig(_common.BaseModel):
       will lead to an INVALID_ARGUMENT error, similar to other text APIs.
       """,
   )
+  output_format: Optional[str] = Field(
+      default=None,
+      description="""Format of the embedding values. `numpy` decodes them into a float32
+      numpy array and `array` into a float32 `array.array`, both set as
+      `ContentEmbedding.values_array` instead of `values`. Defaults to
+      `list`, a list of Python floats.
+      """,
+  )
 
 
 class EmbedContentConfigDict(TypedDict, total=False):
@@ -5791,10 +6084,134 @@ class EmbedContentConfigDict(TypedDict, total=False):
       will lead to an INVALID_ARGUMENT error, similar to other text APIs.
       """
 
+  output_format: Optional[str]
+  """Format of the embedding values. `numpy` decodes them into a float32
+      numpy array and `array` into a float32 `array.array`, both set as
+      `ContentEmbedding.values_array` instead of `values`. Defaults to
+      `list`, a list of Python floats.
+      """
+
 
 EmbedContentConfigOrDict = Union[EmbedContentConfig, EmbedContentConfigDict]
 
 
+class EmbedContentBulkConfig(_common.BaseModel):
+  """Optional parameters for the embed_content_bulk method."""
+
+  http_options: Optional[HttpOptions] = Field(
+      default=None, description="""Used to override HTTP request options."""
+  )
+  task_type: Optional[str] = Field(
+      default=None,
+      description="""Type of task for which the embedding will be used.
+      """,
+  )
+  output_dimensionality: Optional[int] = Field(
+      default=None,
+      description="""Reduced dimension for the output embedding. If set,
+      excessive values in the output embedding are truncated from the end.
+      """,
+  )
+  mime_type: Optional[str] = Field(
+      default=None,
+      description="""Vertex API only. The MIME type of the input.
+      """,
+  )
+  auto_truncate: Optional[bool] = Field(
+      default=None,
+      description="""Vertex API only. Whether to silently truncate inputs longer than
+      the max sequence length.
+      """,
+  )
+  output_format: Optional[str] = Field(
+      default=None,
+      description="""Format of the embedding values. `numpy` decodes them into a float32
+      numpy array and `array` into a float32 `array.array`, both set as
+      `ContentEmbedding.values_array` instead of `values`. Defaults to
+      `list`, a list of Python floats.
+      """,
+  )
+  batch_size: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of texts sent in one request. Defaults to 100.
+      """,
+  )
+  max_batch_characters: Optional[int] = Field(
+      default=None,
+      description="""Maximum total length of the texts sent in one request. A longer text
+      is sent on its own. Defaults to 60000 on Vertex AI, which keeps requests
+      under its token limit, and to no limit on the Gemini Developer API.
+      """,
+  )
+  max_concurrent_requests: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of requests in flight at once. Defaults to 4.
+      """,
+  )
+  retry_options: Optional[HttpRetryOptions] = Field(
+      default=None,
+      description="""Retries each failed request on its own, without sending the other
+      texts again. Defaults to the retry options of the client.
+      """,
+  )
+
+
+class EmbedContentBulkConfigDict(TypedDict, total=False):
+  """Optional parameters for the embed_content_bulk method."""
+
+  http_options: Optional[HttpOptionsDict]
+  """Used to override HTTP request options."""
+
+  task_type: Optional[str]
+  """Type of task for which the embedding will be used.
+      """
+
+  output_dimensionality: Optional[int]
+  """Reduced dimension for the output embedding. If set,
+      excessive values in the output embedding are truncated from the end.
+      """
+
+  mime_type: Optional[str]
+  """Vertex API only. The MIME type of the input.
+      """
+
+  auto_truncate: Optional[bool]
+  """Vertex API only. Whether to silently truncate inputs longer than
+      the max sequence length.
+      """
+
+  output_format: Optional[str]
+  """Format of the embedding values. `numpy` decodes them into a float32
+      numpy array and `array` into a float32 `array.array`, both set as
+      `ContentEmbedding.values_array` instead of `values`. Defaults to
+      `list`, a list of Python floats.
+      """
+
+  batch_size: Optional[int]
+  """Maximum number of texts sent in one request. Defaults to 100.
+      """
+
+  max_batch_characters: Optional[int]
+  """Maximum total length of the texts sent in one request. A longer text
+      is sent on its own. Defaults to 60000 on Vertex AI, which keeps requests
+      under its token limit, and to no limit on the Gemini Developer API.
+      """
+
+  max_concurrent_requests: Optional[int]
+  """Maximum number of requests in flight at once. Defaults to 4.
+      """
+
+  retry_options: Optional[HttpRetryOptionsDict]
+  """Retries each failed request on its own, without sending the other
+      texts again. Defaults to the retry options of the client.
+      """
+
+
+EmbedContentBulkConfigOrDict = Union[
+    EmbedContentBulkConfig, EmbedContentBulkConfigDict
+]
+
+
 class _EmbedContentParameters(_common.BaseModel):
   """Parameters for the embed_content method."""
 
@@ -5884,6 +6301,19 @@ class ContentEmbedding(_common.BaseModel):
       embedding.
       """,
   )
+  values_array: Optional[Any] = Field(
+      default=None,
+      description="""The embedding as a float32 numpy array or `array.array`, set instead
+      of `values` when `output_format` is `numpy` or `array`.
+      """,
+  )
+
+  @pydantic.field_serializer('values_array', when_used='json')
+  def _serialize_values_array(
+      self, values_array: Any
+  ) -> Optional[list[float]]:
+    # numpy arrays and `array.array` are not JSON serializable.
+    return None if values_array is None else list(values_array.tolist())
 
 
 class ContentEmbeddingDict(TypedDict, total=False):
@@ -5898,6 +6328,11 @@ class ContentEmbeddingDict(TypedDict, total=False):
       embedding.
       """
 
+  values_array: Optional[Any]
+  """The embedding as a float32 numpy array or `array.array`, set instead
+      of `values` when `output_format` is `numpy` or `array`.
+      """
+
 
 ContentEmbeddingOrDict = Union[ContentEmbedding, ContentEmbeddingDict]
 
@@ -11950,6 +12385,73 @@ class GetOperationConfigDict(TypedDict, total=False):
 GetOperationConfigOrDict = Union[GetOperationConfig, GetOperationConfigDict]
 
 
+class WaitConfig(_common.BaseModel):
+  """Optional parameters for waiting on batch jobs and operations."""
+
+  http_options: Optional[HttpOptions] = Field(
+      default=None, description="""Used to override HTTP request options."""
+  )
+  initial_interval: Optional[float] = Field(
+      default=None,
+      description="""Seconds between the first polls of a job. Defaults to 5.
+      """,
+  )
+  max_interval: Optional[float] = Field(
+      default=None,
+      description="""Maximum seconds between two polls of a job. Defaults to 60.
+      """,
+  )
+  multiplier: Optional[float] = Field(
+      default=None,
+      description="""Factor by which the interval between the polls of a job grows.
+      Defaults to 1.5.
+      """,
+  )
+  timeout: Optional[float] = Field(
+      default=None,
+      description="""Seconds after which to stop waiting, raising `TimeoutError`. By
+      default, waits until every job is done.
+      """,
+  )
+  max_concurrent_requests: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of polls in flight at once. Defaults to 10.
+      """,
+  )
+
+
+class WaitConfigDict(TypedDict, total=False):
+  """Optional parameters for waiting on batch jobs and operations."""
+
+  http_options: Optional[HttpOptionsDict]
+  """Used to override HTTP request options."""
+
+  initial_interval: Optional[float]
+  """Seconds between the first polls of a job. Defaults to 5.
+      """
+
+  max_interval: Optional[float]
+  """Maximum seconds between two polls of a job. Defaults to 60.
+      """
+
+  multiplier: Optional[float]
+  """Factor by which the interval between the polls of a job grows.
+      Defaults to 1.5.
+      """
+
+  timeout: Optional[float]
+  """Seconds after which to stop waiting, raising `TimeoutError`. By
+      default, waits until every job is done.
+      """
+
+  max_concurrent_requests: Optional[int]
+  """Maximum number of polls in flight at once. Defaults to 10.
+      """
+
+
+WaitConfigOrDict = Union[WaitConfig, WaitConfigDict]
+
+
 class _GetOperationParameters(_common.BaseModel):
   """Parameters for the GET method."""
 
@@ -12243,6 +12745,18 @@ class UploadFileConfig(_common.BaseModel):
   display_name: Optional[str] = Field(
       default=None, description="""Optional display name of the file."""
   )
+  chunk_size: Optional[int] = Field(
+      default=None,
+      description="""The number of bytes sent per upload request. Must be a multiple of 256 KiB. Defaults to 8 MiB.""",
+  )
+  read_ahead: Optional[bool] = Field(
+      default=None,
+      description="""If true, the next chunk is read from the file while the current chunk is being sent.""",
+  )
+  resume_state_path: Optional[str] = Field(
+      default=None,
+      description="""Path of a local file used to persist the resumable upload session. If the file was left by an interrupted upload of the same content, the upload continues from the offset the server has received instead of starting over. If the server no longer accepts that upload session, a new one is started. The file is removed once the upload completes or the server rejects the session.""",
+  )
 
 
 class UploadFileConfigDict(TypedDict, total=False):
@@ -12260,6 +12774,15 @@ class UploadFileConfigDict(TypedDict, total=False):
   display_name: Optional[str]
   """Optional display name of the file."""
 
+  chunk_size: Optional[int]
+  """The number of bytes sent per upload request. Must be a multiple of 256 KiB. Defaults to 8 MiB."""
+
+  read_ahead: Optional[bool]
+  """If true, the next chunk is read from the file while the current chunk is being sent."""
+
+  resume_state_path: Optional[str]
+  """Path of a local file used to persist the resumable upload session. If the file was left by an interrupted upload of the same content, the upload continues from the offset the server has received instead of starting over. If the server no longer accepts that upload session, a new one is started. The file is removed once the upload completes or the server rejects the session."""
+
 
 UploadFileConfigOrDict = Union[UploadFileConfig, UploadFileConfigDict]
 
@@ -12270,6 +12793,10 @@ class DownloadFileConfig(_common.BaseModel):
   http_options: Optional[HttpOptions] = Field(
       default=None, description="""Used to override HTTP request options."""
   )
+  resume: Optional[bool] = Field(
+      default=None,
+      description="""If true and the download destination is a path to a partially downloaded file, only the remaining bytes are requested and appended to it.""",
+  )
 
 
 class DownloadFileConfigDict(TypedDict, total=False):
@@ -12278,6 +12805,9 @@ class DownloadFileConfigDict(TypedDict, total=False):
   http_options: Optional[HttpOptionsDict]
   """Used to override HTTP request options."""
 
+  resume: Optional[bool]
+  """If true and the download destination is a path to a partially downloaded file, only the remaining bytes are requested and appended to it."""
+
 
 DownloadFileConfigOrDict = Union[DownloadFileConfig, DownloadFileConfigDict]
 